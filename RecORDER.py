@@ -1,20 +1,57 @@
-import asyncio
+from __future__ import annotations
+
+import time
+moduleStartedAt = time.perf_counter()
+
+import errno
+import importlib
+import itertools
+import os
 import sys
 import threading
 import datetime as dt
-import traceback
-import json
-from urllib.request import urlopen
+import re
 from os import makedirs
 from os import path as os_path
-from re import sub
-from shutil import move as move_file
-
-import obspython as obs # type: ignore
+from bisect import bisect_left
+from collections import deque
+from typing import NamedTuple
+from functools import lru_cache
+from queue import SimpleQueue
+from shutil import copystat
+
+try:
+    import obspython as obs # type: ignore
+except ImportError:  # Running from the command line, only the bulk organizer is available
+    obs = None
+
+
+class LazyModule:
+    """Stands in for a module global until first use, then imports the module and takes its place"""
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __getattr__(self, attribute: str):
+        module = importlib.import_module(self._name)
+        globals()[self._name] = module
+        return getattr(module, attribute)
+
+
+# Only needed once files are moved or something fails, they are imported by the first event that needs them
+asyncio = LazyModule("asyncio")
+ctypes = LazyModule("ctypes")
+traceback = LazyModule("traceback")
+json = LazyModule("json")
+uuid = LazyModule("uuid")
+unicodedata = LazyModule("unicodedata")
+struct = LazyModule("struct")
+hashlib = LazyModule("hashlib")  # Only for verified copies
+sqlite3 = None  # Imported by open_media_index(), stays None in Python builds without it
 
 # Author: oxypatic! (61553947+padiix@users.noreply.github.com)
 
-# Table of capturing video source names
+# Table of capturing video source names, checked before any other Game Capture/Window Capture source
 # >>> ONLY PLACE WHERE MODIFICATIONS ARE SAFE FOR YOU TO DO! <<<
 SOURCE_NAMES = ["Game Capture", "Window Capture"]
 # >>> ONLY PLACE WHERE MODIFICATIONS ARE SAFE FOR YOU TO DO! <<<
@@ -23,6 +60,87 @@ SOURCE_NAMES = ["Game Capture", "Window Capture"]
 class CONST:
     VERSION = "2.1.1"
     PYTHON_VERSION = sys.version_info
+    MAX_CONCURRENT_MOVES = 2
+    UNLOAD_DRAIN_TIMEOUT = 5.0
+    COPY_CHUNK_SIZE = 64 * 1024 * 1024
+    USERSPACE_COPY_BUFFER_SIZE = 1024 * 1024
+    PARTIAL_FILE_SUFFIX = ".part"
+    JOURNAL_FILE_NAME = "RecORDER_journal.jsonl"
+    JOURNAL_COMPACT_THRESHOLD = 1000
+    SMALL_FILE_SIZE = 64 * 1024 * 1024
+    THROTTLED_COPY_CHUNK_SIZE = 4 * 1024 * 1024
+    DEFAULT_IO_BANDWIDTH = 100  # MB/s
+    MEDIA_PRIORITY = {"screenshot": 0, "replay": 1, "recording": 2}
+    READINESS_TIMEOUT = 15 * 60
+    MAX_RETRY_INTERVAL = 30.0
+    CAPTURE_SOURCE_IDS = ("game_capture", "window_capture")
+    RELEASES_URL = "https://api.github.com/repos/oxypatic/RecORDER/releases/latest"
+    UPDATE_CACHE_FILE_NAME = "RecORDER_update_cache.json"
+    UPDATE_CHECK_TTL = 6 * 60 * 60
+    UPDATE_CHECK_TIMEOUT = 2
+    TRACE_FILE_NAME = "RecORDER_trace_{timestamp}.jsonl"
+    STATS_FILE_NAME = "RecORDER_stats.json"
+    STATS_WRITE_INTERVAL = 60.0
+    HISTOGRAM_BOUNDS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                        1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+    LOG_RING_SIZE = 1000
+    MEDIA_SUBFOLDERS = {"replay": "Replays", "screenshot": "Screenshots"}
+    RECORDING_EXTENSIONS = (".mkv", ".mp4", ".mov", ".flv", ".ts", ".webm")
+    SCREENSHOT_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".webp", ".jxr")
+    REPLAY_FILE_PREFIX = "Replay"
+    TITLE_INDEX_FILE_NAME = "RecORDER_titles.json"
+    ORGANIZER_JOURNAL_FILE_NAME = "RecORDER_organize_journal.jsonl"
+    ORGANIZER_WORKERS = 4
+    MEDIA_INDEX_FILE_NAME = "RecORDER_media.sqlite3"
+    MEDIA_INDEX_BATCH_SIZE = 50
+    MEDIA_INDEX_FLUSH_INTERVAL = 2.0
+    MEDIA_INDEX_RECONCILE_INTERVAL = 10 * 60.0
+    DIGEST_ALGORITHM = "blake2b"
+    DIGEST_SIZE = 32
+    RETENTION_FILE_NAME = "RecORDER_retention.json"
+    RETENTION_INTERVAL = 5 * 60.0
+    RETENTION_GRACE_PERIOD = 5 * 60.0
+    SESSION_MANIFEST_SUFFIX = ".session.json"
+    BURST_WINDOW = 0.5
+    BURST_MAX_FILES = 50
+    TITLE_RULES_FILE_NAME = "RecORDER_title_rules.json"
+    TITLE_CACHE_SIZE = 256
+    MAX_TITLE_LENGTH = 100
+    RESERVED_FOLDER_NAMES = frozenset({"CON", "PRN", "AUX", "NUL", *(f"COM{i}" for i in range(1, 10)),
+                                       *(f"LPT{i}" for i in range(1, 10))})
+    LOG_DUMP_FILE_NAME = "RecORDER_last_error.log"
+    DEFAULT_RECORDING_NAME = "Manual Recording"
+    PROCESSORS_FILE_NAME = "RecORDER_processors.json"
+    PROCESSOR_WORKERS = 2
+    PROCESSOR_BACKLOG_WARNING = 256
+    PROCESSOR_TIMEOUT = 5 * 60.0
+    FEED_FILE_NAME = "RecORDER_feed.jsonl"
+    WATCHER_JOURNAL_FILE_NAME = "RecORDER_watcher_journal.jsonl"
+    FEED_POLL_INTERVAL = 1.0
+    FEED_ROTATE_SIZE = 1024 * 1024
+    FEED_ROTATE_GRACE = 0.2
+
+
+class FsyncPolicy:
+    """When data copied between volumes is flushed to disk before the source is removed"""
+    NEVER = "never"
+    FILE = "file"
+    FILE_AND_FOLDER = "file_and_folder"
+
+
+class IoPolicy:
+    """What happens to heavy moves (big files copied between drives) while the encoder is writing"""
+    IMMEDIATE = "immediate"
+    THROTTLE = "throttle"
+    DEFER = "defer"
+
+
+class LogLevel:
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+    NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
 
 
 # Version check
@@ -33,172 +151,635 @@ if CONST.PYTHON_VERSION < (3, 11):
 
 # Values supporting smooth working and fewer calls
 
-file_changed_sh_ref = None
+moveWorker = None
+moveJournal = None
+mediaIndex = None
+retentionEngine = None
+titleCache = None
+recordingSessions = None
+outputRegistry = None
+burstCoalescer = None
+folderCache = None
+sourceIndex = None
+titleRules = None
+titleRulesMtime = None
+updateChecker = None
+eventTracer = None
+scriptMetrics = None
 
 
 # Utility functions
 
-def log(message):
-    print(f"[{dt.datetime.now().isoformat(sep=' ', timespec='seconds')}] {message}")
-    
-    
-def get_latest_release_tag() -> dict | None:
-    url = "https://api.github.com/repos/oxypatic/RecORDER/releases/latest"
+class Logger:
+    """Log records are only queued by the callers, a background thread formats and prints them.
 
-    try:
-        with urlopen(url, timeout=2) as response:
-            if response.status == 200:
-                data = json.load(response)
-                return data.get('tag_name')
-    except Exception:
-        log("Failed to check updates.")
-        log(traceback.format_exc(1))
-    return None
+    Records of every level are also kept in a ring buffer, so the lines leading to an error can be dumped
+    even when debug lines are not printed. Arguments are formatted lazily with the % operator.
+    """
 
+    def __init__(self, level: int = LogLevel.INFO, ring_size: int = CONST.LOG_RING_SIZE) -> None:
+        self.level = level
+        self._ring = deque(maxlen=ring_size)
+        self._queue = SimpleQueue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def log(self, level: int, message: str, args: tuple) -> None:
+        record = (time.time(), level, message, args)
+        self._ring.append(record)
+        if level >= self.level:
+            if self._thread is None:
+                self._start()
+            self._queue.put(record)
+
+    def dump(self, path: str) -> None:
+        """Writes the records from the ring buffer to the file, in the background thread."""
+        records = list(self._ring)
+        if self._thread is None:
+            self._start()
+        self._queue.put(lambda: self._write_dump(path, records))
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Prints the queued records and stops the background thread, it's started again by the next record."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join(timeout)
 
-def check_updates(current_version: str):
-    latest_version = get_latest_release_tag()
-    if latest_version and f'{current_version}' != latest_version:
-        return True
-    return False
+    @staticmethod
+    def format_record(record: tuple) -> str:
+        created_at, level, message, args = record
+        if args:
+            try:
+                message = message % args
+            except (TypeError, ValueError):
+                message = f"{message} {args}"
+        timestamp = dt.datetime.fromtimestamp(created_at).isoformat(sep=' ', timespec='seconds')
+        if level == LogLevel.INFO:
+            return f"[{timestamp}] {message}"
+        return f"[{timestamp}] [{LogLevel.NAMES.get(level, level)}] {message}"
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="RecORDER-logger", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            try:
+                if callable(item):
+                    item()
+                else:
+                    print(self.format_record(item))
+            except Exception:
+                print(traceback.format_exc())
 
-def check_updates_callback(props, prop, *args, **kwargs):
-    version_check_prop = obs.obs_properties_get(props, "version_info")
+    def _write_dump(self, path: str, records: list) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(self.format_record(record) + "\n" for record in records)
+        print(self.format_record((time.time(), LogLevel.INFO, "Recent log lines saved to: %s", (path,))))
+
+
+logger = Logger()
+
+
+def log(message: str, *args, level: int = LogLevel.INFO) -> None:
+    logger.log(level, message, args)
+
+
+def log_exception(message: str, *args) -> None:
+    """Logs the current exception and dumps the recent log lines next to the script."""
+    logger.log(LogLevel.ERROR, message + "\n%s", args + (traceback.format_exc(),))
+    logger.dump(get_script_file_path(CONST.LOG_DUMP_FILE_NAME))
     
-    if (obs.obs_property_visible(version_check_prop)):
-        return True
     
-    if check_updates(CONST.VERSION):
-        obs.obs_property_set_visible(version_check_prop, True)
-        obs.obs_property_set_description(version_check_prop, f"Update available: {get_latest_release_tag()}.\nHead to GitHub for latest version!")
+def is_update_available(current_version: str, latest_version: str | None) -> bool:
+    return bool(latest_version) and f'{current_version}' != latest_version
+
+
+def check_updates_callback(props, prop, *args, **kwargs):
+    version_check_prop = obs.obs_properties_get(props, "version_info")
+    latest_version = updateChecker.latest_tag
+
+    if not updateChecker.is_fresh():
+        updateChecker.check_in_background()
+
+    if latest_version is None:
+        if updateChecker.is_checking():
+            description = "Checking for updates...\nPress the button again in a moment to see the result."
+        else:
+            description = "Failed to check updates."
+    elif is_update_available(CONST.VERSION, latest_version):
+        description = f"Update available: {latest_version}.\nHead to GitHub for latest version!"
     else:
-        obs.obs_property_set_visible(version_check_prop, True)
-        obs.obs_property_set_description(version_check_prop, "You have the latest version!")
+        description = "You have the latest version!"
+
+    obs.obs_property_set_visible(version_check_prop, True)
+    obs.obs_property_set_description(version_check_prop, description)
         
     return True
 
 # CLASSES
 
+class ScriptConfig(NamedTuple):
+    """Settings of the script, replaced as a whole by script_update and never modified"""
+    add_game_title_to_recording_name: bool = False
+    default_recording_name: str = CONST.DEFAULT_RECORDING_NAME
+    time_to_wait: float = 0.5
+    fsync_policy: str = FsyncPolicy.FILE
+    io_policy: str = IoPolicy.THROTTLE
+    io_bandwidth: int = CONST.DEFAULT_IO_BANDWIDTH
+    write_stats: bool = False
+    verify_copies: bool = False
+    write_session_manifest: bool = False
+
+
+class RecordingState(NamedTuple):
+    """State of the recording the events work on, each change creates a new snapshot"""
+    is_recording: bool = False
+    is_replay_active: bool = False
+    last_recording: str | None = None
+    game_title: str = CONST.DEFAULT_RECORDING_NAME
+    source_uuid: str | None = None
+    session_id: str | None = None
+
+
 class GlobalVariables:
-    """Class that holds and allows better control over the Global variables used in this script"""
+    """Class that holds and allows better control over the Global variables used in this script
+
+    Settings and recording state are immutable snapshots swapped as a whole. Readers on any thread take the
+    current snapshot without locking, move jobs keep the settings they were queued with.
+    """
 
     def __init__(self):
-        # [PROPERTIES]
-        self._add_game_title_to_recording_name = None
-        self._time_to_wait = 0.5
-
-        # [Related to RECORDING]
-        self._is_recording = False
-        self._is_replay_active = False
-        self._last_recording_path = None
-        self._source_uuid = None
-
-    def apply_config(self, add_game_title_to_recording_name: bool, default_folder_name: str):
-        self._add_game_title_to_recording_name = add_game_title_to_recording_name
-        self._default_recording_name = default_folder_name
-        self._game_title = self._default_recording_name
-        
-    # ---
+        self._config = ScriptConfig()
+        self._state = RecordingState()
+        self._lock = threading.Lock()  # Serializes the writers, so concurrent changes of the state aren't lost
 
     @property
-    def add_game_title_to_recording_name(self):
-        return self._add_game_title_to_recording_name
-    
-    @add_game_title_to_recording_name.setter
-    def add_game_title_to_recording_name(self, value: bool):
-        self._add_game_title_to_recording_name = value
-    
+    def config(self) -> ScriptConfig:
+        return self._config
+
+    @config.setter
+    def config(self, value: ScriptConfig):
+        with self._lock:
+            self._config = value
+            self._state = self._state._replace(game_title=value.default_recording_name)
+
     @property
-    def time_to_wait(self) -> float:
-        return self._time_to_wait
-    
-    @time_to_wait.setter
-    def time_to_wait(self, value: float):
-        self._time_to_wait = value
+    def state(self) -> RecordingState:
+        return self._state
+
+    def update_state(self, **changes) -> None:
+        """Replaces the state with a copy holding the changed values."""
+        with self._lock:
+            self._state = self._state._replace(**changes)
 
     # ---
 
+    @property
+    def add_game_title_to_recording_name(self) -> bool:
+        return self._config.add_game_title_to_recording_name
+
     @property
     def default_recording_name(self) -> str:
-        return self._default_recording_name
+        return self._config.default_recording_name
 
-    @default_recording_name.setter
-    def default_recording_name(self, value: str):
-        self._default_recording_name = value
-    
     @property
     def is_recording(self) -> bool:
-        return self._is_recording
+        return self._state.is_recording
     
     @is_recording.setter
     def is_recording(self, value: bool):
-        self._is_recording = value
+        self.update_state(is_recording=value)
 
     @property
     def is_replay_active(self) -> bool:
-        return self._is_replay_active
+        return self._state.is_replay_active
     
     @is_replay_active.setter
     def is_replay_active(self, value: bool):
-        self._is_replay_active = value
+        self.update_state(is_replay_active=value)
 
     @property
     def last_recording(self) -> str | None:
-        return self._last_recording_path
+        return self._state.last_recording
     
     @last_recording.setter
     def last_recording(self, value: str | None):
-        self._last_recording_path = value
+        self.update_state(last_recording=value)
     
     @property
     def game_title(self) -> str:
-        return self._game_title
+        return self._state.game_title
 
     @game_title.setter
     def game_title(self, value: str):
-        self._game_title = remove_unusable_title_characters(value)
+        self.update_state(game_title=get_folder_name(value) or self._config.default_recording_name)
 
     @property
     def source_uuid(self) -> str | None:
-        return self._source_uuid
+        return self._state.source_uuid
 
     @source_uuid.setter
     def source_uuid(self, value: str | None):
-        self._source_uuid = value
+        self.update_state(source_uuid=value)
+
+    @property
+    def session_id(self) -> str | None:
+        return self._state.session_id
+
+    @session_id.setter
+    def session_id(self, value: str | None):
+        self.update_state(session_id=value)
 
     # ---
 
-    def unload_func(self):
-        for key in list(self.__dict__.keys()):
-            if key.startswith('_'):
-                self.__dict__[key] = None
+    def reset_state(self) -> None:
+        """Forgets the recording state, the settings and snapshots already taken by moves stay valid."""
+        with self._lock:
+            self._state = RecordingState(game_title=self._config.default_recording_name)
+
+
+class TitleCharacterTable(dict):
+    """str.translate table keeping letters, digits and marks of all scripts and spaces in folder names
+
+    Everything else, including the characters reserved by file systems, is dropped. ASCII is filled in
+    up front, other characters the first time they are seen.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        for codepoint in range(128):
+            self[codepoint]  # Fill in ASCII through __missing__
+
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        if char.isspace():
+            value = " "
+        elif char.isalnum() or (codepoint >= 128 and unicodedata.category(char).startswith("M")):
+            value = codepoint
+        else:
+            value = None
+        self[codepoint] = value
+        return value
+
+
+titleCharacterTable = TitleCharacterTable()
+
+
+class TitleRules:
+    """Rules mapping window titles to the folder names of games, compiled into as few regular expressions as possible
+
+    Rules are 'exact' titles, title 'prefix'es or 'regex'es (which can refer to their groups in the name),
+    tried in the order of the rules file - the first matching one wins, letter case is ignored.
+    Consecutive rules are combined into one expression, regexes with named groups or backreferences are
+    matched on their own since combining would clash their names or shift their group numbers.
+    Folder names of the titles seen recently are remembered.
+    """
+
+    _BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+    def __init__(self, rules: list[dict] | None = None, cache_size: int = CONST.TITLE_CACHE_SIZE) -> None:
+        self._names = []
+        self._regexes = {}
+        self._matchers = []  # (expression, index of its rule or None when combined) in the order of the rules
+        alternatives = []
+        for rule in rules or []:
+            try:
+                pattern, regex = self._get_pattern(rule)
+                name = rule["name"]
+            except (re.error, KeyError, TypeError) as e:
+                log("(Titles) Skipping invalid rule %s: %s", rule, e, level=LogLevel.WARNING)
+                continue
+
+            index = len(self._names)
+            self._names.append(name)
+            if "regex" in rule and "\\" in name:
+                self._regexes[index] = regex
+            if "regex" in rule and (regex.groupindex or self._BACKREFERENCE.search(rule["regex"])):
+                self._add_combined(alternatives)
+                alternatives = []
+                self._matchers.append((regex, index))
+            else:
+                alternatives.append((index, pattern, regex))
+        self._add_combined(alternatives)
+        self.folder_name = lru_cache(maxsize=cache_size)(self._get_folder_name)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @classmethod
+    def load(cls, path: str) -> "TitleRules":
+        """Reads the rules from the JSON rules file, no rules when it doesn't exist or can't be read."""
+        if not os_path.exists(path):
+            return cls()
+        try:
+            with open(path, encoding="utf-8") as f:
+                rules = json.load(f).get("rules", [])
+        except (OSError, ValueError, AttributeError) as e:
+            log("(Titles) Failed to read %s: %s", path, e, level=LogLevel.WARNING)
+            return cls()
+
+        title_rules = cls(rules)
+        log("(Titles) Loaded %d title rule(s)", len(title_rules))
+        return title_rules
+
+    def _get_folder_name(self, title: str) -> str:
+        """Returns the folder name of the window title, empty when no usable character is left."""
+        for matcher, index in self._matchers:
+            if match := matcher.match(title):
+                if index is None:
+                    index = int(match.lastgroup[1:])
+                regex = self._regexes.get(index)
+                title = regex.match(title).expand(self._names[index]) if regex else self._names[index]
+                break
+        return remove_unusable_title_characters(title)
+
+    def _add_combined(self, alternatives: list[tuple[int, str, re.Pattern]]) -> None:
+        if not alternatives:
+            return
+        try:
+            combined = "|".join(f"(?P<r{index}>{pattern})" for index, pattern, _ in alternatives)
+            self._matchers.append((re.compile(combined, re.IGNORECASE), None))
+        except re.error:  # e.g. inline flags, valid only at the start of an expression
+            self._matchers.extend((regex, index) for index, _, regex in alternatives)
+
+    @staticmethod
+    def _get_pattern(rule: dict) -> tuple[str, re.Pattern]:
+        """Returns the pattern of the rule to combine and the rule compiled on its own, raises re.error if invalid."""
+        if "exact" in rule:
+            pattern = re.escape(rule["exact"]) + r"\Z"
+        elif "prefix" in rule:
+            pattern = re.escape(rule["prefix"])
+        else:
+            return f"(?:{rule['regex']})", re.compile(rule["regex"], re.IGNORECASE)
+        return pattern, re.compile(pattern, re.IGNORECASE)
+
+
+class TitleCache:
+    """Titles of hooked windows per capture source UUID, kept up to date by the 'hooked'/'unhooked' signals"""
+
+    def __init__(self) -> None:
+        self._titles = {}
+
+    def contains(self, source_uuid: str) -> bool:
+        return source_uuid in self._titles
+
+    def get(self, source_uuid: str) -> str | None:
+        """Returns the title of the hooked window, None when the source is not hooked or not cached."""
+        return self._titles.get(source_uuid)
+
+    def set(self, source_uuid: str, title: str | None) -> None:
+        self._titles[source_uuid] = title
+
+    def mark_unhooked(self, source_uuid: str) -> None:
+        self._titles[source_uuid] = None
+
+    def clear(self) -> None:
+        self._titles.clear()
+
+
+class FolderCache:
+    """Target folders already created by the script, repeated saves into them skip the filesystem"""
+
+    def __init__(self) -> None:
+        self._folders = set()
+
+    def ensure(self, folder: str) -> None:
+        """Creates the folder unless it was created before."""
+        if folder in self._folders:
+            return
+        makedirs(folder, exist_ok=True)
+        self._folders.add(folder)
+
+    def discard(self, folder: str) -> None:
+        """Forgets the folder, so it's created again if it was removed."""
+        self._folders.discard(folder)
+
+    def clear(self) -> None:
+        self._folders.clear()
+
+
+class RecordingSession:
+    """Recording from its start to its stop, all of its split parts go into the folder of one title"""
+
+    __slots__ = ("session_id", "started_at", "title", "parts", "targets")
+
+    def __init__(self, first_part: str) -> None:
+        self.session_id = uuid.uuid4().hex
+        self.started_at = time.time()
+        self.title = None  # Resolved when the first part is moved, then kept for the whole session
+        self.parts = [first_part]
+        self.targets = []
+
+    def to_manifest(self) -> dict:
+        return {"session_id": self.session_id, "game_title": self.title, "started_at": self.started_at,
+                "stopped_at": time.time(), "parts": self.targets}
+
+
+class SessionRegistry:
+    """Recording sessions by the paths of their parts"""
+
+    def __init__(self) -> None:
+        self._by_path = {}
+
+    def start(self, first_part: str) -> RecordingSession:
+        session = RecordingSession(first_part)
+        self._by_path[first_part] = session
+        return session
+
+    def add_part(self, session: RecordingSession, path: str) -> None:
+        session.parts.append(path)
+        self._by_path[path] = session
+
+    def get(self, path: str | None) -> RecordingSession | None:
+        return self._by_path.get(path)
+
+    def end(self, session: RecordingSession) -> None:
+        for path in session.parts:
+            self._by_path.pop(path, None)
+
+    def clear(self) -> None:
+        self._by_path.clear()
+
+
+class RecordingOutput:
+    """Output the script listens to, with the file it is writing and its recording session"""
+
+    __slots__ = ("name", "is_frontend", "signal_handler", "callbacks", "last_file", "session")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.is_frontend = False  # Files of the frontend output are followed by the frontend events instead
+        self.signal_handler = None
+        self.callbacks = {}
+        self.last_file = None
+        self.session = None
+
+
+class OutputRegistry:
+    """Recording outputs by name, the frontend one and the outputs of plugins named in the settings
+
+    Every output keeps its own last file and session, so outputs recording at the same time never mix up their parts.
+    """
+
+    def __init__(self) -> None:
+        self._outputs = {}
+        self.extra_names = ()
+
+    def get(self, name: str) -> RecordingOutput | None:
+        return self._outputs.get(name)
+
+    def get_or_add(self, name: str) -> RecordingOutput:
+        output = self._outputs.get(name)
+        if output is None:
+            output = self._outputs[name] = RecordingOutput(name)
+        return output
+
+    def connected(self) -> list[RecordingOutput]:
+        return [output for output in self._outputs.values() if output.signal_handler is not None]
+
+    def is_recording(self) -> bool:
+        """Checks if any of the other outputs is writing a file."""
+        return any(output.last_file for output in self._outputs.values() if not output.is_frontend)
+
+    def current_files(self) -> set:
+        return {output.last_file for output in self._outputs.values() if output.last_file}
+
+    def clear(self) -> None:
+        self._outputs.clear()
+
+
+class SourceIndex:
+    """Index of capture sources looked up by UUID, name or source type without enumerating scenes.
+
+    Kept up to date by the 'source_create'/'source_destroy'/'source_rename' signals. The 'activate'/'deactivate'
+    signals tell which sources are shown in the program output, including ones inside nested scenes and groups.
+    """
+
+    def __init__(self) -> None:
+        self._names = {}
+        self._types = {}
+        self._by_name = {}
+        self._by_type = {}
+        self._active = set()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, source_uuid: str, name: str, type_id: str, active: bool = False) -> None:
+        self._names[source_uuid] = name
+        self._types[source_uuid] = type_id
+        self._by_name[name] = source_uuid
+        self._by_type.setdefault(type_id, set()).add(source_uuid)
+        if active:
+            self._active.add(source_uuid)
+
+    def remove(self, source_uuid: str) -> None:
+        name = self._names.pop(source_uuid, None)
+        if self._by_name.get(name) == source_uuid:
+            del self._by_name[name]
+        self._by_type.get(self._types.pop(source_uuid, None), set()).discard(source_uuid)
+        self._active.discard(source_uuid)
+
+    def rename(self, source_uuid: str, new_name: str) -> None:
+        old_name = self._names.get(source_uuid)
+        if self._by_name.get(old_name) == source_uuid:
+            del self._by_name[old_name]
+        self._names[source_uuid] = new_name
+        self._by_name[new_name] = source_uuid
+
+    def set_active(self, source_uuid: str, active: bool) -> None:
+        if source_uuid not in self._names:
+            return
+        if active:
+            self._active.add(source_uuid)
+        else:
+            self._active.discard(source_uuid)
+
+    def contains(self, source_uuid: str) -> bool:
+        return source_uuid in self._names
+
+    def get_name(self, source_uuid: str) -> str | None:
+        return self._names.get(source_uuid)
+
+    def find_by_name(self, name: str) -> str | None:
+        return self._by_name.get(name)
+
+    def find_by_type(self, type_id: str) -> frozenset:
+        return frozenset(self._by_type.get(type_id, ()))
+
+    def uuids(self) -> list:
+        return list(self._names)
+
+    def select_capture_source(self, preferred_names: list, get_title) -> str | None:
+        """Picks the capture source to take titles from.
+
+        Args:
+            preferred_names (list): Source names checked first, in order
+            get_title (callable): Returns the cached title for a source UUID, used to prefer hooked sources
+
+        Returns:
+            str | None: UUID of an active source, or of the first preferred one when none is active
+        """
+        for name in preferred_names:
+            source_uuid = self._by_name.get(name)
+            if source_uuid in self._active:
+                return source_uuid
+
+        active = [source_uuid for source_uuid in self._active if self._types.get(source_uuid) in CONST.CAPTURE_SOURCE_IDS]
+        for source_uuid in active:
+            if get_title(source_uuid):
+                return source_uuid
+        if active:
+            return active[0]
+
+        for name in preferred_names:
+            if name in self._by_name:
+                return self._by_name[name]
+        return None
+
+    def clear(self) -> None:
+        self._names.clear()
+        self._types.clear()
+        self._by_name.clear()
+        self._by_type.clear()
+        self._active.clear()
 
 
 class MediaFile:
-    """Base class for managing media files (recordings and screenshots)"""
+    """Base class for managing media files (recordings and screenshots)
+
+    Target paths are computed once in the constructor, the getters only return them.
+    """
 
-    def __init__(self, custom_path: str | None = None, media_type: str = "recording") -> None:
+    __slots__ = ("game_title", "add_title_prefix", "media_type", "subfolder_name", "path", "dir", "filename",
+                 "old_path", "new_folder", "new_filename", "new_path")
+
+    def __init__(self, custom_path: str | None = None, media_type: str = "recording", game_title: str | None = None,
+                 add_title_prefix: bool | None = None) -> None:
         """Initialize media file with common path handling.
         
         Args:
             custom_path: Optional custom path to file
             media_type: Type of media - 'recording', 'replay', or 'screenshot'
+            game_title: Optional title of the target folder, the current game title by default
+            add_title_prefix: Optional override of the 'Add name of the game as a recording prefix' setting
         """
-        global globalVariables
-        
-        self.game_title = globalVariables.game_title
-        self.add_title_prefix = globalVariables.add_game_title_to_recording_name
+        self.game_title = globalVariables.game_title if game_title is None else game_title
+        self.add_title_prefix = (globalVariables.add_game_title_to_recording_name
+                                 if add_title_prefix is None else add_title_prefix)
         self.media_type = media_type
         
-        # Set custom subfolder name based on media type
-        if media_type == "recording":
-            self.subfolder_name = None  # No subfolder for recordings
-        elif media_type == "replay":
-            self.subfolder_name = "Replays"
-        elif media_type == "screenshot":
-            self.subfolder_name = "Screenshots"
-        else:
-            self.subfolder_name = None
+        # Set custom subfolder name based on media type, recordings have no subfolder
+        self.subfolder_name = CONST.MEDIA_SUBFOLDERS.get(media_type)
         
         # Determine file path
         if custom_path:
@@ -213,6 +794,15 @@ class MediaFile:
         # Extract directory and filename
         self.dir = os_path.dirname(self.path)
         self.filename = os_path.basename(self.path)
+
+        # Compute the paths of the move
+        self.old_path = os_path.normpath(self.path)
+        if self.subfolder_name:
+            self.new_folder = os_path.normpath(os_path.join(self.dir, self.game_title, self.subfolder_name))
+        else:
+            self.new_folder = os_path.normpath(os_path.join(self.dir, self.game_title))
+        self.new_filename = f"{self.game_title} - {self.filename}" if self.add_title_prefix else self.filename
+        self.new_path = os_path.join(self.new_folder, self.new_filename)
     
     def get_filename(self) -> str:
         """Returns the base file name.
@@ -228,10 +818,7 @@ class MediaFile:
         Returns:
             str: path to the target folder
         """
-        if self.subfolder_name:
-            return os_path.normpath(os_path.join(self.dir, self.game_title, self.subfolder_name))
-        else:
-            return os_path.normpath(os_path.join(self.dir, self.game_title))
+        return self.new_folder
     
     def get_new_filename(self) -> str:
         """Returns the new filename with optional game title prefix.
@@ -239,10 +826,7 @@ class MediaFile:
         Returns:
             str: new filename for the file
         """
-        if self.add_title_prefix:
-            return f"{self.game_title} - {self.get_filename()}"
-        else:
-            return self.get_filename()
+        return self.new_filename
     
     def get_old_path(self) -> str:
         """Returns the original file path.
@@ -250,7 +834,7 @@ class MediaFile:
         Returns:
             str: original full path of the file
         """
-        return os_path.normpath(os_path.join(self.dir, self.get_filename()))
+        return self.old_path
     
     def get_new_path(self) -> str:
         """Returns the target file path.
@@ -258,124 +842,2743 @@ class MediaFile:
         Returns:
             str: target full path for the file
         """
-        return os_path.normpath(os_path.join(self.get_new_folder(), self.get_new_filename()))
+        return self.new_path
     
     def create_new_folder(self) -> None:
         """Creates the target folder if it doesn't exist."""
-        if not os_path.exists(self.get_new_folder()):
-            makedirs(self.get_new_folder())
+        folderCache.ensure(self.new_folder)
 
 
 class Recording(MediaFile):
     """Class for handling recording files"""
 
-    def __init__(self, custom_path: str | None = None, is_replay: bool = False) -> None:
+    __slots__ = ()
+
+    def __init__(self, custom_path: str | None = None, is_replay: bool = False, game_title: str | None = None) -> None:
         """Create a recording file object.
 
         Args:
             custom_path (str): Optional path to a recording file
             is_replay (bool): Whether this is a replay buffer recording
+            game_title (str): Optional title of the target folder
         """
         media_type = "replay" if is_replay else "recording"
-        super().__init__(custom_path=custom_path, media_type=media_type)
+        super().__init__(custom_path=custom_path, media_type=media_type, game_title=game_title)
+
+
+class Screenshot(MediaFile):
+    """Class for handling screenshot files"""
+
+    __slots__ = ()
+
+    def __init__(self, custom_path: str | None = None, game_title: str | None = None) -> None:
+        """Create a screenshot file object.
+
+        Args:
+            custom_path (str): Optional path to a screenshot file
+            game_title (str): Optional title of the target folder
+        """
+        super().__init__(custom_path=custom_path, media_type="screenshot", game_title=game_title)
+
+
+class UpdateChecker:
+    """Checks the latest release tag in a background thread, sharing one result cached on disk.
+
+    Cached results younger than ttl are reused, older ones are revalidated with
+    ETag/If-Modified-Since, so an unchanged release costs a 304 response.
+    """
+
+    def __init__(self, url: str, cache_path: str, ttl: float = CONST.UPDATE_CHECK_TTL,
+                 timeout: float = CONST.UPDATE_CHECK_TIMEOUT) -> None:
+        """Create an update checker.
+
+        Args:
+            url (str): GitHub API URL of the latest release
+            cache_path (str): Path of the JSON file holding the cached result
+            ttl (float): Seconds the cached result is used without asking the server
+            timeout (float): Timeout of the HTTP request
+        """
+        self._url = url
+        self._cache_path = cache_path
+        self._ttl = ttl
+        self._timeout = timeout
+        self._thread = None
+        self._lock = threading.Lock()
+        self._cached = None  # Read from the cache file on first use
+
+    @property
+    def _cache(self) -> dict:
+        if self._cached is None:
+            self._cached = self._load_cache()
+        return self._cached
+
+    @_cache.setter
+    def _cache(self, cache: dict) -> None:
+        self._cached = cache
+
+    @property
+    def latest_tag(self) -> str | None:
+        return self._cache.get("tag_name")
+
+    def is_fresh(self) -> bool:
+        return time.time() - self._cache.get("checked_at", 0) < self._ttl
+
+    def is_checking(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def check_in_background(self) -> None:
+        """Starts a check unless one is already running."""
+        with self._lock:
+            if self.is_checking():
+                return
+            self._thread = threading.Thread(target=self._check, name="RecORDER-update-check", daemon=True)
+            self._thread.start()
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Waits for the running check to finish."""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _check(self) -> None:
+        from urllib.error import HTTPError
+        from urllib.request import Request, urlopen
+
+        headers = {"Accept": "application/vnd.github+json", "User-Agent": f"RecORDER/{CONST.VERSION}"}
+        if self._cache.get("etag"):
+            headers["If-None-Match"] = self._cache["etag"]
+        if self._cache.get("last_modified"):
+            headers["If-Modified-Since"] = self._cache["last_modified"]
+
+        cache = dict(self._cache)
+        try:
+            with urlopen(Request(self._url, headers=headers), timeout=self._timeout) as response:
+                cache["tag_name"] = json.load(response).get('tag_name')
+                cache["etag"] = response.headers.get("ETag")
+                cache["last_modified"] = response.headers.get("Last-Modified")
+        except HTTPError as e:
+            if e.code != 304:  # 304 Not Modified - cached tag is still the latest one
+                log("Failed to check updates: HTTP %s", e.code, level=LogLevel.WARNING)
+                return
+        except Exception:
+            log("Failed to check updates: %s", traceback.format_exc(1), level=LogLevel.WARNING)
+            return
+
+        cache["checked_at"] = time.time()
+        self._cache = cache
+        self._save_cache()
+
+    def _load_cache(self) -> dict:
+        try:
+            with open(self._cache_path, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def _save_cache(self) -> None:
+        temp_path = self._cache_path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self._cache, f)
+            os.replace(temp_path, self._cache_path)
+        except OSError as e:
+            log("Failed to save update check result: %s", e, level=LogLevel.WARNING)
+
+
+class Histogram:
+    """Fixed-bucket histogram of durations in seconds.
+
+    Updated without locks - under the GIL an increment can rarely be lost when two threads
+    observe at the same moment, which is fine for statistics and keeps the hot paths cheap.
+    """
+
+    def __init__(self, bounds: tuple = CONST.HISTOGRAM_BOUNDS) -> None:
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Returns the upper bound of the bucket holding the q-th quantile (max for the last bucket)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return self._bounds[index] if index < len(self._bounds) else self.max
+        return self.max
+
+    def to_dict(self) -> dict:
+        buckets = {f"<={bound}": count for bound, count in zip(self._bounds, self._counts)}
+        buckets["+Inf"] = self._counts[-1]
+        return {"count": self.count, "sum": self.total, "max": self.max,
+                "p50": self.quantile(0.5), "p95": self.quantile(0.95), "buckets": buckets}
+
+
+class MediaMetrics:
+    """Move counters of a single media type"""
+
+    def __init__(self) -> None:
+        self.moves = 0
+        self.bytes_moved = 0
+        self.retries = 0
+        self.queue_wait = Histogram()
+        self.transfer_time = Histogram()
+
+    def to_dict(self) -> dict:
+        return {"moves": self.moves, "bytes_moved": self.bytes_moved, "retries": self.retries,
+                "queue_wait": self.queue_wait.to_dict(), "transfer_time": self.transfer_time.to_dict()}
+
+
+class Metrics:
+    """Timings of the frontend handlers, get_hooked calls and moves, shown in the properties and exported to JSON"""
+
+    def __init__(self) -> None:
+        self.started_at = time.time()
+        self.handlers = {}
+        self.get_hooked = Histogram()
+        self.media = {}
+        self._written_version = None
+
+    def observe_handler(self, name: str, seconds: float) -> None:
+        histogram = self.handlers.get(name)
+        if histogram is None:
+            histogram = self.handlers.setdefault(name, Histogram())
+        histogram.observe(seconds)
+
+    def observe_move(self, media_type: str, queue_wait: float, transfer_time: float, size: int) -> None:
+        media = self._get_media(media_type)
+        media.moves += 1
+        media.bytes_moved += size
+        media.queue_wait.observe(queue_wait)
+        media.transfer_time.observe(transfer_time)
+
+    def count_retry(self, media_type: str) -> None:
+        self._get_media(media_type).retries += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "version": CONST.VERSION,
+            "started_at": self.started_at,
+            "generated_at": time.time(),
+            "queue_depth": moveWorker.queue_depth if moveWorker is not None else 0,
+            "handlers": {name: histogram.to_dict() for name, histogram in list(self.handlers.items())},
+            "get_hooked": self.get_hooked.to_dict(),
+            "media": {media_type: media.to_dict() for media_type, media in list(self.media.items())},
+        }
+
+    def summary(self) -> str:
+        """Returns a short text for the properties panel."""
+        lines = [f"Queue depth: {moveWorker.queue_depth if moveWorker is not None else 0}"]
+        for media_type, media in list(self.media.items()):
+            lines.append(f"{media_type.capitalize()}: {media.moves} moved ({media.bytes_moved / (1024 * 1024):.1f} MB), "
+                         f"{media.retries} retries, waiting p95 {media.queue_wait.quantile(0.95) * 1000:.0f} ms, "
+                         f"moving p95 {media.transfer_time.quantile(0.95) * 1000:.0f} ms")
+        for name, histogram in list(self.handlers.items()):
+            lines.append(f"{name}: {histogram.count} calls, p95 {histogram.quantile(0.95) * 1000:.2f} ms")
+        if self.get_hooked.count:
+            lines.append(f"get_hooked: {self.get_hooked.count} calls, p95 {self.get_hooked.quantile(0.95) * 1000:.2f} ms")
+        return "\n".join(lines)
+
+    def write(self, path: str) -> None:
+        """Writes the statistics as JSON, skipped when nothing was observed since the last write."""
+        version = (sum(histogram.count for histogram in list(self.handlers.values())), self.get_hooked.count,
+                   sum(media.moves + media.retries for media in list(self.media.values())))
+        if version == self._written_version:
+            return
+
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        os.replace(temp_path, path)
+        self._written_version = version
+
+    def _get_media(self, media_type: str) -> MediaMetrics:
+        media = self.media.get(media_type)
+        if media is None:
+            media = self.media.setdefault(media_type, MediaMetrics())
+        return media
+
+
+class EventTracer:
+    """Writes frontend events, file splits and hook changes with their timing into a JSON lines trace.
+
+    Records use short keys: 't' seconds since start, 'k' kind ('e' frontend event with code 'c'
+    and file 'p', 'f' split with next file 'p', 'h' hooked source 's' with title 'n', 'u' unhooked source 's').
+    Traces are replayed offline with benchmarks/replay_trace.py.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._started_at = time.monotonic()
+        self._file = open(path, "a", encoding="utf-8")
+        self._write({"t": 0, "k": "start", "v": CONST.VERSION, "wall": time.time()})
+
+    def record(self, kind: str, **fields) -> None:
+        record = {"t": round(time.monotonic() - self._started_at, 4), "k": kind}
+        record.update(fields)
+        self._write(record)
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def _write(self, record: dict) -> None:
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line)
+                self._file.flush()
+
+
+class MoveJob:
+    """Single file move waiting in the MoveWorker queue"""
+
+    __slots__ = ("job_id", "old_path", "new_path", "media_type", "game_title", "session_id", "queued_at", "attempts",
+                 "retry_deadline", "size", "is_heavy", "digest", "config")
+
+    def __init__(self, old_path: str, new_path: str, media_type: str, game_title: str, job_id: str | None = None,
+                 session_id: str | None = None) -> None:
+        """Create a move job.
+
+        Args:
+            old_path (str): Current path of the file
+            new_path (str): Target path of the file
+            media_type (str): Type of media - 'recording', 'replay', or 'screenshot'
+            game_title (str): Title the target folder was named after
+            job_id (str): Optional id of a job resumed from the journal
+            session_id (str): Optional id of the recording session the file was saved in
+        """
+        self.job_id = job_id or uuid.uuid4().hex
+        self.old_path = old_path
+        self.new_path = new_path
+        self.media_type = media_type
+        self.game_title = game_title
+        self.session_id = session_id
+        self.queued_at = time.monotonic()
+        self.attempts = 0
+        self.retry_deadline = None
+        self.size = 0
+        self.is_heavy = False
+        self.digest = None
+        self.config = None  # ScriptConfig the job was queued with
+
+
+class MoveJournal:
+    """Append-only file recording each move before it runs and once it is done, so interrupted moves can be resumed
+
+    The file is rewritten to the unfinished moves whenever the last one is done and after every
+    JOURNAL_COMPACT_THRESHOLD finished moves, so it doesn't grow for the whole session.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._file = None
+        self._lock = threading.Lock()
+        self._unfinished = {}
+        self._done_since_compaction = 0
+
+    def open(self) -> list[MoveJob]:
+        """Compacts the journal to unfinished moves and opens it for appending.
+
+        Returns:
+            list[MoveJob]: moves that were recorded but never finished, with the file still in place
+        """
+        unfinished = []
+        for record in self._read_unfinished():
+            if os_path.exists(record["old"]):
+                unfinished.append(record)
+            elif os_path.exists(record["new"]):
+                log("(Journal) Move was finished before the journal was updated: %s", record['new'])
+            else:
+                log("(Journal) File of unfinished move no longer exists: %s", record['old'])
+
+        with self._lock:
+            self._unfinished = {record["id"]: record for record in unfinished}
+            self._rewrite()
+
+        return [MoveJob(record["old"], record["new"], record["type"], record["title"], job_id=record["id"],
+                        session_id=record.get("session")) for record in unfinished]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def record_intent(self, job: MoveJob) -> None:
+        self.record_intents([job])
+
+    def record_intents(self, jobs: list[MoveJob]) -> None:
+        """Records the moves with a single write."""
+        records = [{"op": "move", "id": job.job_id, "old": job.old_path, "new": job.new_path,
+                    "type": job.media_type, "title": job.game_title, "session": job.session_id} for job in jobs]
+        with self._lock:
+            if self._file is None:
+                return
+            for record in records:
+                self._unfinished[record["id"]] = record
+            self._write(records)
+
+    def record_done(self, job: MoveJob) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            self._unfinished.pop(job.job_id, None)
+            self._done_since_compaction += 1
+            self._write([{"op": "done", "id": job.job_id}])
+            if not self._unfinished or self._done_since_compaction >= CONST.JOURNAL_COMPACT_THRESHOLD:
+                self._compact()
+
+    def _write(self, records: list[dict]) -> None:
+        self._file.write("".join(json.dumps(record) + "\n" for record in records))
+        self._file.flush()
+
+    def _compact(self) -> None:
+        self._done_since_compaction = 0
+        if self._unfinished:
+            self._file.close()
+            try:
+                self._rewrite()
+            except OSError as e:
+                log("(Journal) Failed to compact %s: %s", self._path, e, level=LogLevel.WARNING)
+                self._file = open(self._path, "a", encoding="utf-8")
+        else:  # Nothing left to resume, dropping the whole file is a single truncate
+            self._file.truncate(0)
+
+    def _rewrite(self) -> None:
+        temp_path = self._path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(record) + "\n" for record in self._unfinished.values())
+        os.replace(temp_path, self._path)
+        self._file = open(self._path, "a", encoding="utf-8")
+
+    def _read_unfinished(self) -> list[dict]:
+        if not os_path.exists(self._path):
+            return []
+
+        unfinished = {}
+        with open(self._path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Line torn by a crash while it was written
+                if record.get("op") == "move":
+                    unfinished[record["id"]] = record
+                elif record.get("op") == "done":
+                    unfinished.pop(record.get("id"), None)
+        return list(unfinished.values())
+
+
+class MediaFeed:
+    """Spool file handing the moves over to the watcher process (RecORDER.py watch) instead of running them in OBS
+
+    Records use the journal format. Every write opens the file, appends whole lines and closes it again,
+    so the watcher can rotate the file at any time without the script noticing.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def write_moves(self, jobs: list[MoveJob]) -> None:
+        self._append_all([{"op": "move", "id": job.job_id, "old": job.old_path, "new": job.new_path,
+                           "type": job.media_type, "title": job.game_title, "session": job.session_id}
+                          for job in jobs])
+
+    def write_state(self, is_recording: bool, is_replay_active: bool) -> None:
+        """Tells the watcher whether the encoder is writing, so it follows the I/O policy."""
+        self._append_all([{"op": "state", "recording": is_recording, "replay": is_replay_active}])
+
+    def _append_all(self, records: list[dict]) -> None:
+        data = "".join(json.dumps(record) + "\n" for record in records)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(data)
+
+
+class MediaIndex:
+    """SQLite index of the files moved by the script, for queries without walking the folders
+
+    Rows are buffered and written in batches, so a burst of screenshots costs a single transaction.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS media (
+            path TEXT PRIMARY KEY,
+            folder TEXT NOT NULL,
+            original_path TEXT,
+            game_title TEXT NOT NULL,
+            media_type TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            modified_at REAL,
+            moved_at REAL,
+            session_id TEXT,
+            digest TEXT
+        );
+        CREATE INDEX IF NOT EXISTS media_by_title ON media (game_title, media_type, modified_at);
+        CREATE INDEX IF NOT EXISTS media_by_folder ON media (folder);
+        CREATE INDEX IF NOT EXISTS media_by_session ON media (session_id);
+        CREATE TABLE IF NOT EXISTS folders (
+            folder TEXT PRIMARY KEY,
+            mtime_ns INTEGER
+        );
+    """
+    COLUMNS = ("path", "folder", "original_path", "game_title", "media_type", "size", "modified_at", "moved_at",
+               "session_id", "digest")
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._db = None
+        self._db_lock = threading.Lock()
+        self._pending = []
+        self._pending_lock = threading.Lock()
+
+    def open(self) -> None:
+        db = sqlite3.connect(self._path, check_same_thread=False)
+        db.row_factory = sqlite3.Row
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(self.SCHEMA)
+        columns = {row["name"] for row in db.execute("PRAGMA table_info(media)")}
+        if "digest" not in columns:  # Index created before digests were stored
+            db.execute("ALTER TABLE media ADD COLUMN digest TEXT")
+        self._db = db
+
+    def close(self) -> None:
+        self.flush()
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def add(self, job: MoveJob) -> bool:
+        """Buffers a finished move, safe to call from any thread.
+
+        Returns:
+            bool: True when the buffer is full and should be flushed
+        """
+        with self._pending_lock:
+            self._pending.append((job.new_path, job.old_path, job.game_title, job.media_type, job.size,
+                                  time.time(), job.session_id, job.digest))
+            return len(self._pending) >= CONST.MEDIA_INDEX_BATCH_SIZE
+
+    def flush(self) -> None:
+        """Writes the buffered moves in a single transaction."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        rows = []
+        for path, original_path, game_title, media_type, size, moved_at, session_id, digest in pending:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # Source was gone before the move, or the file was removed since
+            size, modified_at = stat.st_size, stat.st_mtime
+            rows.append((path, os_path.dirname(path), original_path, game_title, media_type, size, modified_at,
+                         moved_at, session_id, digest))
+
+        with self._db_lock:
+            if self._db is None:
+                return
+            with self._db:
+                self._db.executemany(f"INSERT OR REPLACE INTO media ({', '.join(self.COLUMNS)}) "
+                                     f"VALUES ({', '.join('?' * len(self.COLUMNS))})", rows)
+                # The script changed these folders itself, they are scanned on the next reconcile
+                self._db.executemany("INSERT OR REPLACE INTO folders (folder, mtime_ns) VALUES (?, NULL)",
+                                     {(row[1],) for row in rows})
+
+    def query(self, game_title: str | None = None, media_type: str | None = None, since: float | None = None,
+              until: float | None = None, session_id: str | None = None, limit: int | None = None) -> list[dict]:
+        """Returns the indexed files matching all given filters, newest first.
+
+        Args:
+            game_title (str): Title of the game folder
+            media_type (str): 'recording', 'replay', or 'screenshot'
+            since (float): Oldest modification time as a UNIX timestamp
+            until (float): Newest modification time as a UNIX timestamp
+            session_id (str): Id of the recording session the files were saved in
+            limit (int): Maximum number of files
+
+        Returns:
+            list[dict]: rows with the columns of the index
+        """
+        self.flush()
+
+        conditions = []
+        params = []
+        for condition, value in (("game_title = ?", game_title), ("media_type = ?", media_type),
+                                 ("modified_at >= ?", since), ("modified_at <= ?", until),
+                                 ("session_id = ?", session_id)):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+
+        sql = "SELECT * FROM media"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY modified_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._db_lock:
+            if self._db is None:
+                return []
+            return [dict(row) for row in self._db.execute(sql, params)]
+
+    def reconcile(self) -> tuple[int, int]:
+        """Brings the index in line with the disk, rescanning only the folders whose mtime changed.
+
+        Files removed by the user are dropped, media files put into the game folders by hand are added.
+
+        Returns:
+            tuple[int, int]: number of added and removed rows
+        """
+        self.flush()
+        with self._db_lock:
+            if self._db is None:
+                return 0, 0
+            folders = self._db.execute("SELECT folder, mtime_ns FROM folders").fetchall()
+
+        added = removed = 0
+        for folder, known_mtime_ns in folders:
+            try:
+                mtime_ns = os.stat(folder).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            if mtime_ns is not None and mtime_ns == known_mtime_ns:
+                continue
+
+            files = {}
+            if mtime_ns is not None:
+                try:
+                    with os.scandir(folder) as entries:
+                        for entry in entries:
+                            if entry.is_file(follow_symlinks=False) and get_media_type(entry.name) is not None:
+                                files[entry.path] = entry
+                except OSError as e:
+                    log("(Index) Failed to scan %s: %s", folder, e, level=LogLevel.WARNING)
+                    continue
+
+            with self._db_lock:
+                if self._db is None:
+                    break
+                with self._db:
+                    indexed = {row[0] for row in self._db.execute("SELECT path FROM media WHERE folder = ?", (folder,))}
+                    missing = indexed - files.keys()
+                    self._db.executemany("DELETE FROM media WHERE path = ?", ((path,) for path in missing))
+                    new_rows = [self._row_from_entry(files[path]) for path in files.keys() - indexed]
+                    self._db.executemany(f"INSERT OR REPLACE INTO media ({', '.join(self.COLUMNS)}) "
+                                         f"VALUES ({', '.join('?' * len(self.COLUMNS))})", new_rows)
+                    if mtime_ns is None:
+                        self._db.execute("DELETE FROM folders WHERE folder = ?", (folder,))
+                    else:
+                        self._db.execute("UPDATE folders SET mtime_ns = ? WHERE folder = ?", (mtime_ns, folder))
+            added += len(new_rows)
+            removed += len(missing)
+
+        if added or removed:
+            log("(Index) Reconciled with the disk: %d added, %d removed", added, removed)
+        return added, removed
+
+    def find_over_limit(self, limit: "RetentionLimit", now: float) -> list[dict]:
+        """Returns the files in the scope of the limit that exceed it, oldest first.
+
+        Sizes and counts come from the index, so no folder is scanned.
+        """
+        self.flush()
+
+        conditions = []
+        params = []
+        for condition, value in (("game_title = ?", limit.game_title), ("media_type = ?", limit.media_type)):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+        scope = " WHERE " + " AND ".join(conditions) if conditions else ""
+
+        exceeded = []
+        for condition, value in (("total_size > ?", limit.max_bytes), ("position > ?", limit.max_count),
+                                 ("modified_at < ?", None if limit.max_age is None else now - limit.max_age)):
+            if value is not None:
+                exceeded.append(condition)
+                params.append(value)
+        if not exceeded:
+            return []
+
+        # Running totals over the files from the newest one, everything past a limit is evicted
+        sql = (f"SELECT path, game_title, media_type, size, modified_at FROM ("
+               f"SELECT *, SUM(size) OVER newest AS total_size, ROW_NUMBER() OVER newest AS position "
+               f"FROM media{scope} WINDOW newest AS (ORDER BY modified_at DESC, path)) "
+               f"WHERE {' OR '.join(exceeded)} ORDER BY modified_at")
+
+        with self._db_lock:
+            if self._db is None:
+                return []
+            return [dict(row) for row in self._db.execute(sql, params)]
+
+    def remove(self, paths: list[str]) -> None:
+        with self._db_lock:
+            if self._db is None:
+                return
+            with self._db:
+                self._db.executemany("DELETE FROM media WHERE path = ?", ((path,) for path in paths))
+
+    def audit(self) -> list[str]:
+        """Hashes the indexed files again and compares them with the digests stored when they were copied.
+
+        Reads every verified file in full, meant to be run on demand.
+
+        Returns:
+            list[str]: paths of files that are missing or whose content changed
+        """
+        with self._db_lock:
+            if self._db is None:
+                return []
+            rows = self._db.execute("SELECT path, digest FROM media WHERE digest IS NOT NULL").fetchall()
+
+        damaged = []
+        for path, digest in rows:
+            algorithm = digest.partition(":")[0]
+            if algorithm != CONST.DIGEST_ALGORITHM:
+                continue  # Digest of an algorithm this version doesn't compute
+            try:
+                if hash_file(path) != digest:
+                    damaged.append(path)
+            except OSError:
+                damaged.append(path)
+        return damaged
+
+    @staticmethod
+    def _row_from_entry(entry: os.DirEntry) -> tuple:
+        folder = os_path.dirname(entry.path)
+        title_folder = os_path.dirname(folder) if os_path.basename(folder) in CONST.MEDIA_SUBFOLDERS.values() else folder
+        stat = entry.stat(follow_symlinks=False)
+        return (entry.path, folder, None, os_path.basename(title_folder), get_media_type(entry.name), stat.st_size,
+                stat.st_mtime, None, None, None)
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting how many bytes per second can be copied"""
+
+    def __init__(self, rate: float) -> None:
+        """Create a token bucket.
+
+        Args:
+            rate (float): Allowed bytes per second, also the size of the bucket
+        """
+        self.rate = rate
+        self._tokens = rate
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, amount: int) -> None:
+        """Takes amount tokens from the bucket, sleeping the calling thread while it is in debt."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= amount
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0
+
+        if delay:
+            time.sleep(delay)
+
+
+class MoveWorker:
+    """Long-lived background worker owning a single event loop and the queues of move jobs.
+
+    Light jobs (renames and small files) have their own lane, so a screenshot never waits
+    behind a multi-GB copy. Heavy jobs follow the I/O policy while the encoder is writing.
+    """
+
+    def __init__(self, journal: MoveJournal | None = None, index: MediaIndex | None = None,
+                 max_concurrent_moves: int = CONST.MAX_CONCURRENT_MOVES) -> None:
+        self._journal = journal
+        self._index = index
+        self._max_concurrent_moves = max_concurrent_moves
+        self._loop = None
+        self._light_queue = None
+        self._heavy_queue = None
+        self._deferred = []
+        self._thread = None
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self._sequence = itertools.count()
+        self._bucket = TokenBucket(CONST.DEFAULT_IO_BANDWIDTH * 1024 * 1024)
+        self._periodic = []
+        self._before_start = []
+        self._delayed = []  # (deadline, callback, args) of call_later() before the worker ran
+        self._delayed_lock = threading.Lock()
+        self._start_lock = threading.RLock()  # Callbacks run before the start can register periodic ones
+        self._starter = None
+        self.feed = None  # MediaFeed of the watcher process running the moves instead of this worker
+        self.processing = None  # PostProcessing running the processors on moved files
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs queued, deferred or currently being moved."""
+        return self._pending
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Starts the worker thread and waits until its event loop accepts jobs.
+
+        Called by the first job or callback, so the script loads without the thread and asyncio.
+        """
+        resumed = []
+        with self._start_lock:
+            if self.is_running():
+                return
+
+            started_at = time.perf_counter()
+            callbacks, self._before_start = self._before_start, []
+            for callback in callbacks:
+                try:
+                    resumed += callback() or []
+                except Exception:
+                    log_exception("(Mover) Preparing the worker failed")
+            loop_ready = threading.Event()
+            self._loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=self._run, args=(loop_ready,), name="RecORDER-mover", daemon=True)
+            thread.start()
+            loop_ready.wait()
+            # Running only from here on, jobs submitted before would find no queues
+            with self._delayed_lock:
+                self._thread = thread
+                delayed, self._delayed = self._delayed, []
+            for deadline, callback, args in delayed:
+                self._loop.call_soon_threadsafe(self._loop.call_later, max(0.0, deadline - time.monotonic()),
+                                                callback, *args)
+        log("(Mover) Started with %d concurrent heavy move(s) in %.1f ms.", self._max_concurrent_moves,
+            (time.perf_counter() - started_at) * 1000)
+        if resumed:
+            self.submit_batch(resumed, resumed=True)
+
+    def run_before_start(self, callback) -> None:
+        """Calls callback once, when the worker starts and before it accepts jobs.
+
+        The callback can open what the worker needs and attach() it, it returns the jobs to resume (or None),
+        queued as soon as the worker runs.
+        """
+        with self._start_lock:
+            self._before_start.append(callback)
+
+    def attach(self, journal: MoveJournal | None, index: MediaIndex | None) -> None:
+        """Sets the journal recording the moves and the index of moved files."""
+        self._journal = journal
+        self._index = index
+
+    def start_in_background(self) -> None:
+        """Starts the worker from a short-lived thread, so the event expecting moves doesn't wait for asyncio to load."""
+        if self.is_running() or (self._starter is not None and self._starter.is_alive()):
+            return
+        self._starter = threading.Thread(target=self.start, name="RecORDER-mover-start", daemon=True)
+        self._starter.start()
+
+    def submit(self, job: MoveJob, resumed: bool = False) -> None:
+        """Queues the job, safe to call from any thread.
+
+        Args:
+            job (MoveJob): Move to run
+            resumed (bool): Whether the job comes from the journal and is already recorded in it
+        """
+        self.submit_batch([job], resumed)
+
+    def submit_batch(self, jobs: list[MoveJob], resumed: bool = False) -> None:
+        """Queues the jobs with a single journal write and wake-up of the worker, safe to call from any thread.
+
+        With a feed set, the jobs are handed over to the watcher process instead.
+        """
+        feed = self.feed
+        if feed is not None:
+            feed.write_moves(jobs)
+            log("(Mover) Handed %d job(s) over to the watcher: %s", len(jobs), feed.path, level=LogLevel.DEBUG)
+            return
+
+        if not self.is_running():
+            log("(Mover) Worker is not running, starting it...", level=LogLevel.DEBUG)
+            self.start()
+
+        if self._journal is not None and not resumed:
+            self._journal.record_intents(jobs)
+
+        config = globalVariables.config
+        items = []
+        for job in jobs:
+            if job.config is None:
+                job.config = config
+            job.size = get_file_size(job.old_path)
+            job.is_heavy = is_heavy_move(job.old_path, job.new_path, job.size)
+            queue = self._heavy_queue if job.is_heavy else self._light_queue
+            priority = (CONST.MEDIA_PRIORITY.get(job.media_type, len(CONST.MEDIA_PRIORITY)), next(self._sequence))
+            items.append((queue, (priority, job)))
+
+        with self._pending_lock:
+            self._pending += len(items)
+        self._loop.call_soon_threadsafe(self._put_all, items)
+        for queue, (priority, job) in items:
+            log("(Mover) Queued %s %s: %s (queue depth: %d)", "heavy" if job.is_heavy else "light", job.media_type,
+                job.old_path, self._pending, level=LogLevel.DEBUG)
+
+    @staticmethod
+    def _put_all(items: list) -> None:
+        for queue, item in items:
+            queue.put_nowait(item)
+
+    def call_later(self, delay: float, callback, *args) -> None:
+        """Calls callback in the worker's event loop after delay seconds, safe to call from any thread.
+
+        Never waits for the worker to start: the call is kept until it runs, the delay counting from now.
+        """
+        with self._delayed_lock:
+            is_running = self.is_running()
+            if not is_running:
+                self._delayed.append((time.monotonic() + delay, callback, args))
+        if not is_running:
+            self.start_in_background()
+            return
+        self._loop.call_soon_threadsafe(self._loop.call_later, delay, callback, *args)
+
+    def run_periodically(self, callback, interval: float) -> None:
+        """Calls callback every interval seconds in a thread of the worker once it runs, safe to call from any thread."""
+        with self._start_lock:
+            self._periodic.append((callback, interval))
+            if not self.is_running():
+                return  # Scheduled when the worker starts
+        asyncio.run_coroutine_threadsafe(self._run_periodically(callback, interval), self._loop)
+
+    def run_in_background(self, callback) -> None:
+        """Calls callback once in a thread of the worker, safe to call from any thread."""
+        if not self.is_running():
+            log("(Mover) Worker is not running, starting it...", level=LogLevel.DEBUG)
+            self.start()
+        asyncio.run_coroutine_threadsafe(self._run_callback(callback), self._loop)
+
+    async def _run_periodically(self, callback, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self._run_callback(callback)
+
+    async def _run_callback(self, callback) -> None:
+        try:
+            await asyncio.to_thread(callback)
+        except Exception:
+            log_exception("(Mover) Background task failed")
+
+    def release_deferred(self) -> None:
+        """Queues the deferred jobs again once the encoder stopped writing, safe to call from any thread."""
+        if self.is_running():
+            self._loop.call_soon_threadsafe(self._release_deferred)
+
+    def stop(self, timeout: float = CONST.UNLOAD_DRAIN_TIMEOUT) -> None:
+        """Waits for queued jobs to finish (up to timeout) and stops the worker thread.
+
+        Deferred jobs stay in the journal and are resumed on next load.
+        """
+        starter = self._starter
+        if starter is not None:
+            starter.join(timeout)  # Started in the background, stop it once it runs
+        if not self.is_running():
+            return
+
+        drained = asyncio.run_coroutine_threadsafe(self._join_queues(), self._loop)
+        try:
+            drained.result(timeout)
+        except Exception:
+            drained.cancel()
+            log("(Mover) Stopped before the queue was drained.", level=LogLevel.WARNING)
+
+        if self._pending:
+            log("(Mover) %d job(s) left unfinished.", self._pending, level=LogLevel.WARNING)
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._thread = None
+        log("(Mover) Stopped.")
+
+    def _run(self, loop_ready: threading.Event) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._light_queue = asyncio.PriorityQueue()
+        self._heavy_queue = asyncio.PriorityQueue()
+        self._loop.create_task(self._consume(self._light_queue))
+        for _ in range(self._max_concurrent_moves):
+            self._loop.create_task(self._consume(self._heavy_queue))
+        for callback, interval in self._periodic:
+            self._loop.create_task(self._run_periodically(callback, interval))
+        loop_ready.set()
+
+        try:
+            self._loop.run_forever()
+        finally:
+            # Consumers and jobs waiting for a retry, unfinished jobs stay in the journal
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self._loop.close()
+
+    async def _join_queues(self) -> None:
+        await self._light_queue.join()
+        await self._heavy_queue.join()
+
+    def _release_deferred(self) -> None:
+        if not self._deferred or is_encoder_busy():
+            return
+
+        log("(Mover) Encoder stopped writing, releasing %d deferred job(s)...", len(self._deferred))
+        for item in self._deferred:
+            self._heavy_queue.put_nowait(item)
+        self._deferred.clear()
+
+    def _throttle(self, amount: int) -> None:
+        # Called from the copying thread before every chunk, so the limit follows recording start/stop
+        if is_encoder_busy():
+            self._bucket.consume(amount)
+
+    async def _consume(self, queue: asyncio.PriorityQueue) -> None:
+        while True:
+            item = await queue.get()
+            priority, job = item
+            throttle = None
+
+            if job.is_heavy and is_encoder_busy():
+                io_policy = job.config.io_policy
+                if io_policy == IoPolicy.DEFER:
+                    log("(Mover) Encoder is writing, deferring %s until it stops: %s", job.media_type, job.old_path)
+                    self._deferred.append(item)
+                    queue.task_done()
+                    continue
+                if io_policy == IoPolicy.THROTTLE:
+                    self._bucket.rate = job.config.io_bandwidth * 1024 * 1024
+                    throttle = self._throttle
+
+            started_at = time.monotonic()
+            moved = False
+            try:
+                moved = await remember_and_move(job, throttle)
+            except Exception:
+                log_exception("(Mover) Unexpected error while moving %s", job.old_path)
+            finally:
+                queue.task_done()
+
+            finished_at = time.monotonic()
+            if moved:
+                if self._journal is not None:
+                    self._journal.record_done(job)
+                if self._index is not None and self._index.add(job):
+                    await asyncio.to_thread(self._index.flush)
+                if self.processing is not None:
+                    self.processing.schedule(job)
+            elif self._schedule_retry(item, queue):
+                continue
+            else:
+                log("(Mover) Giving up on %s after %d attempts, "
+                    "it stays in the journal and will be retried the next time the script loads.", job.old_path,
+                    job.attempts, level=LogLevel.WARNING)
+
+            with self._pending_lock:
+                self._pending -= 1
+            if moved and scriptMetrics is not None:
+                scriptMetrics.observe_move(job.media_type, started_at - job.queued_at, finished_at - started_at, job.size)
+            log("(Mover) %s job took %.3fs after waiting %.3fs in queue (queue depth: %d)", job.media_type,
+                finished_at - started_at, started_at - job.queued_at, self._pending, level=LogLevel.DEBUG)
+
+    def _schedule_retry(self, item: tuple, queue: asyncio.PriorityQueue) -> bool:
+        priority, job = item
+        job.attempts += 1
+        if scriptMetrics is not None:
+            scriptMetrics.count_retry(job.media_type)
+        if job.retry_deadline is None:
+            job.retry_deadline = time.monotonic() + CONST.READINESS_TIMEOUT
+        if time.monotonic() >= job.retry_deadline:
+            return False
+
+        log("(Mover) Waiting for %s to be released before retrying (attempt %d)...", job.old_path, job.attempts)
+        self._loop.create_task(self._retry_when_released(item, queue))
+        return True
+
+    async def _retry_when_released(self, item: tuple, queue: asyncio.PriorityQueue) -> None:
+        priority, job = item
+        poll_interval = job.config.time_to_wait
+        await wait_until_released(job.old_path, poll_interval, job.retry_deadline)
+        if job.attempts > 1:
+            # The file looked released but the move still failed, back off before trying again
+            await asyncio.sleep(min(poll_interval * 2 ** (job.attempts - 2), CONST.MAX_RETRY_INTERVAL))
+        queue.put_nowait(item)
+
+
+class Burst:
+    """Saves of one media type arriving close to each other, moved into the folder of one title"""
+
+    __slots__ = ("media_type", "title", "add_title_prefix", "session_id", "paths")
+
+    def __init__(self, media_type: str, title: str, add_title_prefix: bool, session_id: str | None) -> None:
+        self.media_type = media_type
+        self.title = title
+        self.add_title_prefix = add_title_prefix
+        self.session_id = session_id
+        self.paths = []
+
+
+class BurstCoalescer:
+    """Groups saves arriving within a short window from the first one and submits them to the MoveWorker as one batch
+
+    The title is resolved once per burst, so spamming the replay or screenshot hotkey doesn't call
+    the 'get_hooked' procedure for every press. Every saved file is still moved.
+    """
+
+    def __init__(self, worker: MoveWorker, window: float = CONST.BURST_WINDOW,
+                 max_files: int = CONST.BURST_MAX_FILES) -> None:
+        self._worker = worker
+        self._window = window
+        self._max_files = max_files
+        self._bursts = {}
+        self._lock = threading.Lock()
+
+    def add(self, media_type: str, path: str, resolve_title) -> None:
+        """Adds the saved file to the burst of its media type, starting a new burst if there's none.
+
+        Args:
+            media_type (str): Type of media - 'recording', 'replay', or 'screenshot'
+            path (str): Path of the saved file
+            resolve_title (callable): Returns the game title, only called when a burst starts
+        """
+        with self._lock:
+            is_new_burst = media_type not in self._bursts
+        if is_new_burst:
+            title = resolve_title()
+            new_burst = Burst(media_type, title, globalVariables.add_game_title_to_recording_name,
+                              globalVariables.session_id)
+
+        with self._lock:
+            burst = self._bursts.get(media_type)
+            if burst is None:
+                if not is_new_burst:  # Flushed in the meantime, the title of the flushed burst still applies
+                    new_burst = Burst(media_type, globalVariables.game_title,
+                                      globalVariables.add_game_title_to_recording_name, globalVariables.session_id)
+                burst = self._bursts[media_type] = new_burst
+                self._worker.call_later(self._window, self._flush, burst)
+            burst.paths.append(path)
+            if len(burst.paths) < self._max_files:
+                return
+            del self._bursts[media_type]
+        self._submit(burst)
+
+    @property
+    def pending(self) -> int:
+        """Number of saved files waiting for their burst to end."""
+        with self._lock:
+            return sum(len(burst.paths) for burst in self._bursts.values())
+
+    def flush_all(self) -> None:
+        """Submits all bursts right away, used before the worker stops."""
+        with self._lock:
+            bursts = list(self._bursts.values())
+            self._bursts.clear()
+        for burst in bursts:
+            self._submit(burst)
+
+    def _flush(self, burst: Burst) -> None:
+        with self._lock:
+            if self._bursts.get(burst.media_type) is not burst:
+                return  # Already submitted when it filled up
+            del self._bursts[burst.media_type]
+        self._submit(burst)
+
+    def _submit(self, burst: Burst) -> None:
+        jobs = []
+        for path in burst.paths:
+            media_file = MediaFile(custom_path=path, media_type=burst.media_type, game_title=burst.title,
+                                   add_title_prefix=burst.add_title_prefix)
+            jobs.append(MoveJob(media_file.get_old_path(), media_file.get_new_path(), burst.media_type, burst.title,
+                                session_id=burst.session_id))
+        log("(Burst) Moving %d %s file(s) saved together into %s", len(jobs), burst.media_type, burst.title)
+        self._worker.submit_batch(jobs)
+
+
+# MOVE ENGINE
+
+def is_same_device(old_path: str, new_path: str) -> bool:
+    """Checks if the file and the target folder are on the same device (volume).
+
+    Args:
+        old_path (str): Current path of the file
+        new_path (str): Target path of the file, its folder has to exist
+
+    Returns:
+        bool: True when the file can be moved with a rename
+    """
+    return os.stat(old_path).st_dev == os.stat(os_path.dirname(new_path)).st_dev
+
+
+def get_file_size(path: str) -> int:
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def is_heavy_move(old_path: str, new_path: str, size: int) -> bool:
+    """Checks if moving the file means copying a big file between devices.
+
+    Returns:
+        bool: False for renames, small files and files that can't be checked
+    """
+    try:
+        return size >= CONST.SMALL_FILE_SIZE and not is_same_device(old_path, new_path)
+    except OSError:
+        return False
+
+
+def move_media(old_path: str, new_path: str, fsync_policy: str = FsyncPolicy.FILE, throttle=None,
+               verify: bool = False) -> str | None:
+    """Moves the file, renaming it when possible and copying it between devices otherwise.
+
+    Args:
+        old_path (str): Current path of the file
+        new_path (str): Target path of the file
+        fsync_policy (str): One of the FsyncPolicy values, only used for copies
+        throttle (callable): Optional function called with the size of each chunk before it is copied
+        verify (bool): Whether copies are hashed while copying and checked before the source is removed
+
+    Returns:
+        str | None: digest of the verified copy, None for renames and unverified copies
+    """
+    if is_same_device(old_path, new_path):
+        os.replace(old_path, new_path)
+        return None
+
+    return copy_across_devices(old_path, new_path, fsync_policy, throttle, verify)
+
+
+def copy_across_devices(old_path: str, new_path: str, fsync_policy: str, throttle=None, verify: bool = False) -> str | None:
+    """Copies the file into a partial file next to the target, verifies it and only then removes the source.
+
+    With verify, the source is hashed in the same pass that copies it and the partial file is read back
+    and compared to it, so the source is never read twice.
+
+    Returns:
+        str | None: digest of the copied data when verified
+
+    Raises:
+        OSError: When the copy fails or the copied file does not match the source
+    """
+    partial_path = new_path + CONST.PARTIAL_FILE_SUFFIX
+    digest = None
+    try:
+        with open(old_path, "rb") as src, open(partial_path, "wb") as dst:
+            size = os.fstat(src.fileno()).st_size
+            source_hash = new_hash() if verify else None
+            copied = copy_file_chunked(src.fileno(), dst.fileno(), size, throttle, source_hash)
+            if copied != size:
+                raise OSError(errno.EIO, f"Copied {copied} of {size} bytes", old_path)
+
+            if fsync_policy != FsyncPolicy.NEVER:
+                os.fsync(dst.fileno())
+            _drop_page_cache(dst.fileno())
+
+        if os.stat(partial_path).st_size != size:
+            raise OSError(errno.EIO, "Copied file size does not match the source", partial_path)
+
+        if source_hash is not None:
+            digest = format_digest(source_hash)
+            if hash_file(partial_path) != digest:
+                raise OSError(errno.EIO, "Copied file content does not match the source", partial_path)
+
+        copystat(old_path, partial_path)
+        os.replace(partial_path, new_path)
+    except BaseException:
+        if os_path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+
+    if fsync_policy == FsyncPolicy.FILE_AND_FOLDER:
+        _fsync_folder(os_path.dirname(new_path))
+
+    os.remove(old_path)
+    return digest
+
+
+def new_hash():
+    return hashlib.new(CONST.DIGEST_ALGORITHM, digest_size=CONST.DIGEST_SIZE)
+
+
+def format_digest(file_hash) -> str:
+    """Returns the digest prefixed with the name of the algorithm, so stored digests stay checkable if it changes."""
+    return f"{CONST.DIGEST_ALGORITHM}:{file_hash.hexdigest()}"
+
+
+def hash_file(path: str) -> str:
+    """Returns the digest of the file, read without keeping it in the page cache."""
+    file_hash = new_hash()
+    with open(path, "rb") as f:
+        fd = f.fileno()
+        offset = 0
+        while data := os.read(fd, CONST.USERSPACE_COPY_BUFFER_SIZE):
+            file_hash.update(data)
+            offset += len(data)
+            if offset % CONST.COPY_CHUNK_SIZE == 0:
+                _drop_page_cache(fd, offset - CONST.COPY_CHUNK_SIZE, CONST.COPY_CHUNK_SIZE)
+        _drop_page_cache(fd)
+    return format_digest(file_hash)
+
+
+_UNSUPPORTED_COPY_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP}
+
+
+def copy_file_chunked(src_fd: int, dst_fd: int, size: int, throttle=None, file_hash=None) -> int:
+    """Copies size bytes in chunks, preferring kernel-side copies over user-space buffers.
+
+    Data copied by the kernel never reaches the script, so hashing the file forces user-space copies.
+
+    Returns:
+        int: number of bytes copied
+    """
+    if file_hash is not None:
+        copy_chunk_functions = [lambda *args: _copy_chunk_userspace(*args, file_hash=file_hash)]
+    else:
+        copy_chunk_functions = _get_copy_chunk_functions()
+    chunk_size = CONST.THROTTLED_COPY_CHUNK_SIZE if throttle else CONST.COPY_CHUNK_SIZE
+    offset = 0
+    while offset < size:
+        count = min(chunk_size, size - offset)
+        if throttle:
+            throttle(count)
+        try:
+            copied = copy_chunk_functions[0](src_fd, dst_fd, offset, count)
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_COPY_ERRNOS or len(copy_chunk_functions) == 1:
+                raise
+            # Kernel refused this method for these files, fall back to the next one
+            copy_chunk_functions.pop(0)
+            continue
+
+        if copied == 0:
+            break
+        _drop_page_cache(src_fd, offset, copied)
+        offset += copied
+    return offset
+
+
+def _get_copy_chunk_functions() -> list:
+    functions = []
+    if hasattr(os, "copy_file_range"):
+        functions.append(_copy_chunk_copy_file_range)
+    if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        functions.append(_copy_chunk_sendfile)
+    functions.append(_copy_chunk_userspace)
+    return functions
+
+
+def _copy_chunk_copy_file_range(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+
+
+def _copy_chunk_sendfile(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    # sendfile() writes at the current position of the destination
+    os.lseek(dst_fd, offset, os.SEEK_SET)
+    return os.sendfile(dst_fd, src_fd, offset, count)
+
+
+def _copy_chunk_userspace(src_fd: int, dst_fd: int, offset: int, count: int, file_hash=None) -> int:
+    os.lseek(src_fd, offset, os.SEEK_SET)
+    os.lseek(dst_fd, offset, os.SEEK_SET)
+    copied = 0
+    while copied < count:
+        data = os.read(src_fd, min(CONST.USERSPACE_COPY_BUFFER_SIZE, count - copied))
+        if not data:
+            break
+        if file_hash is not None:
+            file_hash.update(data)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(dst_fd, view):]
+        copied += len(data)
+    return copied
+
+
+def _drop_page_cache(fd: int, offset: int = 0, length: int = 0) -> None:
+    """Tells the kernel the copied range won't be needed again, so big copies don't evict OBS's own cache."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, offset, length, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+
+def _fsync_folder(folder: str) -> None:
+    if os.name != "posix":
+        return  # Folders can't be opened for syncing on Windows
+    fd = os.open(folder, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+# FILE READINESS
+
+class InotifyWatcher:
+    """Linux inotify watch of a single file reporting the events of the mask"""
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    _event_header = None
+    _libc = None
+
+    def __init__(self, fd: int, mask: int) -> None:
+        self._fd = fd
+        self._mask = mask
+
+    @classmethod
+    def create(cls, path: str, mask: int = IN_CLOSE_WRITE) -> "InotifyWatcher | None":
+        """Starts watching the file.
+
+        Args:
+            path (str): Path of the file
+            mask (int): Events to report, close-after-write by default
+
+        Returns:
+            InotifyWatcher | None: None when inotify is not available on this system
+        """
+        if not sys.platform.startswith("linux"):
+            return None
+
+        try:
+            if cls._libc is None:
+                cls._libc = ctypes.CDLL(None, use_errno=True)
+                cls._event_header = struct.Struct("iIII")
+            fd = cls._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+
+        if cls._libc.inotify_add_watch(fd, os.fsencode(path), mask) < 0:
+            os.close(fd)
+            return None
+        return cls(fd, mask)
+
+    async def wait(self, timeout: float) -> bool:
+        """Waits up to timeout seconds for one of the watched events.
+
+        Returns:
+            bool: True when an event of the mask arrived
+        """
+        loop = asyncio.get_running_loop()
+        readable = loop.create_future()
+        loop.add_reader(self._fd, lambda: readable.done() or readable.set_result(None))
+        try:
+            await asyncio.wait_for(readable, timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            loop.remove_reader(self._fd)
+        return self._read_events()
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+    def _read_events(self) -> bool:
+        try:
+            data = os.read(self._fd, 4096)
+        except BlockingIOError:
+            return False
+
+        offset = 0
+        header = self._event_header
+        while offset + header.size <= len(data):
+            _, mask, _, name_length = header.unpack_from(data, offset)
+            if mask & self._mask:
+                return True
+            offset += header.size + name_length
+        return False
+
+
+def get_file_signature(path: str) -> tuple | None:
+    """Returns size and modification time of the file, None when it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+async def wait_until_released(path: str, poll_interval: float, deadline: float) -> bool:
+    """Waits until the writer released the file.
+
+    Files not modified for poll_interval seconds count as released right away. Otherwise returns as soon
+    as inotify reports the file being closed after writing (Linux), or once size and modification time
+    stay the same for poll_interval seconds.
+
+    Args:
+        path (str): Path of the file
+        poll_interval (float): Seconds between size/mtime checks
+        deadline (float): time.monotonic() value after which waiting stops
+
+    Returns:
+        bool: True when the file is ready, False on timeout or when the file disappeared
+    """
+    previous = get_file_signature(path)
+    if previous is not None and time.time_ns() - previous[1] >= poll_interval * 1e9:
+        return True  # Nothing wrote to the file for a whole poll interval already
+
+    watcher = InotifyWatcher.create(path)
+    try:
+        while previous is not None:
+            timeout = min(poll_interval, deadline - time.monotonic())
+            if timeout <= 0:
+                return False
+
+            if watcher is not None:
+                if await watcher.wait(timeout):
+                    return True
+            else:
+                await asyncio.sleep(timeout)
+
+            current = get_file_signature(path)
+            if current == previous:
+                return True
+            previous = current
+        return False
+    finally:
+        if watcher is not None:
+            watcher.close()
+
+
+# ASYNC FUNCTIONS
+
+async def remember_and_move(job: MoveJob, throttle=None) -> bool:
+    """Moves the recording to new location using move_media().
+
+    Copies between drives wait for the writer to release the file first, so a file
+    still being written is never copied partially. The digest of a verified copy is kept in the job.
+
+    Returns:
+        bool: False when the move failed and should be retried once the file is released
+    """
+    old_path, new_path, config = job.old_path, job.new_path, job.config
+
+    if not os_path.exists(old_path):
+        log("(Asyncio) File does not exist: %s", old_path, level=LogLevel.WARNING)
+        return True
+
+    try:
+        folderCache.ensure(os_path.dirname(new_path))
+        if not is_same_device(old_path, new_path):
+            log("(Asyncio) Waiting for the file to be released before copying it to another drive...", level=LogLevel.DEBUG)
+            await wait_until_released(old_path, config.time_to_wait, time.monotonic() + CONST.READINESS_TIMEOUT)
+
+        job.digest = await asyncio.to_thread(move_media, old_path, new_path, config.fsync_policy, throttle,
+                                             config.verify_copies)
+    except Exception as e:
+        log("(Asyncio) Move failed: %s", e, level=LogLevel.ERROR)
+        # The target folder could have been removed after it was cached, it's created again before the retry
+        folderCache.discard(os_path.dirname(new_path))
+        return False
+
+    log("(Asyncio) Done!", level=LogLevel.DEBUG)
+    log("(Asyncio) File moved to: %s", new_path)
+    return True
+
+# BULK ORGANIZER
+
+class BulkOrganizer:
+    """Sorts files saved while the script was not running, using the same path rules as the live handlers
+
+    Titles come from the sidecar index (file name or path relative to the root -> title) or from the
+    'Title - ' prefix the script adds to file names. Files without a title are left in place.
+    """
+
+    def __init__(self, root: str, titles_path: str | None = None, recursive: bool = False,
+                 add_title_prefix: bool = False, default_title: str | None = None) -> None:
+        """Create an organizer of a recording folder.
+
+        Args:
+            root (str): Folder holding the unsorted recordings, replays and screenshots
+            titles_path (str): Optional JSON sidecar index, RecORDER_titles.json in the root by default
+            recursive (bool): Whether the subfolders are sorted as well
+            add_title_prefix (bool): Whether the title is added to names of files without the prefix
+            default_title (str): Optional title of files without one, they are skipped otherwise
+        """
+        self.root = os_path.abspath(root)
+        self.recursive = recursive
+        self.add_title_prefix = add_title_prefix
+        self.default_title = get_folder_name(default_title) if default_title else None
+        self.skipped = []
+        self._titles = self._load_titles(titles_path or os_path.join(self.root, CONST.TITLE_INDEX_FILE_NAME))
+
+    def scan(self):
+        """Yields the media files of the tree, reading one folder entry at a time."""
+        folders = [self.root]
+        while folders:
+            folder = folders.pop()
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if self.recursive:
+                                folders.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False) and get_media_type(entry.name) is not None:
+                            yield entry
+            except OSError as e:
+                self.skipped.append((folder, str(e)))
+
+    def infer_title(self, entry: os.DirEntry) -> tuple[str | None, bool]:
+        """Returns the title of the file and whether its name already starts with it."""
+        relative_path = os_path.relpath(entry.path, self.root).replace(os.sep, "/")
+        title = self._titles.get(relative_path) or self._titles.get(entry.name)
+        if title:
+            title = get_folder_name(title)
+            return title or None, entry.name.startswith(f"{title} - ")
+
+        prefix, separator, _ = entry.name.partition(" - ")
+        if separator and (title := get_folder_name(prefix)):
+            return title, True
+
+        return self.default_title, False
+
+    def plan(self) -> list[MoveJob]:
+        """Plans the moves of the whole tree before any file is touched.
+
+        Returns:
+            list[MoveJob]: moves of the files that are not in their folders yet
+        """
+        jobs = []
+        targets = set()
+        for entry in self.scan():
+            title, has_prefix = self.infer_title(entry)
+            if not title:
+                self.skipped.append((entry.path, "no title"))
+                continue
+
+            media_type = get_media_type(entry.name)
+            media_file = MediaFile(custom_path=entry.path, media_type=media_type, game_title=title,
+                                   add_title_prefix=self.add_title_prefix and not has_prefix)
+            if self._is_organized(media_file):
+                continue
+            if media_file.new_path in targets or os_path.exists(media_file.new_path):
+                self.skipped.append((entry.path, f"target already exists: {media_file.new_path}"))
+                continue
+
+            targets.add(media_file.new_path)
+            jobs.append(MoveJob(media_file.old_path, media_file.new_path, media_type, title))
+        return jobs
+
+    def report(self, jobs: list[MoveJob], verbose: bool = False) -> str:
+        """Returns a summary of the planned moves, listing each of them when verbose."""
+        per_title = {}
+        for job in jobs:
+            counts = per_title.setdefault(job.game_title, {})
+            counts[job.media_type] = counts.get(job.media_type, 0) + 1
+
+        lines = [f"{len(jobs)} file(s) to move in {self.root}"]
+        for title, counts in sorted(per_title.items()):
+            lines.append(f"  {title}: " + ", ".join(f"{count} {media_type}(s)" for media_type, count in sorted(counts.items())))
+        if verbose:
+            lines.extend(f"  {job.old_path} -> {job.new_path}" for job in jobs)
+        if self.skipped:
+            lines.append(f"{len(self.skipped)} file(s) skipped")
+            lines.extend(f"  {path}: {reason}" for path, reason in self.skipped)
+        return "\n".join(lines)
+
+    def run(self, jobs: list[MoveJob], workers: int = CONST.ORGANIZER_WORKERS,
+            fsync_policy: str = FsyncPolicy.FILE_AND_FOLDER, verify: bool = False) -> int:
+        """Moves the files with a pool of threads, recording the progress in a journal in the root.
+
+        Moves interrupted by a previous run are finished first, to the targets they were planned with.
+
+        Returns:
+            int: number of moves that failed
+        """
+        journal_path = os_path.join(self.root, CONST.ORGANIZER_JOURNAL_FILE_NAME)
+        journal = MoveJournal(journal_path)
+        resumed = {job.old_path: job for job in journal.open()}
+        if resumed:
+            log("(Organizer) Resuming %d interrupted move(s)...", len(resumed))
+        jobs = list(resumed.values()) + [job for job in jobs if job.old_path not in resumed]
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        folders = FolderCache()
+        failed = 0
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="RecORDER-organizer") as executor:
+            futures = {executor.submit(self._move, job, folders, journal, fsync_policy, verify): job for job in jobs}
+            for done, future in enumerate(as_completed(futures), start=1):
+                job = futures[future]
+                try:
+                    future.result()
+                    log("(Organizer) [%d/%d] %s -> %s", done, len(jobs), job.old_path, job.new_path)
+                except Exception as e:
+                    failed += 1
+                    log("(Organizer) [%d/%d] Failed to move %s: %s", done, len(jobs), job.old_path, e,
+                        level=LogLevel.ERROR)
+
+        journal.close()
+        if not failed:
+            os.remove(journal_path)
+        return failed
+
+    @staticmethod
+    def _move(job: MoveJob, folders: FolderCache, journal: MoveJournal, fsync_policy: str, verify: bool) -> None:
+        journal.record_intent(job)
+        folders.ensure(os_path.dirname(job.new_path))
+        job.digest = move_media(job.old_path, job.new_path, fsync_policy, verify=verify)
+        journal.record_done(job)
+
+    @staticmethod
+    def _is_organized(media_file: MediaFile) -> bool:
+        """Checks if the file already is in the folder of its title."""
+        folder = media_file.dir
+        if media_file.subfolder_name:
+            if os_path.basename(folder) != media_file.subfolder_name:
+                return False
+            folder = os_path.dirname(folder)
+        return os_path.basename(folder) == media_file.game_title
+
+    @staticmethod
+    def _load_titles(path: str) -> dict:
+        if not os_path.exists(path):
+            return {}
+        with open(path, encoding="utf-8") as f:
+            titles = json.load(f)
+        log("(Organizer) Loaded %d title(s) from %s", len(titles), path)
+        return titles
+
+
+def get_media_type(file_name: str) -> str | None:
+    """Returns the media type judged by the file name, None for files the script doesn't organize."""
+    extension = os_path.splitext(file_name)[1].lower()
+    if extension in CONST.SCREENSHOT_EXTENSIONS:
+        return "screenshot"
+    if extension not in CONST.RECORDING_EXTENSIONS:
+        return None
+    if file_name.rpartition(" - ")[2].startswith(CONST.REPLAY_FILE_PREFIX):
+        return "replay"
+    return "recording"
+
+
+def organize_main(argv: list[str] | None = None) -> int:
+    """Command line entry point of the bulk organizer."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="RecORDER.py",
+                                     description="Sort existing recordings, replays and screenshots into game folders.")
+    parser.add_argument("root", help="folder holding the unsorted files")
+    parser.add_argument("--dry-run", action="store_true", help="only print the planned moves")
+    parser.add_argument("--recursive", action="store_true", help="sort the files in subfolders too")
+    parser.add_argument("--titles", help=f"JSON file mapping file names to titles ({CONST.TITLE_INDEX_FILE_NAME} in the root by default)")
+    parser.add_argument("--default-title", help="title of files without one, they are skipped otherwise")
+    parser.add_argument("--add-title-prefix", action="store_true", help="add the title to the file names")
+    parser.add_argument("--workers", type=int, default=CONST.ORGANIZER_WORKERS, help="number of parallel moves")
+    parser.add_argument("--fsync", choices=(FsyncPolicy.NEVER, FsyncPolicy.FILE, FsyncPolicy.FILE_AND_FOLDER),
+                        default=FsyncPolicy.FILE_AND_FOLDER, help="flushing of files copied between drives")
+    parser.add_argument("--verify", action="store_true", help="compare files copied between drives with the originals")
+    args = parser.parse_args(argv)
+
+    update_title_rules()
+    organizer = BulkOrganizer(args.root, titles_path=args.titles, recursive=args.recursive,
+                              add_title_prefix=args.add_title_prefix, default_title=args.default_title)
+    jobs = organizer.plan()
+    logger.stop()  # Print the queued log lines before the report
+    print(organizer.report(jobs, verbose=args.dry_run))
+    if args.dry_run:
+        return 0
+
+    failed = organizer.run(jobs, workers=max(1, args.workers), fsync_policy=args.fsync, verify=args.verify)
+    logger.stop()
+    print(f"Moved {len(jobs) - failed} file(s), {failed} failed.")
+    return 1 if failed else 0
+
+
+# WATCHER
+
+class MediaFeedReader:
+    """Reads the records the script appends to the feed, keeping the read offset next to it across restarts"""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.offset = 0
+        self._offset_path = path + ".offset"
+        self._file = None
+        self._inode = None
+
+    def open(self) -> bool:
+        """Opens the feed at the saved offset.
+
+        Returns:
+            bool: False when the script didn't create the feed yet
+        """
+        try:
+            self._file = open(self.path, "rb")
+        except FileNotFoundError:
+            return False
+
+        self._inode = os.fstat(self._file.fileno()).st_ino
+        self.offset = self._load_offset()
+        return True
+
+    def read_records(self) -> list[dict]:
+        """Returns the records appended since the last read, a line still being written is left for the next one."""
+        if self._file is None:
+            return []
+
+        self._file.seek(self.offset)
+        data = self._file.read()
+        end = data.rfind(b"\n") + 1
+        self.offset += end
+
+        records = []
+        for line in data[:end].splitlines():
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                log("(Watcher) Skipping unreadable feed line: %r", line, level=LogLevel.WARNING)
+        return records
+
+    def save(self) -> None:
+        """Saves the offset of the records that were already queued."""
+        temp_path = self._offset_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"inode": self._inode, "offset": self.offset}, f)
+        os.replace(temp_path, self._offset_path)
+
+    def is_replaced(self) -> bool:
+        """Checks if the feed was removed or created again since it was opened."""
+        try:
+            return os.stat(self.path).st_ino != self._inode
+        except OSError:
+            return True
+
+    def rotate(self) -> None:
+        """Moves the read feed aside, the script starts a new one with its next write."""
+        os.replace(self.path, self.path + ".consumed")
+
+    def detach(self) -> None:
+        """Closes the rotated or replaced feed, the next one is read from its start."""
+        self.close()
+        try:
+            os.remove(self.path + ".consumed")
+        except FileNotFoundError:
+            pass
+        self._inode = None
+        self.offset = 0
+        self.save()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _load_offset(self) -> int:
+        try:
+            with open(self._offset_path, encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        if saved.get("inode") != self._inode:
+            return 0  # Offset of a feed that was rotated or removed meanwhile
+        return saved.get("offset", 0)
+
+
+class WatcherDaemon:
+    """Runs the moves the script hands over through the feed, in a process of its own next to OBS
+
+    The script resolves titles and target paths with the same MediaFile rules as always, the watcher
+    only moves the files, so OBS isn't slowed down by copies, hashing and index writes.
+    """
+
+    def __init__(self, reader: MediaFeedReader, worker: MoveWorker) -> None:
+        self._reader = reader
+        self._worker = worker
+
+    async def run(self) -> None:
+        """Follows the feed until cancelled, waiting for the script to create it when needed."""
+        while True:
+            if not self._reader.open():
+                await asyncio.sleep(CONST.FEED_POLL_INTERVAL)
+                continue
+
+            log("(Watcher) Reading %s from offset %d...", self._reader.path, self._reader.offset, level=LogLevel.DEBUG)
+            watcher = InotifyWatcher.create(self._reader.path, InotifyWatcher.IN_MODIFY)
+            try:
+                await self._follow(watcher)
+            finally:
+                if watcher is not None:
+                    watcher.close()
+
+            # Lines written by the script just before the feed was rotated
+            self._process(self._reader.read_records())
+            self._reader.detach()
+
+    def close(self) -> None:
+        self._reader.close()
+
+    async def _follow(self, watcher: InotifyWatcher | None) -> None:
+        """Processes the records of the open feed until it is rotated or replaced."""
+        while True:
+            self._process(self._reader.read_records())
+
+            if self._reader.offset >= CONST.FEED_ROTATE_SIZE:
+                self._reader.rotate()
+                # Writes of the script opening the old file before the rotation land in it
+                await asyncio.sleep(CONST.FEED_ROTATE_GRACE)
+                return
+            if self._reader.is_replaced():
+                return
+
+            if watcher is not None:
+                await watcher.wait(CONST.FEED_POLL_INTERVAL)
+            else:
+                await asyncio.sleep(CONST.FEED_POLL_INTERVAL)
+
+    def _process(self, records: list[dict]) -> None:
+        if not records:
+            return
+
+        jobs = []
+        for record in records:
+            op = record.get("op")
+            if op == "move":
+                jobs.append(MoveJob(record["old"], record["new"], record["type"], record["title"], job_id=record["id"],
+                                    session_id=record.get("session")))
+            elif op == "state":
+                globalVariables.is_recording = bool(record.get("recording"))
+                globalVariables.is_replay_active = bool(record.get("replay"))
+                log("(Watcher) Encoder is %s.", "writing" if is_encoder_busy() else "idle", level=LogLevel.DEBUG)
+
+        if jobs:
+            self._worker.submit_batch(jobs)
+        if not is_encoder_busy():
+            self._worker.release_deferred()
+        self._reader.save()
+
+
+def watch_main(argv: list[str] | None = None) -> int:
+    """Command line entry point of the watcher process."""
+    import argparse
+    import signal
+
+    global globalVariables
+    global folderCache
+    global moveJournal
+    global mediaIndex
+    global retentionEngine
+    global moveWorker
+
+    parser = argparse.ArgumentParser(prog="RecORDER.py watch",
+                                     description="Move the files saved by OBS into game folders outside of the OBS process.")
+    parser.add_argument("--feed", default=get_script_file_path(CONST.FEED_FILE_NAME),
+                        help=f"feed written by the script ({CONST.FEED_FILE_NAME} next to the script by default)")
+    parser.add_argument("--fsync", choices=(FsyncPolicy.NEVER, FsyncPolicy.FILE, FsyncPolicy.FILE_AND_FOLDER),
+                        default=FsyncPolicy.FILE, help="flushing of files copied between drives")
+    parser.add_argument("--io-policy", choices=(IoPolicy.IMMEDIATE, IoPolicy.THROTTLE, IoPolicy.DEFER),
+                        default=IoPolicy.THROTTLE, help="big copies between drives while OBS is recording")
+    parser.add_argument("--io-bandwidth", type=int, default=CONST.DEFAULT_IO_BANDWIDTH,
+                        help="bandwidth limit of throttled copies in MB/s")
+    parser.add_argument("--max-concurrent-moves", type=int, default=CONST.MAX_CONCURRENT_MOVES,
+                        help="number of parallel big moves")
+    parser.add_argument("--verify", action="store_true", help="compare files copied between drives with the originals")
+    parser.add_argument("--log-level", choices=[name.lower() for name in LogLevel.NAMES.values()], default="info",
+                        help="lowest level of printed log lines")
+    args = parser.parse_args(argv)
+
+    logger.level = {name.lower(): level for level, name in LogLevel.NAMES.items()}[args.log_level]
+    globalVariables = GlobalVariables()
+    globalVariables.config = ScriptConfig(fsync_policy=args.fsync, io_policy=args.io_policy, io_bandwidth=args.io_bandwidth,
+                                          verify_copies=args.verify)
+    folderCache = FolderCache()
+
+    moveJournal = MoveJournal(get_script_file_path(CONST.WATCHER_JOURNAL_FILE_NAME))
+    mediaIndex = open_media_index()
+    moveWorker = MoveWorker(journal=moveJournal, index=mediaIndex, max_concurrent_moves=max(1, args.max_concurrent_moves))
+    moveWorker.processing = PostProcessing(get_script_file_path(CONST.PROCESSORS_FILE_NAME))
+    moveWorker.start()
+    if mediaIndex is not None:
+        retentionEngine = RetentionEngine(mediaIndex, get_script_file_path(CONST.RETENTION_FILE_NAME))
+        moveWorker.run_periodically(mediaIndex.flush, CONST.MEDIA_INDEX_FLUSH_INTERVAL)
+        moveWorker.run_periodically(mediaIndex.reconcile, CONST.MEDIA_INDEX_RECONCILE_INTERVAL)
+        moveWorker.run_periodically(retentionEngine.enforce, CONST.RETENTION_INTERVAL)
+    resume_unfinished_moves(moveJournal)
+
+    daemon = WatcherDaemon(MediaFeedReader(os_path.abspath(args.feed)), moveWorker)
+    log("(Watcher) Watching %s, press Ctrl+C to stop.", os_path.abspath(args.feed))
+    signal.signal(signal.SIGTERM, stop_watcher)
+    try:
+        asyncio.run(daemon.run())
+    except KeyboardInterrupt:
+        log("(Watcher) Stopping...")
+    finally:
+        daemon.close()
+        moveWorker.stop()
+        moveWorker.processing.close()
+        moveJournal.close()
+        if mediaIndex is not None:
+            mediaIndex.close()
+        logger.stop()
+    return 0
+
+
+def stop_watcher(signum, frame) -> None:
+    """SIGTERM handler of the watcher (ex. from a service manager), stopping it the same way as Ctrl+C."""
+    raise KeyboardInterrupt
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point, 'RecORDER.py watch' starts the watcher and anything else runs the bulk organizer."""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["watch"]:
+        return watch_main(argv[1:])
+    return organize_main(argv)
+
+
+# RETENTION
+
+class RetentionLimit:
+    """Limit of the files of one game and/or media type, or of all indexed files when neither is set"""
+
+    __slots__ = ("game_title", "media_type", "max_bytes", "max_age", "max_count")
+
+    def __init__(self, game_title: str | None = None, media_type: str | None = None, max_bytes: int | None = None,
+                 max_age: float | None = None, max_count: int | None = None) -> None:
+        self.game_title = game_title
+        self.media_type = media_type
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.max_count = max_count
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RetentionLimit":
+        """Creates a limit from an entry of the retention file, sizes in GB and ages in days."""
+        max_gb = data.get("max_gb")
+        max_age_days = data.get("max_age_days")
+        return cls(game_title=data.get("game_title"), media_type=data.get("media_type"),
+                   max_bytes=int(max_gb * 1024 ** 3) if max_gb is not None else None,
+                   max_age=max_age_days * 24 * 60 * 60 if max_age_days is not None else None,
+                   max_count=data.get("max_count"))
+
+
+class RetentionEngine:
+    """Removes or archives the oldest organized files once they exceed the limits of the retention file
+
+    Enforcement only reads the media index, so the folders are never rescanned. Files that may still
+    be in use - the current recording and anything modified within the grace period - are never touched.
+    """
+
+    def __init__(self, index: MediaIndex, config_path: str) -> None:
+        self._index = index
+        self._config_path = config_path
+        self._config_mtime = None
+        self.limits = []
+        self.archive_folder = None
+
+    def load(self) -> bool:
+        """Reads the retention file when it changed.
+
+        Returns:
+            bool: whether any limit is configured
+        """
+        try:
+            mtime = os.stat(self._config_path).st_mtime
+        except OSError:
+            self.limits = []
+            self._config_mtime = None
+            return False
+        if mtime == self._config_mtime:
+            return bool(self.limits)
+
+        self._config_mtime = mtime
+        try:
+            with open(self._config_path, encoding="utf-8") as f:
+                config = json.load(f)
+            self.limits = [RetentionLimit.from_dict(limit) for limit in config.get("limits", [])]
+            self.archive_folder = config.get("archive_folder")
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            log("(Retention) Failed to read %s, no files are removed: %s", self._config_path, e, level=LogLevel.WARNING)
+            self.limits = []
+            return False
+
+        log("(Retention) Loaded %d limit(s), evicted files are %s", len(self.limits),
+            f"archived to {self.archive_folder}" if self.archive_folder else "deleted")
+        return bool(self.limits)
+
+    def enforce(self) -> int:
+        """Evicts the files over the limits, archiving is postponed while the encoder is writing.
+
+        Returns:
+            int: number of evicted files
+        """
+        if not self.load():
+            return 0
+        if self.archive_folder and is_encoder_busy():
+            return 0  # Copies to another drive would compete with the encoder, they wait until it stops
+
+        now = time.time()
+        current_files = outputRegistry.current_files() if outputRegistry is not None else set()
+        protected = {os_path.normpath(path) for path in (globalVariables.last_recording, *current_files) if path}
+        candidates = {}
+        for limit in self.limits:
+            for row in self._index.find_over_limit(limit, now):
+                candidates.setdefault(row["path"], row)
+
+        evicted = []
+        for path, row in candidates.items():
+            if path in protected or (row["modified_at"] or now) > now - CONST.RETENTION_GRACE_PERIOD:
+                continue
+            try:
+                self._evict(row)
+            except FileNotFoundError:
+                pass  # Removed by the user since the last reconcile
+            except OSError as e:
+                log("(Retention) Failed to evict %s: %s", path, e, level=LogLevel.WARNING)
+                continue
+            evicted.append(path)
+
+        self._index.remove(evicted)
+        if evicted:
+            log("(Retention) %s %d file(s) over the limits", "Archived" if self.archive_folder else "Deleted",
+                len(evicted))
+        return len(evicted)
+
+    def _evict(self, row: dict) -> None:
+        path = row["path"]
+        if not self.archive_folder:
+            os.remove(path)
+            log("(Retention) Deleted %s", path, level=LogLevel.DEBUG)
+            return
+
+        folder = os_path.join(self.archive_folder, row["game_title"], CONST.MEDIA_SUBFOLDERS.get(row["media_type"], ""))
+        makedirs(folder, exist_ok=True)
+        archived_path = os_path.join(folder, os_path.basename(path))
+        move_media(path, archived_path, globalVariables.config.fsync_policy)
+        log("(Retention) Archived %s to %s", path, archived_path, level=LogLevel.DEBUG)
+
+
+# POST-PROCESSING
+
+class PostProcessor:
+    """Function called with each moved file of its media types, in a process of the post-processing pool"""
+
+    __slots__ = ("name", "target", "media_types", "timeout")
+
+    def __init__(self, name: str, target: str, media_types: frozenset | None = None,
+                 timeout: float = CONST.PROCESSOR_TIMEOUT) -> None:
+        """Create a processor.
+
+        Args:
+            name (str): Name shown in the log
+            target (str): Function as 'module:function', called with the new path and the metadata of the file
+            media_types (frozenset): Media types the processor runs on, all of them when None
+            timeout (float): Seconds after which the processor is stopped
+        """
+        self.name = name
+        self.target = target
+        self.media_types = media_types
+        self.timeout = timeout
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PostProcessor":
+        """Creates a processor from an entry of the processors file."""
+        target = data["function"]
+        module_name, separator, function_name = target.partition(":")
+        if not (module_name and separator and function_name):
+            raise ValueError(f"function must be given as 'module:function', got {target!r}")
+        media_types = data.get("media_types")
+        return cls(data.get("name") or target, target, frozenset(media_types) if media_types else None,
+                   float(data.get("timeout", CONST.PROCESSOR_TIMEOUT)))
+
+    def accepts(self, media_type: str) -> bool:
+        return self.media_types is None or media_type in self.media_types
+
+
+class ProcessorProcess:
+    """Process of the post-processing pool, running one processor call at a time"""
+
+    __slots__ = ("python", "process", "connection")
+
+    def __init__(self, context, python: str) -> None:
+        """Start the process.
+
+        Args:
+            context: Spawn context of multiprocessing, already pointing at the interpreter
+            python (str): Interpreter running the process
+        """
+        self.python = python
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(target=processor_process_main, args=(child_connection,),
+                                       name="RecORDER-processor", daemon=True)
+        self.process.start()
+        child_connection.close()
+
+    def call(self, processor: PostProcessor, metadata: dict) -> str | None:
+        """Runs the processor on the file and waits for it, blocking.
+
+        Returns:
+            str | None: error raised by the processor, None when it succeeded
+
+        Raises:
+            TimeoutError: the processor is still running after its timeout
+            EOFError, OSError: the process exited
+        """
+        self.connection.send((processor.target, metadata["path"], metadata))
+        if not self.connection.poll(processor.timeout):
+            raise TimeoutError
+        return self.connection.recv()
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def kill(self) -> None:
+        """Stops the process, even in the middle of a call."""
+        self.process.terminate()
+        self.process.join(1.0)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(1.0)
+        self.connection.close()
+
+
+class PostProcessing:
+    """Runs the processors of the processors file on moved files, in a pool of processes
+
+    Moves never wait for it: moved files go into a queue in the mover's event loop, emptied by as many
+    tasks as there are processes. Processors of a file run one after another, a failing one doesn't stop
+    the rest. A processor running past its timeout or crashing gets only its own process replaced.
+    """
+
+    def __init__(self, config_path: str) -> None:
+        self._config_path = config_path
+        self._config_mtime = None
+        self.processors = []
+        self.workers = CONST.PROCESSOR_WORKERS
+        self.python = None
+        self._queue = None
+        self._loop = None
+        self._consumers = 0
+        self._threads = None
+        self._processes = set()
+        self._idle = []
+        self._processes_lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def waiting(self) -> int:
+        """Number of moved files waiting for a free process."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def load(self) -> bool:
+        """Reads the processors file when it changed.
+
+        Returns:
+            bool: whether any processor is configured
+        """
+        try:
+            mtime = os.stat(self._config_path).st_mtime
+        except OSError:
+            self.processors = []
+            self._config_mtime = None
+            return False
+        if mtime == self._config_mtime:
+            return bool(self.processors)
+
+        self._config_mtime = mtime
+        try:
+            with open(self._config_path, encoding="utf-8") as f:
+                config = json.load(f)
+            processors = [PostProcessor.from_dict(processor) for processor in config.get("processors", [])]
+            workers = max(1, int(config.get("workers", CONST.PROCESSOR_WORKERS)))
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            log("(Processing) Failed to read %s, files are not processed: %s", self._config_path, e,
+                level=LogLevel.WARNING)
+            self.processors = []
+            return False
+
+        self.processors = processors
+        self.workers = workers
+        self.python = config.get("python") or find_python_executable()
+        if self.python is None:
+            log("(Processing) No Python interpreter found for the processes, set 'python' in %s.",
+                self._config_path, level=LogLevel.WARNING)
+        # Processes of the previous interpreter or past the new limit are stopped once they're free
+        self._trim_idle()
+        log("(Processing) Loaded %d processor(s) running in up to %d process(es).", len(processors), workers)
+        return bool(processors)
+
+    def schedule(self, job: MoveJob) -> None:
+        """Queues the processors of the moved file, called in the mover's event loop."""
+        if not self.load() or self.python is None:
+            return
+        processors = [processor for processor in self.processors if processor.accepts(job.media_type)]
+        if not processors:
+            return
 
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._queue = asyncio.Queue()
+            self._loop = loop
+            self._consumers = 0
+        while self._consumers < self.workers:
+            self._consumers += 1
+            loop.create_task(self._consume())
+
+        metadata = {"path": job.new_path, "original_path": job.old_path, "media_type": job.media_type,
+                    "game_title": job.game_title, "session_id": job.session_id, "size": job.size, "digest": job.digest}
+        self._queue.put_nowait((metadata, processors))
+        if self._queue.qsize() % CONST.PROCESSOR_BACKLOG_WARNING == 0:
+            log("(Processing) %d file(s) are waiting for the processors.", self._queue.qsize(),
+                level=LogLevel.WARNING)
+
+    def close(self) -> None:
+        """Stops the processes, files still waiting are not processed."""
+        self._closed = True
+        with self._processes_lock:
+            processes = list(self._processes)
+            self._processes.clear()
+            self._idle.clear()
+        for process in processes:
+            process.kill()
+        if self._threads is not None:
+            self._threads.shutdown(wait=False, cancel_futures=True)
+            self._threads = None
+
+    async def _consume(self) -> None:
+        # Tasks past a lowered worker count leave after their current file
+        while self._consumers <= self.workers:
+            metadata, processors = await self._queue.get()
+            try:
+                for processor in processors:
+                    await self._run(processor, metadata)
+            finally:
+                self._queue.task_done()
+        self._consumers -= 1
 
-class Screenshot(MediaFile):
-    """Class for handling screenshot files"""
+    async def _run(self, processor: PostProcessor, metadata: dict) -> None:
+        if self._threads is None:
+            from concurrent.futures import ThreadPoolExecutor
 
-    def __init__(self, custom_path: str | None = None) -> None:
-        """Create a screenshot file object.
+            self._threads = ThreadPoolExecutor(thread_name_prefix="RecORDER-processing")
 
-        Args:
-            custom_path (str): Optional path to a screenshot file
-        """
-        super().__init__(custom_path=custom_path, media_type="screenshot")
+        started_at = time.monotonic()
+        try:
+            error = await asyncio.get_running_loop().run_in_executor(self._threads, self._call, processor, metadata)
+        except TimeoutError:
+            log("(Processing) %s took longer than %.0fs on %s, its process was stopped.", processor.name,
+                processor.timeout, metadata["path"], level=LogLevel.WARNING)
+            return
+        except (EOFError, OSError) as e:
+            if not self._closed:
+                log("(Processing) Process running %s on %s exited: %s", processor.name, metadata["path"],
+                    str(e) or type(e).__name__, level=LogLevel.ERROR)
+            return
 
+        if error is not None:
+            log("(Processing) %s failed on %s: %s", processor.name, metadata["path"], error, level=LogLevel.ERROR)
+        else:
+            log("(Processing) %s took %.2fs: %s", processor.name, time.monotonic() - started_at, metadata["path"],
+                level=LogLevel.DEBUG)
 
-# ASYNC FUNCTIONS
+    def _call(self, processor: PostProcessor, metadata: dict) -> str | None:
+        process = self._take_process()
+        try:
+            error = process.call(processor, metadata)
+        except BaseException:
+            self._discard(process)
+            raise
+        self._give_back(process)
+        return error
+
+    def _take_process(self) -> ProcessorProcess:
+        with self._processes_lock:
+            if self._closed:
+                raise EOFError("post-processing was stopped")
+            while self._idle:
+                process = self._idle.pop()
+                if process.is_alive():
+                    return process
+                self._processes.discard(process)
+
+            import multiprocessing
+
+            # Spawned processes start the interpreter of the script, inside OBS it isn't sys.executable
+            context = multiprocessing.get_context("spawn")
+            context.set_executable(self.python)
+            process = ProcessorProcess(context, self.python)
+            self._processes.add(process)
+            return process
+
+    def _give_back(self, process: ProcessorProcess) -> None:
+        with self._processes_lock:
+            keep = (not self._closed and process.python == self.python and process.is_alive()
+                    and len(self._idle) < self.workers)
+            if keep:
+                self._idle.append(process)
+                return
+            self._processes.discard(process)
+        process.kill()
+
+    def _discard(self, process: ProcessorProcess) -> None:
+        with self._processes_lock:
+            self._processes.discard(process)
+        process.kill()
+
+    def _trim_idle(self) -> None:
+        with self._processes_lock:
+            stale = [process for process in self._idle if process.python != self.python]
+            stale += [process for process in self._idle if process not in stale][self.workers:]
+            for process in stale:
+                self._idle.remove(process)
+                self._processes.discard(process)
+        for process in stale:
+            process.kill()
+
+
+def find_python_executable() -> str | None:
+    """Returns the Python interpreter for the processes, inside OBS sys.executable is OBS itself."""
+    if os_path.basename(sys.executable).lower().startswith("python"):
+        return sys.executable
+
+    if os.name == "nt":
+        names = ("python.exe",)
+    else:
+        names = (f"bin/python{sys.version_info.major}.{sys.version_info.minor}", "bin/python3")
+    for name in names:
+        candidate = os_path.join(sys.base_exec_prefix, name)
+        if os_path.isfile(candidate):
+            return candidate
+    return None
 
-async def remember_and_move(old_path: str, new_path: str) -> None:
-    """Moves the recording to new location using shutil.move() with retries."""
-    
-    if not os_path.exists(old_path):
-        log(f"(Asyncio) File does not exist: {old_path}")
-        return
-    
-    time_to_wait = globalVariables.time_to_wait
 
-    new_dir = None
-    max_attempts = 4
-    enlarge_timeout_value = 2
-    for attempt in range(max_attempts):
+def processor_process_main(connection) -> None:
+    """Loop of a post-processing process, running the calls it receives until the script closes the connection."""
+    while True:
+        try:
+            target, path, metadata = connection.recv()
+        except EOFError:
+            return
         try:
-            new_dir = move_file(old_path, new_path)
-            break  # Success, exit retry loop
+            run_processor(target, path, metadata)
         except Exception as e:
-            if attempt < 3:  # Don't print on last attempt (will print final error below)
-                log(f"Move attempt {attempt + 1} failed: {e}")
-                await asyncio.sleep(time_to_wait)
-                time_to_wait *= enlarge_timeout_value
-            else:
-                log(f"(Asyncio) File move failed after {attempt + 1} attempts: {e}")
+            connection.send(str(e) or type(e).__name__)
+        else:
+            connection.send(None)
 
-    if new_dir is None:
-        log("(Asyncio) File was not moved.")
-        return
 
-    log("(Asyncio) Done!")
-    log(f"(Asyncio) File moved to: {new_dir}")
+def run_processor(target: str, path: str, metadata: dict) -> None:
+    """Calls the processor function, in a process of the post-processing pool."""
+    module_name, _, function_name = target.partition(":")
+    function = getattr(importlib.import_module(module_name), function_name)
+    function(path, metadata)
+
+
+def write_metadata_sidecar(path: str, metadata: dict) -> None:
+    """Built-in processor saving the metadata of the file next to it, as <file name>.json."""
+    with open(path + ".json", "w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=2)
+
 
 # HELPER FUNCTIONS
 
-def remove_unusable_title_characters(title: str) -> str:
-    # Remove non-alphanumeric characters (ex. ':')
-    title = sub(r"[^A-Za-z0-9 ]+", "", title)
+def get_script_file_path(file_name: str) -> str:
+    """Returns path of a file stored next to this script."""
+    return os_path.join(os_path.dirname(os_path.abspath(__file__)), file_name)
 
-    # Remove whitespaces at the end
-    title = "".join(title.rstrip())
 
-    # Remove additional whitespaces
+def remove_unusable_title_characters(title: str) -> str:
+    # Remove characters that can't be in folder names (ex. ':'), letters of all scripts are kept
+    title = unicodedata.normalize("NFC", title).translate(titleCharacterTable)
+
+    # Remove additional whitespaces and whitespaces at the end
     title = " ".join(title.split())
 
-    return title
+    # Windows doesn't allow folders named after devices
+    if title.upper() in CONST.RESERVED_FOLDER_NAMES:
+        title += " Game"
+
+    return title[:CONST.MAX_TITLE_LENGTH].rstrip()
+
+
+def get_folder_name(title: str) -> str:
+    """Returns the folder name of the window title, with the title rules applied."""
+    return titleRules.folder_name(title)
+
+
+def update_title_rules() -> None:
+    """Loads the title rules file when it changed since it was loaded."""
+    global titleRules
+    global titleRulesMtime
+
+    path = get_script_file_path(CONST.TITLE_RULES_FILE_NAME)
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        mtime = None
+    if titleRules is None or mtime != titleRulesMtime:
+        titleRules = TitleRules.load(path)
+        titleRulesMtime = mtime
+
+
+def is_encoder_busy() -> bool:
+    """Checks if OBS is writing a recording or keeps the replay buffer running."""
+    return bool(globalVariables.is_recording or globalVariables.is_replay_active
+                or (outputRegistry is not None and outputRegistry.is_recording()))
+
+
+def publish_encoder_state() -> None:
+    """Tells the watcher process whether the encoder is writing, when the moves are handed over to it."""
+    if moveWorker is not None and moveWorker.feed is not None:
+        is_recording = globalVariables.is_recording or (outputRegistry is not None and outputRegistry.is_recording())
+        moveWorker.feed.write_state(is_recording, globalVariables.is_replay_active)
+
+
+def queue_media_file_move(media_file: MediaFile, session_id: str | None = None) -> None:
+    """Queue media file to be moved into organized folder by the background worker."""
+    moveWorker.submit(MoveJob(media_file.get_old_path(), media_file.get_new_path(), media_file.media_type,
+                              media_file.game_title, session_id=session_id or globalVariables.session_id))
+
+
+def resolve_replay_title() -> str:
+    """Returns the title of a saved replay, looking it up only when the hooked title isn't known yet."""
+    if globalVariables.game_title == globalVariables.default_recording_name:
+        log("Running get_hooked procedure to get current app title...", level=LogLevel.DEBUG)
+        check_if_hooked_and_update_title()
+    return globalVariables.game_title
+
+
+def resolve_screenshot_title() -> str:
+    """Returns the title of a screenshot, screenshots can be taken outside of recording, so it is always looked up."""
+    if not globalVariables.source_uuid:
+        log("Reloading the signals...", level=LogLevel.DEBUG)
+        hooked_sh()  # Respond to selected source hooking to a window
+        log("Signals reloaded.", level=LogLevel.DEBUG)
+
+    log("Running get_hooked procedure to get current app title...", level=LogLevel.DEBUG)
+    check_if_hooked_and_update_title()
+    return globalVariables.game_title
+
+
+def queue_session_part(session: RecordingSession, path: str) -> None:
+    """Queues a finished part of the recording session into the folder of the session title.
+
+    The title is looked up only for the first part, later parts follow it even when the hooked window changed.
+    """
+    if session.title is None:
+        if globalVariables.game_title == globalVariables.default_recording_name:
+            log("Running get_hooked procedure to get current app title...\n", level=LogLevel.DEBUG)
+            check_if_hooked_and_update_title()
+        session.title = globalVariables.game_title
+
+    rec = Recording(custom_path=path, game_title=session.title)
+    rec.create_new_folder()
+    queue_media_file_move(rec, session_id=session.session_id)
+    session.targets.append(rec.get_new_path())
+
+
+def finish_session(session: RecordingSession, last_part: str) -> None:
+    """Queues the last part of the stopped recording and saves the manifest of the session when enabled."""
+    queue_session_part(session, last_part)
+    recordingSessions.end(session)
+    if globalVariables.config.write_session_manifest:
+        moveWorker.run_in_background(lambda: write_session_manifest(session))
+
+
+def write_session_manifest(session: RecordingSession) -> None:
+    """Writes the list of the parts next to the first one, named after it."""
+    first_target = session.targets[0]
+    manifest_path = os_path.splitext(first_target)[0] + CONST.SESSION_MANIFEST_SUFFIX
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(session.to_manifest(), f, indent=2)
+    log("Session manifest saved: %s", manifest_path, level=LogLevel.DEBUG)
+
+
+def open_media_index() -> MediaIndex | None:
+    """Opens the index of moved files, None when SQLite is not available or the index can't be opened."""
+    global sqlite3
+    try:
+        import sqlite3
+    except ImportError:  # Minimal Python builds can come without it, the media index is disabled then
+        log("SQLite is not available in this Python, the media index is disabled.", level=LogLevel.WARNING)
+        return None
+
+    index = MediaIndex(get_script_file_path(CONST.MEDIA_INDEX_FILE_NAME))
+    try:
+        index.open()
+    except sqlite3.Error as e:
+        log("Failed to open the media index, it is disabled: %s", e, level=LogLevel.WARNING)
+        return None
+    return index
+
+
+def open_move_storage() -> list[MoveJob]:
+    """Opens the journal and the media index of the script when the mover starts.
+
+    Returns:
+        list[MoveJob]: moves interrupted by OBS exiting or the script unloading, to resume
+    """
+    global moveJournal
+    global mediaIndex
+    global retentionEngine
+    moveJournal = MoveJournal(get_script_file_path(CONST.JOURNAL_FILE_NAME))
+    if moveWorker.feed is not None:
+        # The watcher process moves the files, so it keeps the media index and applies the retention limits
+        log("(Journal) Media index and retention are left to the watcher process.", level=LogLevel.DEBUG)
+        moveWorker.attach(moveJournal, None)
+    else:
+        mediaIndex = open_media_index()
+        moveWorker.attach(moveJournal, mediaIndex)
+    if mediaIndex is not None:
+        retentionEngine = RetentionEngine(mediaIndex, get_script_file_path(CONST.RETENTION_FILE_NAME))
+        moveWorker.run_periodically(mediaIndex.flush, CONST.MEDIA_INDEX_FLUSH_INTERVAL)
+        moveWorker.run_periodically(reconcile_media_index, CONST.MEDIA_INDEX_RECONCILE_INTERVAL)
+        moveWorker.run_periodically(enforce_retention, CONST.RETENTION_INTERVAL)
+
+    unfinished_jobs = moveJournal.open()
+    if unfinished_jobs:
+        log("(Journal) Resuming %d unfinished move(s)...", len(unfinished_jobs))
+    return unfinished_jobs
 
 
-def move_media_file_asyncio(media_file: MediaFile) -> None:
-    """Asynchronously move media file to organized folder."""
-    asyncio.run(remember_and_move(media_file.get_old_path(), media_file.get_new_path()))
+def reconcile_media_index() -> None:
+    """Drops the index entries of files removed by hand, unless the watcher process was switched on since."""
+    if moveWorker.feed is None:
+        mediaIndex.reconcile()
+
+
+def enforce_retention() -> None:
+    """Applies the retention limits, unless the watcher process was switched on since and applies them itself."""
+    if moveWorker.feed is None:
+        retentionEngine.enforce()
+
+
+def use_watcher_setting(settings) -> None:
+    """Hands the moves over to the watcher process (RecORDER.py watch) when the settings say it runs them."""
+    if obs.obs_data_get_bool(settings, "use_watcher_bool"):
+        moveWorker.feed = MediaFeed(get_script_file_path(CONST.FEED_FILE_NAME))
+        publish_encoder_state()
+    else:
+        moveWorker.feed = None
+
+
+def has_unfinished_moves(journal_path: str) -> bool:
+    """Whether the journal holds any record, it's emptied once all moves of a session are done."""
+    try:
+        return os.stat(journal_path).st_size > 0
+    except OSError:
+        return False
+
+
+def resume_unfinished_moves(journal: MoveJournal) -> None:
+    """Queues the moves that were interrupted by OBS exiting or the script unloading."""
+    unfinished_jobs = journal.open()
+    if not unfinished_jobs:
+        return
+
+    log("(Journal) Resuming %d unfinished move(s)...", len(unfinished_jobs))
+    for job in unfinished_jobs:
+        moveWorker.submit(job, resumed=True)
     
     
 # SIGNAL-RELATED
 
-def file_changed_sh(recreate: bool = False) -> None:
-    """Signal handler function reacting to automatic file splitting."""
-    global file_changed_sh_ref
-    if not file_changed_sh_ref:
-        output = obs.obs_frontend_get_recording_output()
+def connect_recording_outputs() -> None:
+    """Connects to the signals of the recording outputs, again when OBS recreated them (ex. at recording start).
+
+    Splits of the frontend output are handled by file_changed_cb, the outputs named in the settings
+    are followed from their own 'start', 'file_changed' and 'stop' signals.
+    """
+    disconnect_recording_outputs()
+
+    output = obs.obs_frontend_get_recording_output()
+    try:
+        frontend_name = obs.obs_output_get_name(output)
+        _connect_output(output, frontend_name, True, {"file_changed": file_changed_cb})
+    finally:
+        obs.obs_output_release(output)
+
+    for name in outputRegistry.extra_names:
+        if name == frontend_name:
+            continue
+        output = obs.obs_get_output_by_name(name)
+        if output is None:
+            log("(Outputs) Output %s not found, looking for it again at the next recording start.", name,
+                level=LogLevel.DEBUG)
+            continue
         try:
-            file_changed_sh_ref = obs.obs_output_get_signal_handler(output)
-            obs.signal_handler_connect(file_changed_sh_ref, "file_changed", file_changed_cb)
+            _connect_output(output, name, False, {signal: make_output_signal_cb(handler, name)
+                                                  for signal, handler in OUTPUT_SIGNAL_HANDLERS})
         finally:
             obs.obs_output_release(output)
-    else:
-        obs.signal_handler_disconnect(file_changed_sh_ref, "file_changed", file_changed_cb)
-        if recreate:
-            output = obs.obs_frontend_get_recording_output()
-            try:
-                file_changed_sh_ref = obs.obs_output_get_signal_handler(output)
-                obs.signal_handler_connect(file_changed_sh_ref, "file_changed", file_changed_cb)
-            finally:
-                obs.obs_output_release(output)
+
+
+def disconnect_recording_outputs() -> None:
+    for entry in outputRegistry.connected():
+        for signal, callback in entry.callbacks.items():
+            obs.signal_handler_disconnect(entry.signal_handler, signal, callback)
+        entry.signal_handler = None
+        entry.callbacks = {}
+
+
+def _connect_output(output: object, name: str, is_frontend: bool, callbacks: dict) -> None:
+    entry = outputRegistry.get_or_add(name)
+    entry.is_frontend = is_frontend
+    entry.signal_handler = obs.obs_output_get_signal_handler(output)
+    entry.callbacks = callbacks
+    for signal, callback in callbacks.items():
+        obs.signal_handler_connect(entry.signal_handler, signal, callback)
+    log("(Outputs) Connected to %s", name, level=LogLevel.DEBUG)
+
+
+def get_output_path(name: str) -> str | None:
+    """Returns the file the output is set to write."""
+    output = obs.obs_get_output_by_name(name)
+    if output is None:
+        return None
+
+    try:
+        settings = obs.obs_output_get_settings(output)
+        try:
+            return obs.obs_data_get_string(settings, "path") or obs.obs_data_get_string(settings, "url") or None
+        finally:
+            obs.obs_data_release(settings)
+    finally:
+        obs.obs_output_release(output)
 
 
 def file_changed_cb(calldata: object) -> None:
-    """Callback function reacting to the file_changed_sh signal handler function being triggered."""
+    """Callback function reacting to automatic splitting of the frontend recording output."""
+    started_at = time.perf_counter()
+    try:
+        _handle_file_changed(calldata)
+    finally:
+        scriptMetrics.observe_handler("_handle_file_changed", time.perf_counter() - started_at)
 
+
+def _handle_file_changed(calldata: object) -> None:
     log("Recording automatic splitting detected!\n")
 
     global globalVariables
+
+    if eventTracer is not None:
+        eventTracer.record("f", p=obs.calldata_string(calldata, "next_file"))
     
-    log("Looking for split file...")
+    log("Looking for split file...", level=LogLevel.DEBUG)
     old_file = globalVariables.last_recording
     new_file = obs.obs_frontend_get_last_recording()
     
@@ -383,67 +3586,221 @@ def file_changed_cb(calldata: object) -> None:
     globalVariables.last_recording = new_file
 
     if old_file and old_file != new_file:
-        log(f"Moving old recording: {old_file}")
-        log(f"New recording detected: {new_file}")
-        if globalVariables.game_title == globalVariables.default_recording_name:
-            log("Running get_hooked procedure to get current app title...\n")
-            check_if_hooked_and_update_title()
+        log("Moving old recording: %s", old_file)
+        log("New recording detected: %s", new_file)
+        session = recordingSessions.get(old_file)
+        if session is None:  # Recording started before the script was loaded
+            session = recordingSessions.start(old_file)
+        recordingSessions.add_part(session, new_file)
+
+        queue_session_part(session, old_file)
+
+
+def make_output_signal_cb(handler, name: str):
+    """Returns the callback of a signal of the named output.
+
+    OBS only connects plain Python functions to signals, partials and bound methods are silently ignored.
+    """
+    def callback(calldata: object) -> None:
+        output_signal_cb(handler, name, calldata)
+
+    return callback
+
+
+def output_signal_cb(handler, name: str, calldata: object) -> None:
+    """Callback of the signals of the outputs named in the settings, called from the thread of the output."""
+    started_at = time.perf_counter()
+    try:
+        output = outputRegistry.get(name)
+        if output is not None:
+            handler(output, calldata)
+    finally:
+        scriptMetrics.observe_handler(handler.__name__, time.perf_counter() - started_at)
+
+
+def _handle_output_start(output: RecordingOutput, calldata: object) -> None:
+    output.last_file = get_output_path(output.name)
+    output.session = recordingSessions.start(output.last_file) if output.last_file else None
+    log("(Outputs) %s started recording: %s", output.name, output.last_file)
+    publish_encoder_state()
+    moveWorker.start_in_background()
+
+
+def _handle_output_file_changed(output: RecordingOutput, calldata: object) -> None:
+    old_file = output.last_file
+    new_file = obs.calldata_string(calldata, "next_file")
+    output.last_file = new_file
+
+    if old_file and old_file != new_file:
+        log("(Outputs) %s split the recording, moving: %s", output.name, old_file)
+        if output.session is None:  # Output started before the script was loaded
+            output.session = recordingSessions.start(old_file)
+        recordingSessions.add_part(output.session, new_file)
+        queue_session_part(output.session, old_file)
+
+
+def _handle_output_stop(output: RecordingOutput, calldata: object) -> None:
+    last_file, session = output.last_file, output.session
+    output.last_file = None
+    output.session = None
+    publish_encoder_state()
+
+    if last_file:
+        log("(Outputs) %s stopped recording, moving: %s", output.name, last_file)
+        finish_session(session or recordingSessions.start(last_file), last_file)
+    moveWorker.release_deferred()
 
-        rec = Recording(custom_path=old_file)
-        rec.create_new_folder()
-        thread = threading.Thread(target=move_media_file_asyncio, args=(rec,), daemon=True)
-        thread.start()
+
+OUTPUT_SIGNAL_HANDLERS = (
+    ("start", _handle_output_start),
+    ("file_changed", _handle_output_file_changed),
+    ("stop", _handle_output_stop),
+)
 
 
 def hooked_sh() -> None:
-    global SOURCE_NAMES
+    """Selects the capture source used for titles from the source index."""
     global globalVariables
-    scene_item_source = None
-
-    log("Checking available sources for a match with source table...")
-
-    current_scene_as_source = obs.obs_frontend_get_current_scene()
-    scene = obs.obs_scene_from_source(current_scene_as_source)
-
-    # noinspection PyArgumentList
-    #TODO: Can I make this work without SOURCE_NAMES?
-    scene_items = obs.obs_scene_enum_items(scene)
-    for item in scene_items:
-        scene_item_source = obs.obs_sceneitem_get_source(item)
-        name = obs.obs_source_get_name(scene_item_source)
-        for source in SOURCE_NAMES:
-            if name == source:
-                globalVariables.source_uuid = obs.obs_source_get_uuid(scene_item_source)
-                log("Match found!")
-                break
 
-    obs.sceneitem_list_release(scene_items)
-    obs.obs_source_release(current_scene_as_source)
+    log("Looking for an active capture source...", level=LogLevel.DEBUG)
+
+    globalVariables.source_uuid = sourceIndex.select_capture_source(SOURCE_NAMES, titleCache.get)
 
     if not globalVariables.source_uuid:
-        log("Nothing was found... Are you sure your source is in the 'SOURCE_NAMES' array?")
+        log("Nothing was found... Is your Game Capture/Window Capture source visible in the current scene?",
+        level=LogLevel.WARNING)
         return
 
-    # Only proceed if we found a valid source
-    if scene_item_source is not None:
+    log("Match found: %s", sourceIndex.get_name(globalVariables.source_uuid))
+
+
+def is_capture_source(source: object) -> bool:
+    return (obs.obs_source_get_unversioned_id(source) in CONST.CAPTURE_SOURCE_IDS
+            or obs.obs_source_get_name(source) in SOURCE_NAMES)
+
+
+def build_source_index() -> None:
+    """Indexes the existing capture sources once and connects the signals keeping the index up to date."""
+    sources = obs.obs_enum_sources()
+    try:
+        for source in sources:
+            if is_capture_source(source):
+                index_capture_source(source, obs.obs_source_active(source))
+    finally:
+        obs.source_list_release(sources)
+
+    global_sh_ref = obs.obs_get_signal_handler()
+    obs.signal_handler_connect(global_sh_ref, "source_create", source_create_cb)
+    obs.signal_handler_connect(global_sh_ref, "source_destroy", source_destroy_cb)
+    obs.signal_handler_connect(global_sh_ref, "source_rename", source_rename_cb)
+    log("Indexed %d capture source(s).", len(sourceIndex))
+
+
+def clear_source_index() -> None:
+    """Disconnects all signals connected by build_source_index() and empties the index."""
+    global_sh_ref = obs.obs_get_signal_handler()
+    obs.signal_handler_disconnect(global_sh_ref, "source_create", source_create_cb)
+    obs.signal_handler_disconnect(global_sh_ref, "source_destroy", source_destroy_cb)
+    obs.signal_handler_disconnect(global_sh_ref, "source_rename", source_rename_cb)
+
+    for source_uuid in sourceIndex.uuids():
+        source = obs.obs_get_source_by_uuid(source_uuid)
+        if source is None:
+            continue
         try:
-            # log("Fetching the signal handler from the matching source...")
-            source_sh_ref = obs.obs_source_get_signal_handler(scene_item_source)
-            # log("Connecting the source signal handler to 'hooked' signal...")
-            obs.signal_handler_connect(source_sh_ref, "hooked", hooked_cb)
-        except Exception as e:
-            log(f"Error connecting hooked signal: {e}")
-    else:
-        log("Warning: No matching source item found.")
-    
+            source_sh_ref = obs.obs_source_get_signal_handler(source)
+            for signal, callback in CAPTURE_SOURCE_SIGNALS:
+                obs.signal_handler_disconnect(source_sh_ref, signal, callback)
+        finally:
+            obs.obs_source_release(source)
+
+    sourceIndex.clear()
+
+
+def index_capture_source(source: object, active: bool) -> None:
+    source_uuid = obs.obs_source_get_uuid(source)
+    if sourceIndex.contains(source_uuid):
+        return
+
+    sourceIndex.add(source_uuid, obs.obs_source_get_name(source), obs.obs_source_get_unversioned_id(source), active)
+    source_sh_ref = obs.obs_source_get_signal_handler(source)
+    for signal, callback in CAPTURE_SOURCE_SIGNALS:
+        obs.signal_handler_connect(source_sh_ref, signal, callback)
+
+
+def source_create_cb(calldata: object) -> None:
+    source = obs.calldata_source(calldata, "source")
+    if is_capture_source(source):
+        index_capture_source(source, False)
+
+
+def source_destroy_cb(calldata: object) -> None:
+    source_uuid = get_calldata_source_uuid(calldata)
+    if not sourceIndex.contains(source_uuid):
+        return
+
+    sourceIndex.remove(source_uuid)
+    if globalVariables.source_uuid == source_uuid:
+        globalVariables.source_uuid = None
+
+
+def source_rename_cb(calldata: object) -> None:
+    source = obs.calldata_source(calldata, "source")
+    source_uuid = obs.obs_source_get_uuid(source)
+    if sourceIndex.contains(source_uuid):
+        sourceIndex.rename(source_uuid, obs.calldata_string(calldata, "new_name"))
+    elif is_capture_source(source):
+        index_capture_source(source, obs.obs_source_active(source))
+
+
+def source_activate_cb(calldata: object) -> None:
+    sourceIndex.set_active(get_calldata_source_uuid(calldata), True)
+
+
+def source_deactivate_cb(calldata: object) -> None:
+    source_uuid = get_calldata_source_uuid(calldata)
+    sourceIndex.set_active(source_uuid, False)
+
+    # Source left the program output, pick the active one again on next event
+    if globalVariables.source_uuid == source_uuid:
+        globalVariables.source_uuid = None
+
     
 def hooked_cb(calldata: object) -> None:
     global globalVariables
 
-    log("Fetching data from calldata...")
+    log("Fetching data from calldata...", level=LogLevel.DEBUG)
+
+    source_uuid = get_calldata_source_uuid(calldata)
+    title = obs.calldata_string(calldata, "title")
+    titleCache.set(source_uuid, title)
+    if eventTracer is not None:
+        eventTracer.record("h", s=sourceIndex.get_name(source_uuid), n=title)
+    if source_uuid != globalVariables.source_uuid:
+        return
+
+    globalVariables.game_title = title
+    log("gameTitle: %s", globalVariables.game_title)
+
+
+def unhooked_cb(calldata: object) -> None:
+    source_uuid = get_calldata_source_uuid(calldata)
+    titleCache.mark_unhooked(source_uuid)
+    if eventTracer is not None:
+        eventTracer.record("u", s=sourceIndex.get_name(source_uuid))
+    log("Source unhooked from the window.")
 
-    globalVariables.game_title = obs.calldata_string(calldata, "title")
-    log(f"gameTitle: {globalVariables.game_title}")
+
+def get_calldata_source_uuid(calldata: object) -> str:
+    return obs.obs_source_get_uuid(obs.calldata_source(calldata, "source"))
+
+
+CAPTURE_SOURCE_SIGNALS = (
+    ("hooked", hooked_cb),
+    ("unhooked", unhooked_cb),
+    ("activate", source_activate_cb),
+    ("deactivate", source_deactivate_cb),
+)
 
 
 # EVENTS
@@ -452,39 +3809,38 @@ def _handle_recording_start() -> None:
     global globalVariables
     
     log("Recording has started...\n")
-    log("Reloading the signals!\n")
+    log("Reloading the signals!\n", level=LogLevel.DEBUG)
     if not globalVariables.source_uuid:
         hooked_sh()  # Respond to selected source hooking to a window    
-    globalVariables.last_recording = obs.obs_frontend_get_last_recording()
+    last_recording = obs.obs_frontend_get_last_recording()
     
-    file_changed_sh(recreate=True)  # Respond to splitting the recording (ex. automatic recording split)
-    log("Signals reloaded!\n")
-    log("Resetting the recording related values...\n")
+    connect_recording_outputs()  # Respond to splitting the recording (ex. automatic recording split)
+    log("Signals reloaded!\n", level=LogLevel.DEBUG)
+    log("Resetting the recording related values...\n", level=LogLevel.DEBUG)
 
-    globalVariables.is_recording = True
-    globalVariables.game_title = globalVariables.default_recording_name
+    # All values of the new recording are swapped in at once, readers never see them half-reset
+    globalVariables.update_state(is_recording=True, last_recording=last_recording,
+                                 session_id=recordingSessions.start(last_recording).session_id,
+                                 game_title=globalVariables.default_recording_name)
+    publish_encoder_state()
+    moveWorker.start_in_background()  # Ready by the time the first part is saved
 
-    log(f"Recording started: {'Yes' if globalVariables.is_recording else 'No'}")
-    log(f"Current game title: {globalVariables.game_title}")
+    log("Recording started: %s", "Yes" if globalVariables.is_recording else "No", level=LogLevel.DEBUG)
+    log("Current game title: %s", globalVariables.game_title)
 
 
 def _handle_recording_stop() -> None:
     global globalVariables
     
     log("Recording has stopped, moving the last file into right folder...\n")
+    globalVariables.update_state(is_recording=False, last_recording=None)
+    publish_encoder_state()
 
-    if globalVariables.game_title == globalVariables.default_recording_name:
-        log("Running get_hooked procedure to get current app title...\n")
-        check_if_hooked_and_update_title()
-
-    rec = Recording()
-    rec.create_new_folder()
-    thread = threading.Thread(target=move_media_file_asyncio, args=(rec,), daemon=True)
-    thread.start()
+    last_part = obs.obs_frontend_get_last_recording()
+    finish_session(recordingSessions.get(last_part) or recordingSessions.start(last_part), last_part)
 
-    log("Job's done. The file was moved.")
-    globalVariables.last_recording = None
-    globalVariables.is_recording = False
+    log("Job's done. The file was queued for moving.")
+    moveWorker.release_deferred()
     
     
 def _handle_replay_buffer_start() -> None:
@@ -493,19 +3849,21 @@ def _handle_replay_buffer_start() -> None:
     log("Replay buffer has started...\n")
 
     if not globalVariables.source_uuid:
-        log("Reloading the signals!")
+        log("Reloading the signals!", level=LogLevel.DEBUG)
         hooked_sh()  # Respond to selected source hooking to a window
-        log("Signals reloaded!\n")
+        log("Signals reloaded!\n", level=LogLevel.DEBUG)
 
-    log("Resetting the recording related values...\n")
+    log("Resetting the recording related values...\n", level=LogLevel.DEBUG)
 
-    globalVariables.is_replay_active = True
-    globalVariables.last_recording = obs.obs_frontend_get_last_recording()
-    globalVariables.game_title = globalVariables.default_recording_name
+    globalVariables.update_state(is_replay_active=True, session_id=uuid.uuid4().hex,
+                                 last_recording=obs.obs_frontend_get_last_recording(),
+                                 game_title=globalVariables.default_recording_name)
+    publish_encoder_state()
+    moveWorker.start_in_background()
 
-    log(f"Replay active? {'Yes' if globalVariables.is_replay_active else 'No'}")
-    log(f"CurrentRecording is {globalVariables.last_recording}")
-    log(f"Game title set to {globalVariables.game_title}")
+    log("Replay active? %s", "Yes" if globalVariables.is_replay_active else "No", level=LogLevel.DEBUG)
+    log("CurrentRecording is %s", globalVariables.last_recording, level=LogLevel.DEBUG)
+    log("Game title set to %s", globalVariables.game_title)
 
 
 def _handle_replay_buffer_save() -> None:
@@ -513,46 +3871,31 @@ def _handle_replay_buffer_save() -> None:
     
     log("Saving the Replay Buffer...")
 
-    if globalVariables.game_title == globalVariables.default_recording_name:
-        log("Running get_hooked procedure to get current app title...")
-        check_if_hooked_and_update_title()
-
-    rec = Recording(is_replay=globalVariables.is_replay_active)
-    rec.create_new_folder()
-    thread = threading.Thread(target=move_media_file_asyncio, args=(rec,), daemon=True)
-    thread.start()
+    if globalVariables.is_replay_active:
+        burstCoalescer.add("replay", obs.obs_frontend_get_last_replay(), resolve_replay_title)
+    else:
+        burstCoalescer.add("recording", obs.obs_frontend_get_last_recording(), resolve_replay_title)
 
 
 def _handle_replay_buffer_stop() -> None:
-    globalVariables.is_replay_active = False
-    globalVariables.last_recording = None
-    log(f"Replay active? {'Yes' if globalVariables.is_replay_active else 'No'}")
+    globalVariables.update_state(is_replay_active=False, last_recording=None)
+    publish_encoder_state()
+    log("Replay active? %s", "Yes" if globalVariables.is_replay_active else "No", level=LogLevel.DEBUG)
+    moveWorker.release_deferred()
 
 
 def _handle_screenshot_taken() -> None:
-    global globalVariables
-
-    if not globalVariables.source_uuid:
-        log("Reloading the signals...")
-        hooked_sh()  # Respond to selected source hooking to a window
-        log("Signals reloaded.")
-
-    log("Running get_hooked procedure to get current app title...")
-    check_if_hooked_and_update_title()
-
     log("User took the screenshot...")
-
-    screenshot = Screenshot()
-    screenshot.create_new_folder()
-    thread = threading.Thread(target=move_media_file_asyncio, args=(screenshot,), daemon=True)
-    thread.start()
+    moveWorker.start_in_background()  # Ready by the time the burst ends
+    burstCoalescer.add("screenshot", obs.obs_frontend_get_last_screenshot(), resolve_screenshot_title)
 
     
 def _handle_scene_collection_change() -> None:
     global globalVariables
     
     log("Scene Collection changing detected, freeing globals to avoid issues...")
-    globalVariables.unload_func()
+    titleCache.clear()
+    globalVariables.reset_state()
 
     if obs.obs_frontend_recording_active():
         log("Stopping recording...")
@@ -586,8 +3929,43 @@ def _build_event_handlers(enable_replay_organization: bool, enable_screenshot_or
 def global_event_handler(event: int) -> None:
     """Single dispatcher for all OBS frontend events"""
 
+    if eventTracer is not None:
+        eventTracer.record("e", c=event, p=get_event_file_path(event))
+
     if handler := EVENT_HANDLERS.get(event):
+        started_at = time.perf_counter()
         handler()
+        scriptMetrics.observe_handler(handler.__name__, time.perf_counter() - started_at)
+
+
+def get_event_file_path(event: int) -> str | None:
+    """Returns the file the frontend event is about, only used for tracing."""
+    if event in (obs.OBS_FRONTEND_EVENT_RECORDING_STARTED, obs.OBS_FRONTEND_EVENT_RECORDING_STOPPED):
+        return obs.obs_frontend_get_last_recording()
+    if event == obs.OBS_FRONTEND_EVENT_REPLAY_BUFFER_SAVED:
+        return obs.obs_frontend_get_last_replay()
+    if event == obs.OBS_FRONTEND_EVENT_SCREENSHOT_TAKEN:
+        return obs.obs_frontend_get_last_screenshot()
+    return None
+
+
+def write_stats_file() -> None:
+    if globalVariables.config.write_stats:
+        scriptMetrics.write(get_script_file_path(CONST.STATS_FILE_NAME))
+
+
+def update_event_tracer(enabled: bool) -> None:
+    """Starts a new trace file or closes the current one."""
+    global eventTracer
+
+    if enabled and eventTracer is None:
+        timestamp = dt.datetime.now().strftime("%Y%m%d-%H%M%S")
+        eventTracer = EventTracer(get_script_file_path(CONST.TRACE_FILE_NAME.format(timestamp=timestamp)))
+        log("Recording event trace to: %s", eventTracer.path)
+    elif not enabled and eventTracer is not None:
+        eventTracer.close()
+        log("Event trace saved: %s", eventTracer.path)
+        eventTracer = None
         
 
 # PROCEDURES
@@ -595,39 +3973,67 @@ def global_event_handler(event: int) -> None:
 def check_if_hooked_and_update_title():
     """Function checks if source selected by user is hooked to any window and takes the title of hooked window
 
-    Raises:
-        TypeError: Only triggers when sourceUUID is None and causes the title to reset to defaultRecordingName
+    The title comes from the title cache kept up to date by the 'hooked'/'unhooked' signals,
+    the 'get_hooked' procedure is only called when the source is not cached yet.
     """
     global globalVariables
 
+    if globalVariables.source_uuid is None:
+        hooked_sh()
+
     if globalVariables.source_uuid is None:
         log("Source UUID is empty. Defaulting to 'Manual Recording'")
         globalVariables.game_title = globalVariables.default_recording_name
         return
 
-    calldata = get_hooked(globalVariables.source_uuid)
-    log("Checking if source is hooked to any window...")
-    if calldata is not None:
+    if not titleCache.contains(globalVariables.source_uuid):
+        log("Checking if source is hooked to any window...", level=LogLevel.DEBUG)
+        titleCache.set(globalVariables.source_uuid, get_hooked_title(globalVariables.source_uuid))
+
+    title = titleCache.get(globalVariables.source_uuid)
+    if not title:
+        globalVariables.game_title = globalVariables.default_recording_name
+        log("Source is not hooked, using default name for un-captured windows...")
+        return
+
+    globalVariables.game_title = title
+    log("Current game title: %s", globalVariables.game_title)
+
+
+def get_hooked_title(uuid: str) -> str | None:
+    """Calls the 'get_hooked' procedure of the source.
+
+    Returns:
+        str | None: title of the hooked window, None when the source is not hooked
+    """
+    calldata = get_hooked(uuid)
+    if calldata is None:
+        return None
+
+    try:
         if not gh_is_hooked(calldata):
-            obs.calldata_destroy(calldata)
-            globalVariables.game_title = globalVariables.default_recording_name
-            log("Call data was empty, using default name for un-captured windows...")
-            return
-        log("Hooked!")
-        try:
-            globalVariables.game_title = gh_title(calldata)
-        except TypeError:
-            log("Failed to get title, using default name - restart OBS or captured app.")
-            globalVariables.game_title = globalVariables.default_recording_name
-        log(f"Current game title: {globalVariables.game_title}")
+            return None
+        return gh_title(calldata)
+    except TypeError:
+        log("Failed to get title, using default name - restart OBS or captured app.", level=LogLevel.WARNING)
+        return None
+    finally:
+        obs.calldata_destroy(calldata)
 
 
 def get_hooked(uuid: str) -> object:
     source = obs.obs_get_source_by_uuid(uuid)
-    cd = obs.calldata_create()
-    ph = obs.obs_source_get_proc_handler(source)
-    obs.proc_handler_call(ph, "get_hooked", cd)
-    obs.obs_source_release(source)
+    if source is None:
+        return None
+
+    try:
+        cd = obs.calldata_create()
+        ph = obs.obs_source_get_proc_handler(source)
+        started_at = time.perf_counter()
+        obs.proc_handler_call(ph, "get_hooked", cd)
+        scriptMetrics.get_hooked.observe(time.perf_counter() - started_at)
+    finally:
+        obs.obs_source_release(source)
     return cd
 
 
@@ -641,32 +4047,84 @@ def gh_title(calldata: object) -> str:
 
 # OBS FUNCTIONS
 
-def check_updates_press():
-    print("Checking for updates...")
+def check_updates_press(props, prop):
+    log("Checking for updates...")
+    if not updateChecker.is_checking():
+        updateChecker.check_in_background()
+    return True  # Refreshing the properties shows the result through check_updates_callback
+
+
+def refresh_stats_press(props, prop):
+    return True  # Properties are recreated with the current statistics
 
 
 def script_load(settings):
     # Loading object of class holding global variables
     global globalVariables
+    global moveWorker
+    global titleCache
+    global folderCache
+    global recordingSessions
+    global outputRegistry
+    global burstCoalescer
+    global sourceIndex
+    global updateChecker
+    global scriptMetrics
+    started_at = time.perf_counter()
     globalVariables = GlobalVariables()
+    scriptMetrics = Metrics()
+    update_title_rules()
+    titleCache = TitleCache()
+    folderCache = FolderCache()
+    recordingSessions = SessionRegistry()
+    outputRegistry = OutputRegistry()
+    sourceIndex = SourceIndex()
+    updateChecker = UpdateChecker(CONST.RELEASES_URL, get_script_file_path(CONST.UPDATE_CACHE_FILE_NAME))
 
     # Validate globalVariables is initialized
     if globalVariables is None:
-        log("Error: globalVariables not initialized.")
+        log("Error: globalVariables not initialized.", level=LogLevel.ERROR)
         return
 
+    # Preparing the background worker responsible for moving files, its thread starts with the first move
+    # and opens the journal and the media index, so reloading the script doesn't touch them
+    moveWorker = MoveWorker()
+    moveWorker.processing = PostProcessing(get_script_file_path(CONST.PROCESSORS_FILE_NAME))
+    burstCoalescer = BurstCoalescer(moveWorker)
+    moveWorker.run_periodically(write_stats_file, CONST.STATS_WRITE_INTERVAL)
+    moveWorker.run_before_start(open_move_storage)
+    use_watcher_setting(settings)  # Known before the mover starts, it decides who keeps the media index
+    if has_unfinished_moves(get_script_file_path(CONST.JOURNAL_FILE_NAME)):
+        moveWorker.start_in_background()
+
     # Loading in Signals
-    file_changed_sh(recreate=True)  # Respond to splitting the recording (ex. automatic recording split)
+    build_source_index()  # Keep track of capture sources and their titles
+    connect_recording_outputs()  # Respond to splitting the recording (ex. automatic recording split)
 
     # Loading in Frontend events
     obs.obs_frontend_add_event_callback(global_event_handler)
+
+    load_time = time.perf_counter() - started_at
+    scriptMetrics.observe_handler("module_import", moduleLoadTime)
+    scriptMetrics.observe_handler("script_load", load_time)
+    log("Script loaded in %.1f ms (module import: %.1f ms).", load_time * 1000, moduleLoadTime * 1000)
     
 
 def script_defaults(settings):
-    obs.obs_data_set_default_string(settings, "default_folder_name_text", "Manual Recording")
+    obs.obs_data_set_default_string(settings, "default_folder_name_text", CONST.DEFAULT_RECORDING_NAME)
     obs.obs_data_set_default_bool(settings, "title_before_bool", False)
     obs.obs_data_set_default_bool(settings, "organize_replay_bool", True)
     obs.obs_data_set_default_bool(settings, "organize_screenshots_bool", True)
+    obs.obs_data_set_default_string(settings, "fsync_policy_list", FsyncPolicy.FILE)
+    obs.obs_data_set_default_string(settings, "io_policy_list", IoPolicy.THROTTLE)
+    obs.obs_data_set_default_int(settings, "io_bandwidth_int", CONST.DEFAULT_IO_BANDWIDTH)
+    obs.obs_data_set_default_bool(settings, "record_trace_bool", False)
+    obs.obs_data_set_default_int(settings, "log_level_list", LogLevel.INFO)
+    obs.obs_data_set_default_bool(settings, "write_stats_bool", False)
+    obs.obs_data_set_default_bool(settings, "verify_copies_bool", False)
+    obs.obs_data_set_default_bool(settings, "session_manifest_bool", False)
+    obs.obs_data_set_default_bool(settings, "use_watcher_bool", False)
+    obs.obs_data_set_default_string(settings, "recording_outputs_text", "")
 
 
 def script_update(settings):
@@ -674,28 +4132,86 @@ def script_update(settings):
     global EVENT_HANDLERS
 
     # Fetching the Settings
-    globalVariables.apply_config(obs.obs_data_get_bool(settings, "title_before_bool"), 
-                                 obs.obs_data_get_string(settings, "default_folder_name_text"))
+    globalVariables.config = ScriptConfig(
+        add_game_title_to_recording_name=obs.obs_data_get_bool(settings, "title_before_bool"),
+        default_recording_name=obs.obs_data_get_string(settings, "default_folder_name_text"),
+        fsync_policy=obs.obs_data_get_string(settings, "fsync_policy_list"),
+        io_policy=obs.obs_data_get_string(settings, "io_policy_list"),
+        io_bandwidth=obs.obs_data_get_int(settings, "io_bandwidth_int"),
+        write_stats=obs.obs_data_get_bool(settings, "write_stats_bool"),
+        verify_copies=obs.obs_data_get_bool(settings, "verify_copies_bool"),
+        write_session_manifest=obs.obs_data_get_bool(settings, "session_manifest_bool"))
 
     EVENT_HANDLERS = _build_event_handlers(enable_replay_organization = obs.obs_data_get_bool(settings, "organize_replay_bool"),
                                            enable_screenshot_organization = obs.obs_data_get_bool(settings, "organize_screenshots_bool"))
+
+    update_event_tracer(obs.obs_data_get_bool(settings, "record_trace_bool"))
+    update_title_rules()
+    logger.level = obs.obs_data_get_int(settings, "log_level_list")
+
+    # Follow the outputs of plugins recording next to the frontend one
+    extra_outputs = tuple(name.strip() for name in obs.obs_data_get_string(settings, "recording_outputs_text").split(",")
+                          if name.strip())
+    if extra_outputs != outputRegistry.extra_names:
+        outputRegistry.extra_names = extra_outputs
+        connect_recording_outputs()
+
+    use_watcher_setting(settings)
     
-    log("(script_update) Updated the settings!\n")
+    log("(script_update) Updated the settings!\n", level=LogLevel.DEBUG)
 
 
 def script_unload():
     # Fetching global variables
     global globalVariables
-    global file_changed_sh_ref
+    global moveWorker
+    global burstCoalescer
+    global moveJournal
+    global mediaIndex
+    global retentionEngine
 
     # Clear events
     obs.obs_frontend_remove_event_callback(global_event_handler)
-
-    # Clear global variables
-    globalVariables.unload_func()
-
-    # Clear signal for automatic splitting function
-    file_changed_sh(recreate=False)
+    update_event_tracer(False)
+
+    # Finish queued moves before the values they rely on are cleared
+    if burstCoalescer is not None:
+        burstCoalescer.flush_all()
+        burstCoalescer = None
+    if moveWorker is not None:
+        moveWorker.stop()
+        moveWorker.processing.close()
+        moveWorker = None
+
+    # Unfinished moves stay in the journal and are resumed on next load
+    if moveJournal is not None:
+        moveJournal.close()
+        moveJournal = None
+
+    # Write the moves still buffered for the index
+    if mediaIndex is not None:
+        mediaIndex.close()
+        mediaIndex = None
+    retentionEngine = None
+
+    # Save the statistics of this session
+    write_stats_file()
+
+    # Clear capture source signals and cached titles and folders
+    clear_source_index()
+    titleCache.clear()
+    folderCache.clear()
+    recordingSessions.clear()
+
+    # Clear the recording state, moves still running keep their own settings
+    globalVariables.reset_state()
+
+    # Clear signals of the recording outputs
+    disconnect_recording_outputs()
+    outputRegistry.clear()
+
+    # Print the queued log lines
+    logger.stop()
     
     
 def script_properties():
@@ -730,6 +4246,92 @@ def script_properties():
         "Check the box, if you want to have title of hooked application appended as a prefix to the recording, else uncheck"
     )
 
+    # Session manifest checkmark
+    session_manifest = obs.obs_properties_add_bool(
+        props, "session_manifest_bool", "Save list of split recording parts "
+    )
+    obs.obs_property_set_long_description(
+        session_manifest,
+        f"Check the box to save a {CONST.SESSION_MANIFEST_SUFFIX} file listing all parts of a split recording next to its first part"
+    )
+
+    # Outputs of plugins recording next to OBS
+    recording_outputs = obs.obs_properties_add_text(
+        props, "recording_outputs_text", "Other recording outputs: ", obs.OBS_TEXT_DEFAULT)
+    obs.obs_property_set_long_description(
+        recording_outputs,
+        "Comma separated names of outputs that record at the same time as OBS (ex. the vertical output of a plugin) - their split and stopped files are organized too"
+    )
+
+    # Sync policy for files copied between drives
+    fsync_policy = obs.obs_properties_add_list(
+        props, "fsync_policy_list", "Sync copied files to disk ", obs.OBS_COMBO_TYPE_LIST, obs.OBS_COMBO_FORMAT_STRING)
+    obs.obs_property_list_add_string(fsync_policy, "Never", FsyncPolicy.NEVER)
+    obs.obs_property_list_add_string(fsync_policy, "After copying the file", FsyncPolicy.FILE)
+    obs.obs_property_list_add_string(fsync_policy, "After copying the file and updating the folder", FsyncPolicy.FILE_AND_FOLDER)
+    obs.obs_property_set_long_description(
+        fsync_policy,
+        "Only used when the game folder is on a different drive than the recording folder - the original file is removed after the copy is verified"
+    )
+
+    # Behaviour of big copies between drives while recording
+    io_policy = obs.obs_properties_add_list(
+        props, "io_policy_list", "Big copies while recording ", obs.OBS_COMBO_TYPE_LIST, obs.OBS_COMBO_FORMAT_STRING)
+    obs.obs_property_list_add_string(io_policy, "Copy immediately", IoPolicy.IMMEDIATE)
+    obs.obs_property_list_add_string(io_policy, "Limit the bandwidth", IoPolicy.THROTTLE)
+    obs.obs_property_list_add_string(io_policy, "Wait until recording stops", IoPolicy.DEFER)
+    obs.obs_property_set_long_description(
+        io_policy,
+        "Copying big files to another drive while recording competes with the encoder and can cause dropped frames - renames and small files are always moved immediately"
+    )
+    obs.obs_properties_add_int(props, "io_bandwidth_int", "Bandwidth limit (MB/s) ", 1, 10000, 1)
+
+    # Verification of copies between drives
+    verify_copies = obs.obs_properties_add_bool(
+        props, "verify_copies_bool", "Verify copies between drives ")
+    obs.obs_property_set_long_description(
+        verify_copies,
+        "Check the box to compare the content of files copied to another drive with the original before it is removed - the copy is read back once, renames on the same drive are never checked"
+    )
+
+    # Watcher process checkmark
+    use_watcher = obs.obs_properties_add_bool(
+        props, "use_watcher_bool", "Move files in a separate process ")
+    obs.obs_property_set_long_description(
+        use_watcher,
+        f"Check the box when 'python RecORDER.py watch' runs next to OBS - the script only writes the saved files into {CONST.FEED_FILE_NAME} and the watcher moves them, so copies never compete with OBS"
+    )
+
+    # Amount of logged details
+    log_level = obs.obs_properties_add_list(
+        props, "log_level_list", "Log level ", obs.OBS_COMBO_TYPE_LIST, obs.OBS_COMBO_FORMAT_INT)
+    obs.obs_property_list_add_int(log_level, "Debug", LogLevel.DEBUG)
+    obs.obs_property_list_add_int(log_level, "Info", LogLevel.INFO)
+    obs.obs_property_list_add_int(log_level, "Warnings", LogLevel.WARNING)
+    obs.obs_property_list_add_int(log_level, "Errors", LogLevel.ERROR)
+    obs.obs_property_set_long_description(
+        log_level,
+        f"Lines below this level are not printed, but the recent ones are saved into {CONST.LOG_DUMP_FILE_NAME} next to the script when an error occurs"
+    )
+
+    # Event trace checkmark
+    record_trace = obs.obs_properties_add_bool(
+        props, "record_trace_bool", "Record event trace ")
+    obs.obs_property_set_long_description(
+        record_trace,
+        "Check the box to write recording events and their timing into a trace file next to the script, useful for reproducing issues"
+    )
+
+    # Statistics
+    write_stats = obs.obs_properties_add_bool(
+        props, "write_stats_bool", "Write statistics file ")
+    obs.obs_property_set_long_description(
+        write_stats,
+        f"Check the box to write timings of events and moves into {CONST.STATS_FILE_NAME} next to the script every minute"
+    )
+    obs.obs_properties_add_button(props, "refresh_stats_button", "Refresh statistics", refresh_stats_press)
+    obs.obs_properties_add_text(props, "stats_info", scriptMetrics.summary() if scriptMetrics else "", obs.OBS_TEXT_INFO)
+
     # Check for updates button
     check_updates = obs.obs_properties_add_button(
         props,
@@ -763,13 +4365,20 @@ def script_description():
         Created and maintained by: oxypatic
         </div>
         
-        <div style="font-weight: bold; text-decoration: underline; font-size: 12pt; color: red;">
-        Important:
+        <div style="font-weight: bold; text-decoration: underline; font-size: 12pt;">
+        Good to know:
         </div>
-        <div style="font-size: 11pt; color: red;">
-        Make sure your <b>Game Capture/Window Capture</b> source name is inside <b>'SOURCE_NAMES'</b>!
+        <div style="font-size: 11pt;">
+        <b>Game Capture/Window Capture</b> sources are found automatically, add a source name to <b>'SOURCE_NAMES'</b> to prefer it when several are visible!
         </div>
         <div style="font-weight: bold; font-size: 12pt; margin-top: 25px;">
         Settings:
         </div>
-    """
\ No newline at end of file
+    """
+
+
+moduleLoadTime = time.perf_counter() - moduleStartedAt
+
+
+if __name__ == "__main__":
+    sys.exit(main())
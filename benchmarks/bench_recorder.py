@@ -0,0 +1,185 @@
+"""Offline benchmarks for RecORDER.py, running the real handlers against benchmarks/fake_obspython.py.
+
+Usage:
+    python benchmarks/bench_recorder.py [--iterations 200] [--big-size-mb 1024]
+                                        [--other-dir /mnt/other] [--replay-saves 5000] [--json results.json]
+
+Reports:
+    - latency of global_event_handler (and the file_changed callback) per frontend event
+    - move throughput of small and big files, into the same folder and into --other-dir
+      (point it at a different tmpfs/loop mount to measure copies between devices)
+    - thread count and memory growth over many replay buffer saves
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from harness import RecORDER, load_script, obs, print_table, silence_log, summarize, unload_script, wait_for_moves, write_file
+
+SMALL_FILE_SIZE = 256 * 1024
+
+
+def timed(function, *args) -> int:
+    started = time.perf_counter_ns()
+    function(*args)
+    return time.perf_counter_ns() - started
+
+
+def load_benchmark_script(data_dir: str) -> None:
+    load_script(data_dir=data_dir)
+    capture = obs.create_source("Game Capture", "game_capture")
+    obs.hook(capture, "Benchmark Game")
+
+
+# BENCHMARKS
+
+def bench_handler_latency(workdir: str, iterations: int) -> dict:
+    results = {}
+
+    def run(name: str, prepare, event=None, callback=None) -> None:
+        samples = []
+        for _ in range(iterations):
+            prepare()
+            if callback is not None:
+                samples.append(timed(callback))
+            else:
+                samples.append(timed(RecORDER.global_event_handler, event))
+            wait_for_moves()
+        results[name] = summarize(samples)
+
+    def new_file(extension: str) -> str:
+        return write_file(os.path.join(workdir, obs.unique_name("file") + extension), SMALL_FILE_SIZE)
+
+    def prepare_recording() -> None:
+        obs.state.last_recording = new_file(".mkv")
+
+    def prepare_replay() -> None:
+        obs.state.last_replay = new_file(".mkv")
+
+    def prepare_screenshot() -> None:
+        obs.state.last_screenshot = new_file(".png")
+
+    def split() -> None:
+        obs.split_recording(new_file(".mkv"))
+
+    run("recording_started", prepare_recording, obs.OBS_FRONTEND_EVENT_RECORDING_STARTED)
+    run("recording_stopped", prepare_recording, obs.OBS_FRONTEND_EVENT_RECORDING_STOPPED)
+    run("replay_buffer_saved", prepare_replay, obs.OBS_FRONTEND_EVENT_REPLAY_BUFFER_SAVED)
+    run("screenshot_taken", prepare_screenshot, obs.OBS_FRONTEND_EVENT_SCREENSHOT_TAKEN)
+
+    obs.state.last_recording = new_file(".mkv")
+    RecORDER.global_event_handler(obs.OBS_FRONTEND_EVENT_RECORDING_STARTED)
+    run("file_changed", lambda: None, callback=split)
+    RecORDER.global_event_handler(obs.OBS_FRONTEND_EVENT_RECORDING_STOPPED)
+    wait_for_moves()
+    return results
+
+
+def bench_move_throughput(source_dir: str, target_dir: str, count: int, size: int) -> dict:
+    paths = [write_file(os.path.join(source_dir, obs.unique_name("move") + ".mkv"), size) for _ in range(count)]
+    target_folder = os.path.join(target_dir, obs.unique_name("target"))
+    os.makedirs(target_folder)
+
+    started = time.perf_counter()
+    for path in paths:
+        RecORDER.moveWorker.submit(RecORDER.MoveJob(path, os.path.join(target_folder, os.path.basename(path)),
+                                                    "recording", "Benchmark Game"))
+    wait_for_moves()
+    elapsed = time.perf_counter() - started
+
+    moved = sum(os.path.exists(os.path.join(target_folder, os.path.basename(path))) for path in paths)
+    return {
+        "files": count,
+        "moved": moved,
+        "same_device": RecORDER.is_same_device(target_folder, os.path.join(source_dir, "x")),
+        "seconds": elapsed,
+        "files_per_s": count / elapsed,
+        "mb_per_s": count * size / elapsed / (1024 * 1024),
+    }
+
+
+def bench_replay_spam(workdir: str, saves: int) -> dict:
+    tracemalloc.start()
+    RecORDER.global_event_handler(obs.OBS_FRONTEND_EVENT_REPLAY_BUFFER_STARTED)
+    threads_before = threading.active_count()
+    memory_before, _ = tracemalloc.get_traced_memory()
+    peak_threads = threads_before
+    peak_queue_depth = 0
+
+    started = time.perf_counter()
+    for _ in range(saves):
+        obs.state.last_replay = write_file(os.path.join(workdir, obs.unique_name("replay") + ".mkv"), 1024)
+        RecORDER.global_event_handler(obs.OBS_FRONTEND_EVENT_REPLAY_BUFFER_SAVED)
+        peak_threads = max(peak_threads, threading.active_count())
+        peak_queue_depth = max(peak_queue_depth, RecORDER.moveWorker.queue_depth)
+    wait_for_moves()
+    elapsed = time.perf_counter() - started
+
+    memory_after, memory_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    RecORDER.global_event_handler(obs.OBS_FRONTEND_EVENT_REPLAY_BUFFER_STOPPED)
+    return {
+        "saves": saves,
+        "seconds": elapsed,
+        "threads_before": threads_before,
+        "threads_peak": peak_threads,
+        "threads_after": threading.active_count(),
+        "peak_queue_depth": peak_queue_depth,
+        "memory_growth_kb": (memory_after - memory_before) / 1024,
+        "memory_peak_kb": memory_peak / 1024,
+        "leaked_calldata": obs.state.live_calldata,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200, help="handler calls per event")
+    parser.add_argument("--small-files", type=int, default=500, help="number of small files to move")
+    parser.add_argument("--big-files", type=int, default=2, help="number of big files to move")
+    parser.add_argument("--big-size-mb", type=int, default=512, help="size of each big file")
+    parser.add_argument("--same-dir", default=tempfile.gettempdir(), help="folder for files and same-device targets")
+    parser.add_argument("--other-dir", help="folder on a different device for cross-device moves")
+    parser.add_argument("--replay-saves", type=int, default=2000, help="replay buffer saves for the growth test")
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--show-log", action="store_true", help="print RecORDER log lines instead of discarding them")
+    args = parser.parse_args()
+
+    if not args.show_log:
+        silence_log()
+
+    results = {}
+    with tempfile.TemporaryDirectory(dir=args.same_dir) as workdir:
+        load_benchmark_script(os.path.join(workdir, "script"))
+        try:
+            results["handler_latency"] = bench_handler_latency(workdir, args.iterations)
+            print_table("Handler latency (frontend thread)", results["handler_latency"])
+
+            throughput = {
+                "small_same_device": bench_move_throughput(workdir, workdir, args.small_files, SMALL_FILE_SIZE),
+                "big_same_device": bench_move_throughput(workdir, workdir, args.big_files, args.big_size_mb * 1024 * 1024),
+            }
+            if args.other_dir:
+                with tempfile.TemporaryDirectory(dir=args.other_dir) as other_dir:
+                    throughput["small_other_dir"] = bench_move_throughput(workdir, other_dir, args.small_files, SMALL_FILE_SIZE)
+                    throughput["big_other_dir"] = bench_move_throughput(workdir, other_dir, args.big_files,
+                                                                        args.big_size_mb * 1024 * 1024)
+            results["move_throughput"] = throughput
+            print_table("Move throughput", throughput)
+
+            results["replay_spam"] = {"replay_buffer_saved": bench_replay_spam(workdir, args.replay_saves)}
+            print_table("Replay buffer save spam", results["replay_spam"])
+        finally:
+            unload_script()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Checks RecORDER's update checker against a stand-in of the GitHub releases API served on localhost.
+
+Usage:
+    python benchmarks/check_updates.py [--json results.json]
+
+Runs the real UpdateChecker (and the "Check for updates" button callback) through each path:
+a first fetch, reuse of the cached result, revalidation answered with 304 Not Modified, a new
+release, an HTTP error, a server slower than the timeout and the button pressed before any result.
+Every check reports its duration, the tag seen and whether the cache file holds what it should.
+Exits with 1 when a check fails.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from harness import RecORDER, obs, print_table, silence_log
+
+CHECK_TIMEOUT = 0.5
+SLOW_RESPONSE_DELAY = 2.0
+
+
+class StubReleases:
+    """What the stand-in server answers, changed by the checks between requests"""
+
+    def __init__(self) -> None:
+        self.tag = "v9.9.9"
+        self.etag = '"release-1"'
+        self.status = 200
+        self.delay = 0.0
+        self.requests = []
+
+
+def create_server(stub: StubReleases) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            stub.requests.append(dict(self.headers))
+            if stub.delay:
+                time.sleep(stub.delay)
+            if stub.status != 200:
+                self.send_error(stub.status)
+                return
+            if self.headers.get("If-None-Match") == stub.etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+
+            body = json.dumps({"tag_name": stub.tag}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("ETag", stub.etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="stub-releases", daemon=True).start()
+    return server
+
+
+def read_cache(path: str) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def run_check(checker) -> float:
+    started = time.perf_counter()
+    checker.check_in_background()
+    checker.wait(SLOW_RESPONSE_DELAY * 2)
+    return time.perf_counter() - started
+
+
+def press_check_updates_button() -> str:
+    props = RecORDER.script_properties()
+    RecORDER.check_updates_callback(props, None)
+    return obs.obs_properties_get(props, "version_info").description
+
+
+# CHECKS
+
+def run_checks(workdir: str) -> dict:
+    stub = StubReleases()
+    server = create_server(stub)
+    url = f"http://127.0.0.1:{server.server_address[1]}/repos/oxypatic/RecORDER/releases/latest"
+    cache_path = os.path.join(workdir, RecORDER.CONST.UPDATE_CACHE_FILE_NAME)
+    results = {}
+
+    def record(name: str, ok: bool, **values) -> None:
+        results[name] = {"ok": ok, **values}
+
+    try:
+        checker = RecORDER.UpdateChecker(url, cache_path, ttl=0, timeout=CHECK_TIMEOUT)
+        seconds = run_check(checker)
+        cache = read_cache(cache_path)
+        record("first_fetch", checker.latest_tag == "v9.9.9" and cache.get("tag_name") == "v9.9.9"
+               and cache.get("etag") == stub.etag and len(stub.requests) == 1,
+               seconds=seconds, tag=checker.latest_tag, requests=len(stub.requests))
+
+        requests_before = len(stub.requests)
+        cached = RecORDER.UpdateChecker(url, cache_path, timeout=CHECK_TIMEOUT)
+        RecORDER.updateChecker = cached
+        description = press_check_updates_button()
+        record("cached_result", cached.is_fresh() and not cached.is_checking() and cached.latest_tag == "v9.9.9"
+               and len(stub.requests) == requests_before and "Update available: v9.9.9" in description,
+               tag=cached.latest_tag, requests=len(stub.requests) - requests_before)
+
+        checked_at = read_cache(cache_path).get("checked_at")
+        seconds = run_check(checker)
+        cache = read_cache(cache_path)
+        record("not_modified", stub.requests[-1].get("If-None-Match") == stub.etag and checker.latest_tag == "v9.9.9"
+               and cache.get("checked_at", 0) > checked_at,
+               seconds=seconds, tag=checker.latest_tag)
+
+        stub.tag, stub.etag = RecORDER.CONST.VERSION, '"release-2"'
+        seconds = run_check(checker)
+        RecORDER.updateChecker = RecORDER.UpdateChecker(url, cache_path, timeout=CHECK_TIMEOUT)
+        description = press_check_updates_button()
+        record("new_release", checker.latest_tag == RecORDER.CONST.VERSION
+               and read_cache(cache_path).get("etag") == '"release-2"' and description == "You have the latest version!",
+               seconds=seconds, tag=checker.latest_tag)
+
+        cache = read_cache(cache_path)
+        stub.status = 500
+        seconds = run_check(checker)
+        record("http_error", checker.latest_tag == RecORDER.CONST.VERSION and read_cache(cache_path) == cache,
+               seconds=seconds, tag=checker.latest_tag)
+
+        stub.status, stub.delay = 200, SLOW_RESPONSE_DELAY
+        seconds = run_check(checker)
+        record("timeout", seconds < SLOW_RESPONSE_DELAY and checker.latest_tag == RecORDER.CONST.VERSION
+               and read_cache(cache_path) == cache,
+               seconds=seconds, tag=checker.latest_tag)
+
+        os.remove(cache_path)
+        RecORDER.updateChecker = RecORDER.UpdateChecker(url, cache_path, timeout=CHECK_TIMEOUT)
+        description = press_check_updates_button()
+        RecORDER.updateChecker.wait(SLOW_RESPONSE_DELAY * 2)
+        record("button_without_cache", description.startswith("Checking for updates")
+               and RecORDER.updateChecker.latest_tag is None and not os.path.exists(cache_path),
+               description=description.splitlines()[0])
+    finally:
+        server.shutdown()
+        server.server_close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--show-log", action="store_true", help="print RecORDER log lines instead of discarding them")
+    args = parser.parse_args()
+
+    if not args.show_log:
+        silence_log()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        results = run_checks(workdir)
+
+    print_table("Update checker", results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if not all(result["ok"] for result in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,607 @@
+"""Stub of the ``obspython`` module OBS provides to scripts, so RecORDER.py can run without OBS.
+
+Only the parts RecORDER uses are implemented: frontend events, signal handlers, proc handlers,
+sources, scene enumeration, settings and properties. Call install() before importing RecORDER,
+then drive it with the helpers at the bottom (emit_frontend_event, hook, split_recording...).
+"""
+
+import itertools
+import sys
+import threading
+import traceback
+import types
+import uuid as uuid_lib
+
+# Frontend events, numbered like obs-frontend-api.h
+OBS_FRONTEND_EVENT_STREAMING_STARTING = 0
+OBS_FRONTEND_EVENT_STREAMING_STARTED = 1
+OBS_FRONTEND_EVENT_STREAMING_STOPPING = 2
+OBS_FRONTEND_EVENT_STREAMING_STOPPED = 3
+OBS_FRONTEND_EVENT_RECORDING_STARTING = 4
+OBS_FRONTEND_EVENT_RECORDING_STARTED = 5
+OBS_FRONTEND_EVENT_RECORDING_STOPPING = 6
+OBS_FRONTEND_EVENT_RECORDING_STOPPED = 7
+OBS_FRONTEND_EVENT_SCENE_CHANGED = 8
+OBS_FRONTEND_EVENT_SCENE_LIST_CHANGED = 9
+OBS_FRONTEND_EVENT_TRANSITION_CHANGED = 10
+OBS_FRONTEND_EVENT_TRANSITION_STOPPED = 11
+OBS_FRONTEND_EVENT_TRANSITION_LIST_CHANGED = 12
+OBS_FRONTEND_EVENT_SCENE_COLLECTION_CHANGED = 13
+OBS_FRONTEND_EVENT_SCENE_COLLECTION_LIST_CHANGED = 14
+OBS_FRONTEND_EVENT_PROFILE_CHANGED = 15
+OBS_FRONTEND_EVENT_PROFILE_LIST_CHANGED = 16
+OBS_FRONTEND_EVENT_EXIT = 17
+OBS_FRONTEND_EVENT_REPLAY_BUFFER_STARTING = 18
+OBS_FRONTEND_EVENT_REPLAY_BUFFER_STARTED = 19
+OBS_FRONTEND_EVENT_REPLAY_BUFFER_STOPPING = 20
+OBS_FRONTEND_EVENT_REPLAY_BUFFER_STOPPED = 21
+OBS_FRONTEND_EVENT_STUDIO_MODE_ENABLED = 22
+OBS_FRONTEND_EVENT_STUDIO_MODE_DISABLED = 23
+OBS_FRONTEND_EVENT_PREVIEW_SCENE_CHANGED = 24
+OBS_FRONTEND_EVENT_SCENE_COLLECTION_CLEANUP = 25
+OBS_FRONTEND_EVENT_FINISHED_LOADING = 26
+OBS_FRONTEND_EVENT_RECORDING_PAUSED = 27
+OBS_FRONTEND_EVENT_RECORDING_UNPAUSED = 28
+OBS_FRONTEND_EVENT_TRANSITION_DURATION_CHANGED = 29
+OBS_FRONTEND_EVENT_REPLAY_BUFFER_SAVED = 30
+OBS_FRONTEND_EVENT_VIRTUALCAM_STARTED = 31
+OBS_FRONTEND_EVENT_VIRTUALCAM_STOPPED = 32
+OBS_FRONTEND_EVENT_TBAR_VALUE_CHANGED = 33
+OBS_FRONTEND_EVENT_SCENE_COLLECTION_CHANGING = 34
+OBS_FRONTEND_EVENT_PROFILE_CHANGING = 35
+OBS_FRONTEND_EVENT_SCRIPTING_SHUTDOWN = 36
+OBS_FRONTEND_EVENT_PROFILE_RENAMED = 37
+OBS_FRONTEND_EVENT_SCENE_COLLECTION_RENAMED = 38
+OBS_FRONTEND_EVENT_THEME_CHANGED = 39
+OBS_FRONTEND_EVENT_SCREENSHOT_TAKEN = 40
+
+OBS_TEXT_DEFAULT = 0
+OBS_TEXT_PASSWORD = 1
+OBS_TEXT_MULTILINE = 2
+OBS_TEXT_INFO = 3
+OBS_COMBO_TYPE_EDITABLE = 1
+OBS_COMBO_TYPE_LIST = 2
+OBS_COMBO_FORMAT_INT = 1
+OBS_COMBO_FORMAT_FLOAT = 2
+OBS_COMBO_FORMAT_STRING = 3
+OBS_PATH_FILE = 0
+OBS_PATH_FILE_SAVE = 1
+OBS_PATH_DIRECTORY = 2
+
+
+# OBJECTS
+
+class Calldata(dict):
+    pass
+
+
+class SignalHandler:
+    def __init__(self) -> None:
+        self._callbacks = {}
+        self._lock = threading.Lock()
+
+    def connect(self, signal: str, callback) -> None:
+        with self._lock:
+            self._callbacks.setdefault(signal, []).append(callback)
+
+    def disconnect(self, signal: str, callback) -> None:
+        with self._lock:
+            callbacks = self._callbacks.get(signal, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    def connection_count(self, signal: str | None = None) -> int:
+        if signal is not None:
+            return len(self._callbacks.get(signal, []))
+        return sum(len(callbacks) for callbacks in self._callbacks.values())
+
+    def emit(self, signal: str, calldata: Calldata) -> None:
+        with self._lock:
+            callbacks = list(self._callbacks.get(signal, []))
+        for callback in callbacks:
+            call_script_callback(callback, calldata)
+
+
+class Source:
+    def __init__(self, name: str, type_id: str, active: bool = True) -> None:
+        self.name = name
+        self.type_id = type_id
+        self.uuid = str(uuid_lib.uuid4())
+        self.active = active
+        self.hooked = False
+        self.title = ""
+        self.signal_handler = SignalHandler()
+        self.scene = Scene(self) if type_id in ("scene", "group") else None
+
+
+class Scene:
+    def __init__(self, source: Source) -> None:
+        self.source = source
+        self.items = []
+
+
+class SceneItem:
+    def __init__(self, source: Source) -> None:
+        self.source = source
+
+
+class Output:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.signal_handler = SignalHandler()
+        self.settings = Data()
+
+
+class Data(dict):
+    def __init__(self) -> None:
+        super().__init__()
+        self.defaults = {}
+
+    def get_value(self, key: str, fallback):
+        return self.get(key, self.defaults.get(key, fallback))
+
+
+class Property:
+    def __init__(self, name: str, description: str, kind: str) -> None:
+        self.name = name
+        self.description = description
+        self.long_description = ""
+        self.kind = kind
+        self.visible = True
+        self.items = []
+        self.callback = None
+        self.modified_callback = None
+
+
+class Properties:
+    def __init__(self) -> None:
+        self.properties = {}
+
+    def add(self, prop: Property) -> Property:
+        self.properties[prop.name] = prop
+        return prop
+
+
+class State:
+    """Everything the stub keeps between calls, replaced by reset()"""
+
+    def __init__(self) -> None:
+        self.frontend_callbacks = []
+        self.last_recording = None
+        self.last_replay = None
+        self.last_screenshot = None
+        self.recording_active = False
+        self.replay_buffer_active = False
+        self.recording_output = Output("adv_file_output")
+        self.outputs = {self.recording_output.name: self.recording_output}
+        self.sources = {}
+        self.global_signal_handler = SignalHandler()
+        self.current_scene = None
+        self.timers = []
+        self.proc_calls = 0
+        self.callback_errors = 0
+        self.rejected_callbacks = 0
+        self.live_calldata = 0
+        self.live_references = 0
+
+
+state = State()
+_counter = itertools.count()
+
+
+# FRONTEND API
+
+def obs_frontend_add_event_callback(callback) -> None:
+    state.frontend_callbacks.append(callback)
+
+
+def obs_frontend_remove_event_callback(callback) -> None:
+    if callback in state.frontend_callbacks:
+        state.frontend_callbacks.remove(callback)
+
+
+def obs_frontend_get_last_recording():
+    return state.last_recording
+
+
+def obs_frontend_get_last_replay():
+    return state.last_replay
+
+
+def obs_frontend_get_last_screenshot():
+    return state.last_screenshot
+
+
+def obs_frontend_recording_active() -> bool:
+    return state.recording_active
+
+
+def obs_frontend_replay_buffer_active() -> bool:
+    return state.replay_buffer_active
+
+
+def obs_frontend_recording_stop() -> None:
+    state.recording_active = False
+
+
+def obs_frontend_replay_buffer_stop() -> None:
+    state.replay_buffer_active = False
+
+
+def obs_frontend_get_recording_output():
+    state.live_references += 1
+    return state.recording_output
+
+
+def obs_frontend_get_current_scene():
+    state.live_references += 1
+    return state.current_scene
+
+
+# OUTPUTS
+
+def obs_get_output_by_name(name: str):
+    output = state.outputs.get(name)
+    if output is not None:
+        state.live_references += 1
+    return output
+
+
+def obs_output_get_signal_handler(output: Output) -> SignalHandler:
+    return output.signal_handler
+
+
+def obs_output_get_name(output: Output) -> str:
+    return output.name
+
+
+def obs_output_get_settings(output: Output) -> Data:
+    return output.settings
+
+
+def obs_output_release(output) -> None:
+    if output is not None:
+        state.live_references -= 1
+
+
+# SOURCES AND SCENES
+
+def obs_enum_sources() -> list:
+    return [source for source in state.sources.values() if source.scene is None]
+
+
+def source_list_release(sources: list) -> None:
+    pass
+
+
+def obs_get_source_by_uuid(source_uuid: str):
+    source = state.sources.get(source_uuid)
+    if source is not None:
+        state.live_references += 1
+    return source
+
+
+def obs_get_source_by_name(name: str):
+    for source in state.sources.values():
+        if source.name == name:
+            state.live_references += 1
+            return source
+    return None
+
+
+def obs_source_release(source) -> None:
+    if source is not None:
+        state.live_references -= 1
+
+
+def obs_source_get_uuid(source: Source) -> str:
+    return source.uuid
+
+
+def obs_source_get_name(source: Source) -> str:
+    return source.name
+
+
+def obs_source_get_unversioned_id(source: Source) -> str:
+    return source.type_id
+
+
+def obs_source_get_id(source: Source) -> str:
+    return source.type_id
+
+
+def obs_source_active(source: Source) -> bool:
+    return source.active
+
+
+def obs_source_get_signal_handler(source: Source) -> SignalHandler:
+    return source.signal_handler
+
+
+def obs_source_get_proc_handler(source: Source) -> Source:
+    return source
+
+
+def obs_scene_from_source(source):
+    return source.scene if source is not None else None
+
+
+def obs_group_from_source(source):
+    return source.scene if source is not None and source.type_id == "group" else None
+
+
+def obs_scene_enum_items(scene) -> list:
+    return list(scene.items) if scene is not None else []
+
+
+def obs_sceneitem_get_source(item: SceneItem) -> Source:
+    return item.source
+
+
+def obs_sceneitem_is_group(item: SceneItem) -> bool:
+    return item.source.type_id == "group"
+
+
+def sceneitem_list_release(items: list) -> None:
+    pass
+
+
+def obs_get_signal_handler() -> SignalHandler:
+    return state.global_signal_handler
+
+
+# SIGNALS, PROCEDURES AND CALLDATA
+
+def signal_handler_connect(handler: SignalHandler, signal: str, callback) -> None:
+    if is_script_function(callback):
+        handler.connect(signal, callback)
+
+
+def signal_handler_disconnect(handler: SignalHandler, signal: str, callback) -> None:
+    if is_script_function(callback):
+        handler.disconnect(signal, callback)
+
+
+def is_script_function(callback) -> bool:
+    """OBS's bindings only accept Python functions (PyFunction_Check), partials and bound methods are ignored."""
+    if isinstance(callback, types.FunctionType):
+        return True
+    state.rejected_callbacks += 1
+    print(f"fake_obspython: callback {callback!r} is not a function, OBS ignores it", file=sys.stderr)
+    return False
+
+
+def proc_handler_call(source: Source, name: str, calldata: Calldata) -> bool:
+    state.proc_calls += 1
+    if name != "get_hooked":
+        return False
+    calldata["hooked"] = source.hooked
+    calldata["title"] = source.title
+    calldata["class"] = ""
+    calldata["executable"] = ""
+    return True
+
+
+def calldata_create() -> Calldata:
+    state.live_calldata += 1
+    return Calldata()
+
+
+def calldata_destroy(calldata: Calldata) -> None:
+    state.live_calldata -= 1
+
+
+def calldata_bool(calldata: Calldata, name: str) -> bool:
+    return bool(calldata.get(name, False))
+
+
+def calldata_string(calldata: Calldata, name: str):
+    return calldata.get(name)
+
+
+def calldata_int(calldata: Calldata, name: str) -> int:
+    return int(calldata.get(name, 0))
+
+
+def calldata_source(calldata: Calldata, name: str):
+    return calldata.get(name)
+
+
+def calldata_ptr(calldata: Calldata, name: str):
+    return calldata.get(name)
+
+
+# SETTINGS
+
+def obs_data_create() -> Data:
+    return Data()
+
+
+def obs_data_release(data: Data) -> None:
+    pass
+
+
+def obs_data_set_default_string(data: Data, key: str, value: str) -> None:
+    data.defaults[key] = value
+
+
+def obs_data_set_default_bool(data: Data, key: str, value: bool) -> None:
+    data.defaults[key] = value
+
+
+def obs_data_set_default_int(data: Data, key: str, value: int) -> None:
+    data.defaults[key] = value
+
+
+def obs_data_set_string(data: Data, key: str, value: str) -> None:
+    data[key] = value
+
+
+def obs_data_set_bool(data: Data, key: str, value: bool) -> None:
+    data[key] = value
+
+
+def obs_data_set_int(data: Data, key: str, value: int) -> None:
+    data[key] = value
+
+
+def obs_data_get_string(data: Data, key: str) -> str:
+    return data.get_value(key, "")
+
+
+def obs_data_get_bool(data: Data, key: str) -> bool:
+    return data.get_value(key, False)
+
+
+def obs_data_get_int(data: Data, key: str) -> int:
+    return data.get_value(key, 0)
+
+
+# PROPERTIES
+
+def obs_properties_create() -> Properties:
+    return Properties()
+
+
+def obs_properties_get(props: Properties, name: str):
+    return props.properties.get(name)
+
+
+def obs_properties_add_text(props: Properties, name: str, description: str, text_type: int) -> Property:
+    return props.add(Property(name, description, "text"))
+
+
+def obs_properties_add_bool(props: Properties, name: str, description: str) -> Property:
+    return props.add(Property(name, description, "bool"))
+
+
+def obs_properties_add_int(props: Properties, name: str, description: str, minimum: int, maximum: int, step: int) -> Property:
+    return props.add(Property(name, description, "int"))
+
+
+def obs_properties_add_list(props: Properties, name: str, description: str, combo_type: int, combo_format: int) -> Property:
+    return props.add(Property(name, description, "list"))
+
+
+def obs_properties_add_path(props: Properties, name: str, description: str, path_type: int, filter_text, default_path) -> Property:
+    return props.add(Property(name, description, "path"))
+
+
+def obs_properties_add_button(props: Properties, name: str, text: str, callback) -> Property:
+    prop = props.add(Property(name, text, "button"))
+    prop.callback = callback
+    return prop
+
+
+def obs_property_list_add_string(prop: Property, name: str, value: str) -> None:
+    prop.items.append((name, value))
+
+
+def obs_property_list_add_int(prop: Property, name: str, value: int) -> None:
+    prop.items.append((name, value))
+
+
+def obs_property_set_long_description(prop: Property, description: str) -> None:
+    prop.long_description = description
+
+
+def obs_property_set_description(prop: Property, description: str) -> None:
+    prop.description = description
+
+
+def obs_property_set_visible(prop: Property, visible: bool) -> None:
+    prop.visible = visible
+
+
+def obs_property_visible(prop: Property) -> bool:
+    return prop.visible
+
+
+def obs_property_set_modified_callback(prop: Property, callback) -> None:
+    prop.modified_callback = callback
+
+
+# TIMERS
+
+def timer_add(callback, milliseconds: int) -> None:
+    state.timers.append((callback, milliseconds))
+
+
+def timer_remove(callback) -> None:
+    state.timers = [(timer, ms) for timer, ms in state.timers if timer != callback]
+
+
+# HELPERS FOR DRIVING THE STUB
+
+def install() -> None:
+    """Registers this module as ``obspython``."""
+    sys.modules["obspython"] = sys.modules[__name__]
+
+
+def reset() -> None:
+    global state
+    state = State()
+
+
+def call_script_callback(callback, *args) -> None:
+    """Calls into the script like OBS does: exceptions are logged and counted, not raised."""
+    try:
+        callback(*args)
+    except Exception:
+        state.callback_errors += 1
+        traceback.print_exc()
+
+
+def emit_frontend_event(event: int) -> None:
+    for callback in list(state.frontend_callbacks):
+        call_script_callback(callback, event)
+
+
+def create_source(name: str, type_id: str = "game_capture", active: bool = True) -> Source:
+    """Creates a source and emits the global 'source_create' signal for it."""
+    source = Source(name, type_id, active)
+    state.sources[source.uuid] = source
+    state.global_signal_handler.emit("source_create", Calldata(source=source))
+    if active:
+        source.signal_handler.emit("activate", Calldata(source=source))
+    return source
+
+
+def destroy_source(source: Source) -> None:
+    state.global_signal_handler.emit("source_destroy", Calldata(source=source))
+    state.sources.pop(source.uuid, None)
+
+
+def create_scene(name: str, *items: Source, type_id: str = "scene") -> Source:
+    scene_source = create_source(name, type_id)
+    scene_source.scene.items = [SceneItem(item) for item in items]
+    return scene_source
+
+
+def set_current_scene(scene_source: Source) -> None:
+    state.current_scene = scene_source
+
+
+def hook(source: Source, title: str) -> None:
+    source.hooked = True
+    source.title = title
+    source.signal_handler.emit("hooked", Calldata(source=source, title=title, **{"class": "", "executable": ""}))
+
+
+def unhook(source: Source) -> None:
+    source.hooked = False
+    source.title = ""
+    source.signal_handler.emit("unhooked", Calldata(source=source))
+
+
+def split_recording(next_file: str, output: Output | None = None) -> None:
+    """Starts writing next_file and emits 'file_changed' like automatic file splitting does."""
+    output = output or state.recording_output
+    if output is state.recording_output:
+        state.last_recording = next_file
+    output.settings["path"] = next_file
+    output.signal_handler.emit("file_changed", Calldata(output=output, next_file=next_file))
+
+
+def unique_name(prefix: str) -> str:
+    return f"{prefix}{next(_counter)}"
@@ -0,0 +1,99 @@
+"""Shared setup for the offline tools: loads RecORDER.py against fake_obspython and helps drive it."""
+
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCHMARKS_DIR)
+sys.path.insert(0, os.path.dirname(BENCHMARKS_DIR))
+
+import fake_obspython as obs  # noqa: E402
+
+obs.install()
+
+import RecORDER  # noqa: E402
+
+WRITE_BLOCK = os.urandom(8 * 1024 * 1024)
+SCRIPT_FILE_PATH = RecORDER.get_script_file_path
+
+temporaryDataDir = None
+
+
+def load_script(settings_overrides: dict | None = None, data_dir: str | None = None):
+    """Runs the script lifecycle like OBS does on load and returns the settings object.
+
+    Files the script keeps next to itself (journal, media index, stats...) go to data_dir instead, or to a
+    temporary folder removed by unload_script(), so the ones of a real installation are never touched.
+    """
+    global temporaryDataDir
+    if data_dir is None:
+        data_dir = temporaryDataDir = tempfile.mkdtemp(prefix="RecORDER-data-")
+    os.makedirs(data_dir, exist_ok=True)
+    RecORDER.get_script_file_path = lambda file_name: os.path.join(data_dir, file_name)
+
+    obs.reset()
+    settings = obs.obs_data_create()
+    settings.update(settings_overrides or {})
+    RecORDER.script_defaults(settings)
+    RecORDER.script_load(settings)
+    RecORDER.script_update(settings)
+    return settings
+
+
+def unload_script() -> None:
+    global temporaryDataDir
+    wait_for_moves()
+    RecORDER.script_unload()
+    RecORDER.get_script_file_path = SCRIPT_FILE_PATH
+    if temporaryDataDir is not None:
+        shutil.rmtree(temporaryDataDir, ignore_errors=True)
+        temporaryDataDir = None
+
+
+def silence_log() -> None:
+    """Discards RecORDER log lines, they are still formatted and written like in OBS."""
+    sys.stdout = open(os.devnull, "w")
+
+
+def write_file(path: str, size: int) -> str:
+    with open(path, "wb") as f:
+        remaining = size
+        while remaining > 0:
+            block = WRITE_BLOCK[:min(len(WRITE_BLOCK), remaining)]
+            f.write(block)
+            remaining -= len(block)
+    return path
+
+
+def wait_for_moves(timeout: float = 600.0, flush_bursts: bool = True) -> None:
+    """Waits until the worker is idle, submitting open save bursts right away unless flush_bursts is False."""
+    deadline = time.monotonic() + timeout
+    if flush_bursts:
+        RecORDER.burstCoalescer.flush_all()
+    while (RecORDER.moveWorker.queue_depth or RecORDER.burstCoalescer.pending) and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+def summarize(samples_ns: list) -> dict:
+    if not samples_ns:
+        return {"count": 0}
+    samples_us = sorted(sample / 1000 for sample in samples_ns)
+    return {
+        "count": len(samples_us),
+        "mean_us": statistics.fmean(samples_us),
+        "p50_us": samples_us[len(samples_us) // 2],
+        "p95_us": samples_us[max(int(len(samples_us) * 0.95) - 1, 0)],
+        "max_us": samples_us[-1],
+    }
+
+
+def print_table(title: str, rows: dict) -> None:
+    print(f"\n{title}", file=sys.__stdout__)
+    for name, values in rows.items():
+        formatted = ", ".join(f"{key}={value:.1f}" if isinstance(value, float) else f"{key}={value}"
+                              for key, value in values.items())
+        print(f"  {name:<22} {formatted}", file=sys.__stdout__)
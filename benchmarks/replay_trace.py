@@ -0,0 +1,259 @@
+"""Replays RecORDER event traces against the organizer, using benchmarks/fake_obspython.py as OBS.
+
+Traces are recorded by enabling "Record event trace" in the script settings, or generated here
+for pathological sessions:
+
+    python benchmarks/replay_trace.py RecORDER_trace_20250101-120000.jsonl --speed 10
+    python benchmarks/replay_trace.py --generate hourly-splits --hours 12 --speed 0
+    python benchmarks/replay_trace.py --generate replay-spam --saves 1000 --save-trace spam.jsonl
+
+Every file a traced event refers to is created in a temporary folder, so replays don't need the
+original recordings. Reports queueing delay (event until the file reached its folder), the peak
+move queue depth and whether each file ended up in the folder of the title hooked at that moment.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+
+from harness import RecORDER, load_script, obs, print_table, silence_log, summarize, unload_script, wait_for_moves, write_file
+
+SUBFOLDERS = {"recording": None, "replay": "Replays", "screenshot": "Screenshots"}
+TRACE_FILE_SIZE = 64 * 1024
+
+
+# GENERATORS
+
+def generate_hourly_splits(hours: int, title: str = "Long Session Game") -> list:
+    records = [{"t": 0, "k": "start", "v": "generated"},
+               {"t": 0, "k": "h", "s": "Game Capture", "n": title},
+               {"t": 0.1, "k": "e", "c": obs.OBS_FRONTEND_EVENT_RECORDING_STARTED, "p": "/rec/part-0.mkv"}]
+    for hour in range(1, hours):
+        records.append({"t": hour * 3600, "k": "f", "p": f"/rec/part-{hour}.mkv"})
+    records.append({"t": hours * 3600, "k": "e", "c": obs.OBS_FRONTEND_EVENT_RECORDING_STOPPED,
+                    "p": f"/rec/part-{hours - 1}.mkv"})
+    return records
+
+
+def generate_replay_spam(saves: int, interval: float = 0.05, title: str = "Spam Game") -> list:
+    records = [{"t": 0, "k": "start", "v": "generated"},
+               {"t": 0, "k": "h", "s": "Game Capture", "n": title},
+               {"t": 0.1, "k": "e", "c": obs.OBS_FRONTEND_EVENT_REPLAY_BUFFER_STARTED, "p": None}]
+    t = 0.2
+    for save in range(saves):
+        if save == saves // 2:
+            # Scene collection switch in the middle of the burst
+            records.append({"t": t, "k": "e", "c": obs.OBS_FRONTEND_EVENT_SCENE_COLLECTION_CHANGING, "p": None})
+            records.append({"t": t + 0.01, "k": "e", "c": obs.OBS_FRONTEND_EVENT_REPLAY_BUFFER_STOPPED, "p": None})
+            records.append({"t": t + 0.5, "k": "e", "c": obs.OBS_FRONTEND_EVENT_SCENE_COLLECTION_CHANGED, "p": None})
+            records.append({"t": t + 0.6, "k": "h", "s": "Game Capture", "n": title})
+            records.append({"t": t + 0.7, "k": "e", "c": obs.OBS_FRONTEND_EVENT_REPLAY_BUFFER_STARTED, "p": None})
+            t += 0.8
+        records.append({"t": t, "k": "e", "c": obs.OBS_FRONTEND_EVENT_REPLAY_BUFFER_SAVED, "p": f"/rep/replay-{save}.mkv"})
+        t += interval
+    records.append({"t": t, "k": "e", "c": obs.OBS_FRONTEND_EVENT_REPLAY_BUFFER_STOPPED, "p": None})
+    return records
+
+
+GENERATORS = {
+    "hourly-splits": lambda args: generate_hourly_splits(args.hours),
+    "replay-spam": lambda args: generate_replay_spam(args.saves),
+}
+
+
+# REPLAY
+
+class PlacementMonitor:
+    """Watches the expected target paths and notes when each file arrived"""
+
+    def __init__(self) -> None:
+        self.expected = []
+        self.peak_queue_depth = 0
+        self._arrived = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def expect(self, path: str, target: str) -> None:
+        with self._lock:
+            self.expected.append((path, target, time.perf_counter_ns()))
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._check()
+
+    def delays(self) -> list:
+        return [self._arrived[target] - emitted_at for _, target, emitted_at in self.expected if target in self._arrived]
+
+    def _run(self) -> None:
+        while not self._stop.wait(0.01):
+            if RecORDER.moveWorker is not None:
+                self.peak_queue_depth = max(self.peak_queue_depth, RecORDER.moveWorker.queue_depth)
+            self._check()
+
+    def _check(self) -> None:
+        with self._lock:
+            waiting = [target for _, target, _ in self.expected if target not in self._arrived]
+        for target in waiting:
+            if os.path.exists(target):
+                self._arrived[target] = time.perf_counter_ns()
+
+
+class TraceReplayer:
+    """Feeds trace records to the script through the fake OBS, creating the files they refer to"""
+
+    def __init__(self, workdir: str, default_title: str) -> None:
+        self.workdir = workdir
+        self.default_title = default_title
+        self.monitor = PlacementMonitor()
+        self.events = 0
+        self._sources = {}
+        self._hooked_title = None
+        self._current_recording = None
+
+    def replay(self, records: list, speed: float) -> None:
+        self.monitor.start()
+        started = time.monotonic()
+        for record in records:
+            if speed > 0:
+                delay = started + record["t"] / speed - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            self._apply(record)
+        wait_for_moves(flush_bursts=False)  # Bursts end on their own, as in OBS
+        self.monitor.stop()
+
+    def _apply(self, record: dict) -> None:
+        kind = record["k"]
+        if kind == "h":
+            self._hooked_title = record["n"]
+            obs.hook(self._get_source(record["s"]), record["n"])
+        elif kind == "u":
+            self._hooked_title = None
+            obs.unhook(self._get_source(record["s"]))
+        elif kind == "f":
+            if self._current_recording:
+                self._expect(self._current_recording, "recording")
+            self._current_recording = self._create(record["p"])
+            obs.split_recording(self._current_recording)
+        elif kind == "e":
+            self._apply_event(record["c"], record.get("p"))
+        else:
+            return
+        self.events += 1
+
+    def _apply_event(self, event: int, path: str | None) -> None:
+        if event == obs.OBS_FRONTEND_EVENT_RECORDING_STARTED:
+            self._current_recording = self._create(path)
+            obs.state.last_recording = self._current_recording
+            obs.state.recording_active = True
+        elif event == obs.OBS_FRONTEND_EVENT_RECORDING_STOPPED:
+            obs.state.recording_active = False
+            obs.state.last_recording = self._current_recording or self._create(path)
+            self._expect(obs.state.last_recording, "recording")
+            self._current_recording = None
+        elif event == obs.OBS_FRONTEND_EVENT_REPLAY_BUFFER_STARTED:
+            obs.state.replay_buffer_active = True
+        elif event == obs.OBS_FRONTEND_EVENT_REPLAY_BUFFER_STOPPED:
+            obs.state.replay_buffer_active = False
+        elif event == obs.OBS_FRONTEND_EVENT_REPLAY_BUFFER_SAVED:
+            obs.state.last_replay = self._create(path)
+            self._expect(obs.state.last_replay, "replay")
+        elif event == obs.OBS_FRONTEND_EVENT_SCREENSHOT_TAKEN:
+            obs.state.last_screenshot = self._create(path)
+            self._expect(obs.state.last_screenshot, "screenshot")
+        obs.emit_frontend_event(event)
+
+    def _get_source(self, name: str):
+        if name not in self._sources:
+            self._sources[name] = obs.create_source(name or "Game Capture", "game_capture")
+        return self._sources[name]
+
+    def _create(self, original_path: str | None) -> str:
+        name = os.path.basename(original_path) if original_path else obs.unique_name("file") + ".mkv"
+        return write_file(os.path.join(self.workdir, name), TRACE_FILE_SIZE)
+
+    def _expect(self, path: str, media_type: str) -> None:
+        title = RecORDER.remove_unusable_title_characters(self._hooked_title or "") or self.default_title
+        parts = [self.workdir, title] + ([SUBFOLDERS[media_type]] if SUBFOLDERS[media_type] else [])
+        self.monitor.expect(path, os.path.join(*parts, os.path.basename(path)))
+
+
+def check_placement(replayer: TraceReplayer) -> dict:
+    placed = misplaced = missing = 0
+    found = {}
+    for root, _, files in os.walk(replayer.workdir):
+        for name in files:
+            found.setdefault(name, os.path.join(root, name))
+
+    for path, target, _ in replayer.monitor.expected:
+        if os.path.exists(target):
+            placed += 1
+        elif os.path.basename(path) in found:
+            misplaced += 1
+        else:
+            missing += 1
+    return {"expected": len(replayer.monitor.expected), "placed": placed, "misplaced": misplaced, "missing": missing}
+
+
+def load_trace(path: str) -> list:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("trace", nargs="?", help="trace file recorded by RecORDER")
+    parser.add_argument("--generate", choices=sorted(GENERATORS), help="replay a generated trace instead")
+    parser.add_argument("--hours", type=int, default=12, help="hours of hourly splits to generate")
+    parser.add_argument("--saves", type=int, default=500, help="replay buffer saves to generate")
+    parser.add_argument("--speed", type=float, default=1.0, help="time acceleration, 0 replays without waiting")
+    parser.add_argument("--save-trace", help="write the replayed trace to this file")
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--show-log", action="store_true", help="print RecORDER log lines instead of discarding them")
+    args = parser.parse_args()
+
+    if bool(args.trace) == bool(args.generate):
+        parser.error("pass either a trace file or --generate")
+
+    records = load_trace(args.trace) if args.trace else GENERATORS[args.generate](args)
+    if args.save_trace:
+        with open(args.save_trace, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+
+    if not args.show_log:
+        silence_log()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        settings = load_script(data_dir=os.path.join(workdir, "script"))
+        replayer = TraceReplayer(workdir, obs.obs_data_get_string(settings, "default_folder_name_text"))
+        started = time.perf_counter()
+        try:
+            replayer.replay(records, args.speed)
+        finally:
+            unload_script()
+
+        results = {
+            "replay": {"records": len(records), "events": replayer.events, "seconds": time.perf_counter() - started,
+                       "peak_queue_depth": replayer.monitor.peak_queue_depth,
+                       "callback_errors": obs.state.callback_errors,
+                       "rejected_callbacks": obs.state.rejected_callbacks},
+            "queueing_delay": summarize(replayer.monitor.delays()),
+            "placement": check_placement(replayer),
+        }
+
+    print_table("Trace replay", {name: values for name, values in results.items()})
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()